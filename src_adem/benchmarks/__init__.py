@@ -0,0 +1,8 @@
+"""
+Benchmarks des solveurs de couverture de sommets sur des graphes synthétiques
+"""
+
+from .generators import KINDS, make_instance
+from .runner import ENGINES, register_engine, run_case, run_suite, compare
+
+__all__ = ['KINDS', 'make_instance', 'ENGINES', 'register_engine', 'run_case', 'run_suite', 'compare']
@@ -0,0 +1,75 @@
+"""
+Lancement des benchmarks depuis le dossier src_adem :
+
+    python -m benchmarks --sizes 100 1000 10000 -o bench.json
+    python -m benchmarks --sizes 100 1000 -o bench.json --baseline reference.json
+"""
+import argparse
+import sys
+
+from .generators import KINDS
+from .runner import ENGINES, compare, load_results, run_suite, save_results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description="Mesure les solveurs de couverture de sommets sur des graphes synthétiques."
+    )
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS),
+                        help="Familles de graphes (défaut : toutes)")
+    parser.add_argument('--sizes', nargs='+', type=lambda s: int(float(s)),
+                        default=[100, 1000, 10000, 100000],
+                        help="Nombres d'arêtes visés, de 1e2 à 1e7 (défaut : 1e2 à 1e5)")
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES), default=sorted(ENGINES),
+                        help="Moteurs à mesurer (défaut : tous)")
+    parser.add_argument('--seed', type=int, default=0, help="Graine des générateurs")
+    parser.add_argument('--critical-fraction', type=float, default=0.0,
+                        help="Proportion d'arêtes critiques")
+    parser.add_argument('--time-limit', type=float, default=60,
+                        help="Limite de temps des solveurs en secondes")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="Délai maximal par exécution (défaut : 2 x limite + 60 s)")
+    parser.add_argument('-o', '--output', default='benchmark_results.json',
+                        help="Fichier de résultats JSON")
+    parser.add_argument('--baseline', default=None,
+                        help="Résultats de référence : code de sortie 1 en cas de régression")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Dégradation relative tolérée par rapport à la référence")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    def report(run):
+        timing = ' '.join(
+            f"{field.split('_')[0]}={run[field]:.3f}s"
+            for field in ('generate_time', 'convert_time', 'build_time', 'solve_time', 'extract_time')
+            if field in run
+        )
+        memory = f" pic={run['peak_rss_mb']:.0f}Mo" if run.get('peak_rss_mb') else ''
+        print(f"{run['kind']:<16} {run['target_edges']:>9} {run['engine']:<8} "
+              f"{run['status']:<12} {timing}{memory}", flush=True)
+
+    runs = run_suite(args.kinds, args.sizes, args.engines, args.seed, args.time_limit,
+                     args.timeout, args.critical_fraction, on_result=report)
+
+    settings = {key: value for key, value in vars(args).items()
+                if key not in ('output', 'baseline', 'tolerance')}
+    save_results(runs, args.output, settings)
+    print(f"Résultats écrits dans {args.output}")
+
+    if args.baseline:
+        regressions = compare(runs, load_results(args.baseline), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} régression(s) par rapport à {args.baseline} :")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"Aucune régression par rapport à {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Générateurs de graphes synthétiques pour les benchmarks.
+
+Tous les générateurs sont déterministes pour une graine donnée et
+travaillent directement sur des tableaux NumPy : ils retournent un
+models.graph.Graph (coordonnées dans le carré unité mises à l'échelle de
+l'éditeur), sans passer par le format dict de l'application.
+"""
+import numpy as np
+
+from models.graph import Graph, TYPE_NORMAL
+
+# Étendue des coordonnées générées (unités de la scène de l'éditeur)
+SCENE_SIZE = 1000.0
+
+
+def grid(rows, cols, seed=0, critical_fraction=0.0):
+    """Grille rows x cols, chaque sommet relié à ses voisins droite et bas"""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+
+    step = 1.0 / max(rows, cols)
+    y, x = np.divmod(np.arange(rows * cols), cols)
+    return _finish(rng, rows * cols, src, dst, x * step, y * step, critical_fraction)
+
+
+def random_geometric(n, radius, seed=0, critical_fraction=0.0):
+    """
+    Graphe géométrique aléatoire : n points uniformes dans le carré unité,
+    reliés lorsque leur distance est inférieure à radius.
+
+    Les paires sont cherchées par hachage sur une grille de cellules de côté
+    radius : seules les cellules voisines sont comparées.
+    """
+    rng = np.random.default_rng(seed)
+    x = rng.random(n)
+    y = rng.random(n)
+
+    cells = max(1, int(1.0 / radius))
+    cx = np.minimum((x * cells).astype(np.int64), cells - 1)
+    cy = np.minimum((y * cells).astype(np.int64), cells - 1)
+    cell = cx * cells + cy
+
+    order = np.argsort(cell, kind='stable')
+    sorted_cell = cell[order]
+    start = np.searchsorted(sorted_cell, np.arange(cells * cells + 1))
+
+    src_parts, dst_parts = [], []
+    r2 = radius * radius
+    # Demi-voisinage : chaque paire de cellules n'est visitée qu'une fois
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        nx = cx[order] + dx
+        ny = cy[order] + dy
+        ok = (nx >= 0) & (nx < cells) & (ny >= 0) & (ny < cells)
+        a = np.flatnonzero(ok)
+        neighbour = nx[a] * cells + ny[a]
+        counts = start[neighbour + 1] - start[neighbour]
+
+        # Expansion : chaque point a contre tous les points de la cellule voisine
+        i = np.repeat(a, counts)
+        offsets = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+        j = np.repeat(start[neighbour], counts) + offsets
+
+        if dx == 0 and dy == 0:
+            keep = j > i
+            i, j = i[keep], j[keep]
+
+        u, v = order[i], order[j]
+        close = (x[u] - x[v]) ** 2 + (y[u] - y[v]) ** 2 <= r2
+        src_parts.append(u[close])
+        dst_parts.append(v[close])
+
+    src = np.concatenate(src_parts)
+    dst = np.concatenate(dst_parts)
+    return _finish(rng, n, src, dst, x, y, critical_fraction)
+
+
+def erdos_renyi(n, m, seed=0, critical_fraction=0.0):
+    """Graphe aléatoire G(n, m) : m arêtes distinctes tirées uniformément"""
+    rng = np.random.default_rng(seed)
+    m = min(m, n * (n - 1) // 2)
+    src, dst = _sample_pairs(rng, m, lambda k: (rng.integers(0, n, k), rng.integers(0, n, k)))
+    x, y = rng.random(n), rng.random(n)
+    return _finish(rng, n, src, dst, x, y, critical_fraction)
+
+
+def barabasi_albert(n, k, seed=0, critical_fraction=0.0):
+    """
+    Graphe à attachement préférentiel (loi de puissance) : chaque nouveau
+    sommet se relie à k sommets existants choisis proportionnellement à
+    leur degré.
+
+    Variante vectorisée de l'algorithme de Batagelj-Brandes : la liste des
+    extrémités M est construite d'un bloc, chaque extrémité cible pointant
+    vers une position antérieure de M, puis les pointeurs sont résolus par
+    sauts successifs. Les arêtes multiples et boucles sont retirées.
+    """
+    rng = np.random.default_rng(seed)
+    num_edges = (n - k) * k
+    if num_edges <= 0:
+        return _finish(rng, n, np.empty(0, np.int64), np.empty(0, np.int64),
+                       rng.random(n), rng.random(n), critical_fraction)
+
+    # Extrémité source de l'arête e : le nouveau sommet (position paire 2e)
+    e = np.arange(num_edges, dtype=np.int64)
+    src = k + e // k
+
+    # Extrémité cible (position impaire 2e+1) : copie d'une position r < 2e.
+    # Les k premières arêtes relient le premier nouveau sommet aux sommets 0..k-1
+    pointer = (rng.random(num_edges) * (2 * e)).astype(np.int64)
+    dst = np.full(num_edges, -1, dtype=np.int64)
+    dst[:k] = np.arange(k)
+
+    pending = e[k:]
+    while len(pending):
+        target = pointer[pending]
+        even = target % 2 == 0
+        dst[pending[even]] = src[target[even] // 2]
+
+        # Cible impaire : copie de la cible d'une arête antérieure
+        odd = pending[~even]
+        earlier = target[~even] // 2
+        known = dst[earlier] >= 0
+        dst[odd[known]] = dst[earlier[known]]
+        pointer[odd[~known]] = pointer[earlier[~known]]
+        pending = odd[~known]
+
+    src, dst = _dedupe(src, dst)
+    return _finish(rng, n, src, dst, rng.random(n), rng.random(n), critical_fraction)
+
+
+def bipartite(n_left, n_right, m, seed=0, critical_fraction=0.0):
+    """Graphe biparti aléatoire : m arêtes distinctes entre deux ensembles"""
+    rng = np.random.default_rng(seed)
+    m = min(m, n_left * n_right)
+    src, dst = _sample_pairs(
+        rng, m, lambda k: (rng.integers(0, n_left, k), n_left + rng.integers(0, n_right, k))
+    )
+    n = n_left + n_right
+    x = np.concatenate([np.full(n_left, 0.25), np.full(n_right, 0.75)])
+    y = np.concatenate([np.linspace(0, 1, n_left), np.linspace(0, 1, n_right)])
+    return _finish(rng, n, src, dst, x, y, critical_fraction)
+
+
+# ----------------------------------------------------------------------
+# Instances à taille cible
+# ----------------------------------------------------------------------
+KINDS = ('grid', 'geometric', 'erdos_renyi', 'barabasi_albert', 'bipartite')
+
+# Degré moyen visé pour les familles aléatoires
+MEAN_DEGREE = 8
+
+
+def make_instance(kind, num_edges, seed=0, critical_fraction=0.0):
+    """
+    Génère une instance de la famille `kind` avec environ `num_edges` arêtes
+    (de 10^2 à 10^7).
+    """
+    n = max(4, 2 * num_edges // MEAN_DEGREE)
+
+    if kind == 'grid':
+        side = max(2, int(round(np.sqrt(num_edges / 2))))
+        return grid(side, side, seed, critical_fraction)
+    if kind == 'geometric':
+        radius = np.sqrt(MEAN_DEGREE / (np.pi * n))
+        return random_geometric(n, radius, seed, critical_fraction)
+    if kind == 'erdos_renyi':
+        return erdos_renyi(n, num_edges, seed, critical_fraction)
+    if kind == 'barabasi_albert':
+        k = MEAN_DEGREE // 2
+        return barabasi_albert(num_edges // k + k, k, seed, critical_fraction)
+    if kind == 'bipartite':
+        return bipartite(n // 2, n - n // 2, num_edges, seed, critical_fraction)
+
+    raise ValueError(f"Famille de graphes inconnue : {kind}")
+
+
+# ----------------------------------------------------------------------
+# Outils internes
+# ----------------------------------------------------------------------
+def _sample_pairs(rng, m, draw):
+    """Tire m paires distinctes (sans boucle) par tirages successifs"""
+    src = np.empty(0, dtype=np.int64)
+    dst = np.empty(0, dtype=np.int64)
+    while len(src) < m:
+        missing = m - len(src)
+        u, v = draw(int(missing * 1.1) + 16)
+        src, dst = _dedupe(np.concatenate([src, u]), np.concatenate([dst, v]))
+    keep = np.sort(rng.permutation(len(src))[:m])
+    return src[keep], dst[keep]
+
+
+def _dedupe(src, dst):
+    """Retire les boucles et les arêtes en double (non orientées), ordre conservé"""
+    lo = np.minimum(src, dst)
+    hi = np.maximum(src, dst)
+    keep = lo != hi
+    lo, hi = lo[keep], hi[keep]
+    key = lo * (int(hi.max(initial=0)) + 1) + hi
+    _, first = np.unique(key, return_index=True)
+    first.sort()
+    return lo[first], hi[first]
+
+
+def _finish(rng, n, src, dst, x, y, critical_fraction):
+    """Assemble le Graph : coûts aléatoires, sommets normaux, arêtes critiques tirées"""
+    costs = np.round(rng.uniform(1.0, 100.0, n), 1)
+    types = np.full(n, TYPE_NORMAL, dtype=np.int8)
+    critical = rng.random(len(src)) < critical_fraction
+    vertex_ids = [f"v{i}" for i in range(n)]
+    return Graph(vertex_ids, costs, types, src, dst, critical,
+                 np.asarray(x, dtype=np.float64) * SCENE_SIZE,
+                 np.asarray(y, dtype=np.float64) * SCENE_SIZE)
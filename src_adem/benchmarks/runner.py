@@ -0,0 +1,327 @@
+"""
+Exécution des benchmarks : chaque couple (instance, moteur) est mesuré dans
+un processus séparé, ce qui isole le pic mémoire et permet d'interrompre un
+moteur trop lent.
+"""
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from models.data_models import SolutionResult
+
+from .generators import make_instance
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# ----------------------------------------------------------------------
+# Moteurs
+# ----------------------------------------------------------------------
+ENGINES = {}
+
+
+def register_engine(name, factory, available=None):
+    """
+    Enregistre un moteur de résolution.
+
+    Parameters:
+    -----------
+    name : str
+        Nom du moteur dans les résultats
+    factory : callable
+        factory(time_limit) -> objet ayant une méthode solve(vertices, edges, parameters)
+    available : callable ou None
+        Retourne False si le moteur ne peut pas être utilisé (dépendance absente)
+    """
+    ENGINES[name] = {'factory': factory, 'available': available or (lambda: True)}
+
+
+def _gurobi(time_limit):
+    from solver.vertex_cover_solver import VertexCoverSolver
+    return VertexCoverSolver(time_limit=time_limit)
+
+
+def _greedy(time_limit):
+    from solver.greedy_solver import GreedyVertexCoverSolver
+    return GreedyVertexCoverSolver()
+
+
+register_engine('gurobi', _gurobi, lambda: importlib.util.find_spec('gurobipy') is not None)
+register_engine('greedy', _greedy)
+
+
+# ----------------------------------------------------------------------
+# Mesure d'une exécution
+# ----------------------------------------------------------------------
+def run_case(kind, num_edges, engine, seed=0, time_limit=60, critical_fraction=0.0):
+    """
+    Mesure un moteur sur une instance, dans le processus courant.
+
+    Phases chronométrées :
+    - generate : génération de l'instance (tableaux NumPy)
+    - convert : conversion vers le format d'entrée des solveurs
+    - build : construction du modèle, mesurée par le moteur (Gurobi)
+    - solve : reste de l'appel du solveur (optimisation, lecture de la solution)
+    - extract : conversion de la solution en bitset et contrôle de la couverture
+
+    Returns:
+    --------
+    dict : Résultat de l'exécution
+    """
+    result = {
+        'kind': kind,
+        'target_edges': num_edges,
+        'engine': engine,
+        'seed': seed,
+        'status': 'error'
+    }
+
+    start = time.perf_counter()
+    graph = make_instance(kind, num_edges, seed, critical_fraction)
+    result['num_vertices'] = graph.num_vertices
+    result['num_edges'] = graph.num_edges
+    result['generate_time'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph_data = graph.to_graph_data()
+    solver = ENGINES[engine]['factory'](time_limit)
+    result['convert_time'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    solution = solver.solve(graph_data['vertices'], graph_data['edges'], {})
+    elapsed = time.perf_counter() - start
+    if 'build_time' in solution:
+        result['build_time'] = solution['build_time']
+        elapsed -= solution['build_time']
+    result['solve_time'] = elapsed
+    result['status'] = solution.get('status', 'error')
+    result['message'] = solution.get('message', '')
+
+    if 'selected_vertices' in solution:
+        start = time.perf_counter()
+        compact = SolutionResult.from_solution(solution, graph)
+        uncovered = compact.uncovered_edges(graph)
+        cost = compact.recompute_cost(graph)
+        result['extract_time'] = time.perf_counter() - start
+
+        result['total_cost'] = cost
+        result['num_selected'] = compact.num_selected
+        result['uncovered_edges'] = int(len(uncovered))
+        result['feasible'] = len(uncovered) == 0
+        if solution.get('gap') is not None:
+            result['gap'] = solution['gap']
+
+    result['peak_rss_mb'] = peak_rss_mb()
+    return result
+
+
+def peak_rss_mb():
+    """Pic de mémoire résidente du processus courant en Mo (None si indisponible)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux : kilo-octets ; macOS : octets
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _run_child(conn, args):
+    try:
+        conn.send(run_case(*args))
+    except MemoryError:
+        conn.send({'status': 'out_of_memory'})
+    except Exception as e:
+        conn.send({'status': 'error', 'message': str(e)})
+    finally:
+        conn.close()
+
+
+def run_isolated(kind, num_edges, engine, seed=0, time_limit=60, timeout=None,
+                 critical_fraction=0.0):
+    """
+    Exécute run_case dans un processus dédié.
+
+    Le processus est arrêté après `timeout` secondes (par défaut la limite de
+    temps du solveur plus une marge pour la génération et l'extraction).
+    """
+    if timeout is None:
+        timeout = 2 * time_limit + 60
+
+    base = {'kind': kind, 'target_edges': num_edges, 'engine': engine, 'seed': seed}
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_run_child,
+        args=(sender, (kind, num_edges, engine, seed, time_limit, critical_fraction))
+    )
+
+    start = time.perf_counter()
+    process.start()
+    sender.close()
+
+    result = None
+    if receiver.poll(timeout):
+        try:
+            result = receiver.recv()
+        except EOFError:
+            result = None
+    process.join(5)
+
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        result = {'status': 'timeout', 'message': f"Arrêté après {timeout:.0f} s"}
+    elif result is None:
+        result = {'status': 'crashed', 'message': f"Code de sortie {process.exitcode}"}
+
+    merged = dict(base)
+    merged.update(result)
+    merged['wall_time'] = time.perf_counter() - start
+    return merged
+
+
+# ----------------------------------------------------------------------
+# Suite complète
+# ----------------------------------------------------------------------
+def run_suite(kinds, sizes, engines, seed=0, time_limit=60, timeout=None,
+              critical_fraction=0.0, on_result=None):
+    """
+    Exécute tous les couples (famille, taille, moteur).
+
+    Un moteur qui dépasse le délai sur une famille n'est plus essayé sur les
+    tailles supérieures de cette famille.
+
+    Returns:
+    --------
+    list[dict] : Résultats, avec la qualité relative au meilleur coût réalisable
+    """
+    runs = []
+    for kind in kinds:
+        stopped = set()
+        for size in sorted(sizes):
+            for engine in engines:
+                if not ENGINES[engine]['available']():
+                    result = {'kind': kind, 'target_edges': size, 'engine': engine,
+                              'seed': seed, 'status': 'unavailable'}
+                elif engine in stopped:
+                    result = {'kind': kind, 'target_edges': size, 'engine': engine,
+                              'seed': seed, 'status': 'skipped',
+                              'message': "Délai dépassé sur une taille inférieure"}
+                else:
+                    result = run_isolated(kind, size, engine, seed, time_limit, timeout,
+                                          critical_fraction)
+                    if result['status'] in ('timeout', 'out_of_memory', 'crashed'):
+                        stopped.add(engine)
+                runs.append(result)
+                if on_result:
+                    on_result(result)
+
+    _add_quality(runs)
+    return runs
+
+
+def _add_quality(runs):
+    """Ajoute cost_ratio : coût / meilleur coût réalisable sur la même instance"""
+    best = {}
+    for run in runs:
+        if run.get('feasible'):
+            key = (run['kind'], run['target_edges'], run['seed'])
+            best[key] = min(best.get(key, float('inf')), run['total_cost'])
+
+    for run in runs:
+        key = (run['kind'], run['target_edges'], run['seed'])
+        if run.get('feasible') and best.get(key):
+            run['cost_ratio'] = run['total_cost'] / best[key]
+
+
+def environment():
+    """Description de la machine et des versions, jointe aux résultats"""
+    return {
+        'date': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def save_results(runs, filename, settings=None):
+    """Écrit les résultats au format JSON"""
+    data = {
+        'metadata': {
+            'app_name': 'Surveillance Network Optimizer',
+            'benchmark_version': '1.0',
+            'environment': environment(),
+            'settings': settings or {}
+        },
+        'runs': runs
+    }
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_results(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)['runs']
+
+
+# Mesures comparées à la référence
+TIMED_FIELDS = ('convert_time', 'build_time', 'solve_time', 'extract_time')
+
+
+def compare(runs, baseline, tolerance=0.25, min_time=0.05):
+    """
+    Compare des résultats à une référence.
+
+    Signale une régression quand une phase est plus lente de plus de
+    `tolerance` (fraction) et d'au moins `min_time` secondes, quand le pic
+    mémoire augmente de plus de `tolerance`, quand le coût se dégrade, ou
+    quand une exécution réussie de la référence échoue.
+
+    Returns:
+    --------
+    list[str] : Descriptions des régressions
+    """
+    reference = {
+        (r['kind'], r['target_edges'], r['engine'], r['seed']): r for r in baseline
+    }
+    regressions = []
+
+    for run in runs:
+        key = (run['kind'], run['target_edges'], run['engine'], run['seed'])
+        ref = reference.get(key)
+        if ref is None:
+            continue
+        label = f"{run['engine']} / {run['kind']} / {run['target_edges']} arêtes"
+
+        if ref.get('feasible') and not run.get('feasible'):
+            regressions.append(f"{label} : {run['status']} (référence : {ref['status']})")
+            continue
+
+        for field in TIMED_FIELDS:
+            old, new = ref.get(field), run.get(field)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) and new - old >= min_time:
+                regressions.append(f"{label} : {field} {old:.3f} s -> {new:.3f} s")
+
+        old, new = ref.get('peak_rss_mb'), run.get('peak_rss_mb')
+        if old and new and new > old * (1 + tolerance):
+            regressions.append(f"{label} : mémoire {old:.0f} Mo -> {new:.0f} Mo")
+
+        old, new = ref.get('total_cost'), run.get('total_cost')
+        if old is not None and new is not None and new > old * (1 + 1e-9):
+            regressions.append(f"{label} : coût {old:.2f} -> {new:.2f}")
+
+    return regressions
@@ -6,6 +6,7 @@ from .main_window import MainWindow
 from .graph_widget import GraphWidget
 from .parameters_widget import ParametersWidget
 from .results_widget import ResultsWidget
+from .save_worker import SaveWorker
 from .styles import get_stylesheet
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
     'GraphWidget',
     'ParametersWidget',
     'ResultsWidget',
+    'SaveWorker',
     'get_stylesheet'
 ]
\ No newline at end of file
@@ -0,0 +1,259 @@
+from PyQt5.QtWidgets import QStyledItemDelegate, QComboBox
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant, pyqtSignal
+from PyQt5.QtGui import QColor, QFont
+import numpy as np
+
+from models.graph import VERTEX_TYPES, TYPE_CODES, TYPE_NORMAL, TYPE_MANDATORY, TYPE_FORBIDDEN
+
+# Libellés des types dans la table
+TYPE_LABELS = ("Normal", "Obligatoire", "Interdit")
+
+# Couleurs de fond et de texte par type (comme les anciennes listes déroulantes)
+TYPE_COLORS = {
+    TYPE_NORMAL: (QColor("white"), QColor("#111827")),
+    TYPE_MANDATORY: (QColor("#fee2e2"), QColor("#dc2626")),
+    TYPE_FORBIDDEN: (QColor("#f3f4f6"), QColor("#6b7280"))
+}
+
+COLUMN_ID, COLUMN_COST, COLUMN_TYPE = 0, 1, 2
+HEADERS = ("Sommet", "Coût (€)", "Type")
+
+
+class VertexCostModel(QAbstractTableModel):
+    """
+    Modèle de la table des coûts : identifiants, coûts et types des sommets
+    stockés dans des tableaux NumPy.
+
+    La vue ne demande que les lignes visibles ; les modifications d'une
+    cellule sont en O(1) et la lecture des paramètres est une copie des
+    tableaux.
+    """
+
+    # Modification d'une cellule par l'utilisateur : (id, coût, type)
+    vertex_edited = pyqtSignal(object, float, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._rows = {}  # id -> ligne
+        self._costs = np.empty(0, dtype=np.float64)
+        self._types = np.empty(0, dtype=np.int8)
+        self._count = 0
+
+        self._font = QFont("Segoe UI", 11)
+        self._bold_font = QFont("Segoe UI", 11, QFont.Bold)
+
+    # ------------------------------------------------------------------
+    # Interface QAbstractTableModel
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return QVariant()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        row, column = index.row(), index.column()
+
+        if role == Qt.DisplayRole:
+            if column == COLUMN_ID:
+                return self._ids[row]
+            if column == COLUMN_COST:
+                return f"{self._costs[row]:.2f}"
+            return TYPE_LABELS[self._types[row]]
+
+        if role == Qt.EditRole:
+            if column == COLUMN_COST:
+                return float(self._costs[row])
+            if column == COLUMN_TYPE:
+                return VERTEX_TYPES[self._types[row]]
+            return self._ids[row]
+
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        if role == Qt.FontRole:
+            return self._bold_font if column == COLUMN_ID else self._font
+
+        if column == COLUMN_TYPE and role in (Qt.BackgroundRole, Qt.ForegroundRole):
+            background, foreground = TYPE_COLORS[self._types[row]]
+            return background if role == Qt.BackgroundRole else foreground
+
+        return QVariant()
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() in (COLUMN_COST, COLUMN_TYPE):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+
+        row, column = index.row(), index.column()
+
+        if column == COLUMN_COST:
+            try:
+                cost = float(str(value).replace(',', '.'))
+            except ValueError:
+                return False
+            if not np.isfinite(cost) or cost < 0:
+                return False
+            self._costs[row] = cost
+
+        elif column == COLUMN_TYPE:
+            if value not in TYPE_CODES:
+                return False
+            self._types[row] = TYPE_CODES[value]
+
+        else:
+            return False
+
+        self.dataChanged.emit(index, index, [role])
+        self.vertex_edited.emit(self._ids[row], float(self._costs[row]), VERTEX_TYPES[self._types[row]])
+        return True
+
+    # ------------------------------------------------------------------
+    # Mises à jour depuis le graphe
+    # ------------------------------------------------------------------
+    def set_vertices(self, vertices):
+        """Remplace tout le contenu par une liste de sommets (format dict)"""
+        n = len(vertices)
+        self.set_arrays(
+            [v['id'] for v in vertices],
+            np.fromiter((v.get('cost', 1.0) for v in vertices), dtype=np.float64, count=n),
+            np.fromiter((TYPE_CODES.get(v.get('type', 'normal'), TYPE_NORMAL) for v in vertices),
+                        dtype=np.int8, count=n)
+        )
+
+    def set_arrays(self, ids, costs, types):
+        """Remplace tout le contenu par des tableaux (identifiants, coûts, codes de type)"""
+        self.beginResetModel()
+        self._ids = list(ids)
+        self._rows = {v_id: i for i, v_id in enumerate(self._ids)}
+        self._costs = np.array(costs, dtype=np.float64)
+        self._types = np.array(types, dtype=np.int8)
+        self._count = len(self._ids)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_vertices([])
+
+    def add_vertex(self, vertex_id, cost=1.0, vertex_type='normal'):
+        """Ajoute un sommet en fin de table (O(1) amorti)"""
+        row = self._count
+        if row == len(self._costs):
+            # Capacité doublée : les ajouts successifs restent en O(1) amorti
+            capacity = max(16, 2 * len(self._costs))
+            self._costs = np.resize(self._costs, capacity)
+            self._types = np.resize(self._types, capacity)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.append(vertex_id)
+        self._rows[vertex_id] = row
+        self._costs[row] = cost
+        self._types[row] = TYPE_CODES.get(vertex_type, TYPE_NORMAL)
+        self._count += 1
+        self.endInsertRows()
+
+    def remove_vertex(self, vertex_id):
+        """Retire un sommet (les lignes suivantes sont décalées)"""
+        row = self._rows.pop(vertex_id, None)
+        if row is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        n = self._count
+        self._costs[row:n - 1] = self._costs[row + 1:n]
+        self._types[row:n - 1] = self._types[row + 1:n]
+        del self._ids[row]
+        self._count -= 1
+        for i in range(row, self._count):
+            self._rows[self._ids[i]] = i
+        self.endRemoveRows()
+
+    def remove_vertices(self, vertex_ids):
+        """Retire plusieurs sommets en une seule mise à jour de la table"""
+        removed = set(vertex_ids)
+        n = self._count
+        keep = np.fromiter((v_id not in removed for v_id in self._ids), dtype=bool, count=n)
+        self.set_arrays([v_id for v_id, kept in zip(self._ids, keep.tolist()) if kept],
+                        self._costs[:n][keep], self._types[:n][keep])
+
+    def update_vertex(self, vertex_id, cost=None, vertex_type=None):
+        """Modifie le coût et/ou le type d'un sommet"""
+        row = self._rows.get(vertex_id)
+        if row is None:
+            return
+        if cost is not None:
+            self._costs[row] = cost
+        if vertex_type is not None:
+            self._types[row] = TYPE_CODES.get(vertex_type, TYPE_NORMAL)
+        self.dataChanged.emit(self.index(row, COLUMN_COST), self.index(row, COLUMN_TYPE))
+
+    def set_vertex_parameters(self, vertex_params):
+        """Applique les coûts et types d'un dict id -> {'cost', 'type'}"""
+        rows = self._rows
+        for vertex_id, values in vertex_params.items():
+            row = rows.get(vertex_id)
+            if row is None:
+                continue
+            if 'cost' in values:
+                self._costs[row] = values['cost']
+            if 'type' in values:
+                self._types[row] = TYPE_CODES.get(values['type'], TYPE_NORMAL)
+
+        if self._count:
+            self.dataChanged.emit(self.index(0, COLUMN_COST),
+                                  self.index(self._count - 1, COLUMN_TYPE))
+
+    # ------------------------------------------------------------------
+    # Lecture en bloc
+    # ------------------------------------------------------------------
+    def arrays(self):
+        """
+        Copie des données de la table.
+
+        Returns:
+        --------
+        tuple : (identifiants, coûts float64, codes de type int8)
+        """
+        n = self._count
+        return list(self._ids), self._costs[:n].copy(), self._types[:n].copy()
+
+    def vertex_parameters(self):
+        """Paramètres par sommet au format dict id -> {'cost', 'type'}"""
+        ids, costs, types = self.arrays()
+        names = [VERTEX_TYPES[t] for t in types.tolist()]
+        return {
+            vertex_id: {'cost': cost, 'type': vertex_type}
+            for vertex_id, cost, vertex_type in zip(ids, costs.tolist(), names)
+        }
+
+
+class VertexTypeDelegate(QStyledItemDelegate):
+    """Édition du type d'un sommet par liste déroulante (créée à la demande)"""
+
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.addItems(TYPE_LABELS)
+        editor.setFont(QFont("Segoe UI", 11))
+        # Valider dès qu'un type est choisi
+        editor.activated.connect(lambda _: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        vertex_type = index.data(Qt.EditRole)
+        editor.setCurrentIndex(TYPE_CODES.get(vertex_type, TYPE_NORMAL))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, VERTEX_TYPES[editor.currentIndex()], Qt.EditRole)
@@ -0,0 +1,456 @@
+from PyQt5.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+from PyQt5.QtCore import Qt, QRectF, QPointF, QLineF, QByteArray, QDataStream, QIODevice
+from PyQt5.QtGui import QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QPolygonF
+import numpy as np
+
+from models.graph import TYPE_NORMAL, TYPE_MANDATORY, TYPE_FORBIDDEN
+
+# Nombre visé de sommets par tuile
+TILE_TARGET = 2000
+
+# Niveau de zoom en dessous duquel les étiquettes ne sont pas dessinées
+LABEL_ZOOM_THRESHOLD = 0.6
+
+VERTEX_RADIUS = 20
+
+# En dessous de ces tailles à l'écran (pixels), dessin simplifié :
+# points pour les sommets, traits d'un pixel pour les arêtes
+POINT_DIAMETER_PIXELS = 6
+THIN_EDGE_PIXELS = 1.5
+
+# Au-delà de ce taux de recouvrement (surface dessinée / surface de la
+# tuile), les disques et les traits épais se confondent : dessin simplifié
+# quel que soit le zoom, ce qui borne aussi le coût d'un rendu
+MAX_COVERAGE = 1.0
+
+# Couleur d'un sommet selon son type
+TYPE_BRUSHES = {
+    TYPE_NORMAL: QBrush(QColor(70, 130, 180)),      # Bleu acier
+    TYPE_MANDATORY: QBrush(QColor(220, 20, 60)),    # Rouge
+    TYPE_FORBIDDEN: QBrush(QColor(128, 128, 128)),  # Gris
+}
+VERTEX_PEN = QPen(QColor(30, 60, 90), 2)
+# Sommets de la solution : anneau vert autour du disque (qui garde la
+# couleur de son type), ou point élargi en vue éloignée
+HIGHLIGHT_COLOR = QColor(50, 205, 50)
+HIGHLIGHT_RADIUS = VERTEX_RADIUS + 5
+HIGHLIGHT_POINT_PIXELS = 4
+# Sommets sélectionnés pour une modification groupée : même rendu, en or
+MARK_COLOR = QColor(255, 215, 0)
+EDGE_PEN = QPen(QColor(100, 100, 100), 3, Qt.SolidLine, Qt.RoundCap)
+CRITICAL_EDGE_PEN = QPen(QColor(220, 20, 60), 3, Qt.DashLine, Qt.RoundCap)
+THIN_EDGE_PEN = QPen(QColor(100, 100, 100), 0)  # Largeur 0 : un pixel quel que soit le zoom
+THIN_CRITICAL_EDGE_PEN = QPen(QColor(220, 20, 60), 0, Qt.DashLine)
+LABEL_FONT = QFont("Arial", 12, QFont.Bold)
+
+
+class EdgeTileItem(QGraphicsItem):
+    """
+    Toutes les arêtes d'une tuile, groupées en arêtes normales et critiques.
+
+    En vue éloignée ou très dense, chaque groupe est un seul chemin tracé au
+    crayon d'un pixel, sans anticrénelage ; les segments épais ne sont créés
+    qu'au premier dessin rapproché.
+    """
+
+    def __init__(self, x1, y1, x2, y2, critical):
+        super().__init__()
+        segments = np.column_stack((x1, y1, x2, y2))
+        self.groups = (segments[~critical], segments[critical])
+        self.thin_paths = tuple(_lines_path(group) for group in self.groups)
+        self._lines = None  # listes de QLineF, créées à la demande
+
+        margin = EDGE_PEN.widthF()
+        self._bounds = QRectF(
+            QPointF(min(x1.min(), x2.min()) - margin, min(y1.min(), y2.min()) - margin),
+            QPointF(max(x1.max(), x2.max()) + margin, max(y1.max(), y2.max()) + margin)
+        )
+        length = np.hypot(x2 - x1, y2 - y1).sum()
+        area = max(self._bounds.width() * self._bounds.height(), 1.0)
+        self.crowded = length * EDGE_PEN.widthF() > MAX_COVERAGE * area
+
+        self.setZValue(-1)  # Arêtes en arrière-plan
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def boundingRect(self):
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if self.crowded or lod * EDGE_PEN.widthF() < THIN_EDGE_PIXELS:
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setBrush(Qt.NoBrush)
+            for pen, group, path in zip((THIN_EDGE_PEN, THIN_CRITICAL_EDGE_PEN), self.groups, self.thin_paths):
+                if len(group):
+                    painter.setPen(pen)
+                    painter.drawPath(path)
+            return
+
+        # Un chemin à nombreux sous-chemins est très lent à épaissir :
+        # segments indépendants pour le crayon large
+        if self._lines is None:
+            self._lines = tuple([QLineF(*row) for row in group.tolist()] for group in self.groups)
+        for pen, lines in zip((EDGE_PEN, CRITICAL_EDGE_PEN), self._lines):
+            if lines:
+                painter.setPen(pen)
+                painter.drawLines(lines)
+
+
+class VertexTileItem(QGraphicsItem):
+    """
+    Tous les sommets d'une tuile. En vue éloignée ou très dense, un point
+    par sommet, groupé par couleur ; sinon les disques et (au-dessus d'un
+    seuil de zoom) les étiquettes des seuls sommets de la zone exposée.
+    """
+
+    def __init__(self, layer, indices):
+        super().__init__()
+        self.layer = layer
+        self.indices = indices
+        self.x = layer.graph.x[indices]
+        self.y = layer.graph.y[indices]
+        self._points = None  # type -> QPolygonF, regroupé au premier dessin
+
+        margin = VERTEX_RADIUS + VERTEX_PEN.widthF()
+        self._bounds = QRectF(QPointF(self.x.min() - margin, self.y.min() - margin),
+                              QPointF(self.x.max() + margin, self.y.max() + margin))
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)  # option.exposedRect
+
+    def boundingRect(self):
+        return self._bounds
+
+    def invalidate(self):
+        """Les types ont changé : regrouper à nouveau au prochain dessin"""
+        self._points = None
+        self.update()
+
+    def _group_points(self):
+        types = self.layer.graph.types[self.indices]
+        return {
+            vertex_type: _points(self.x[types == vertex_type], self.y[types == vertex_type])
+            for vertex_type in np.unique(types).tolist()
+        }
+
+    def paint(self, painter, option, widget=None):
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        diameter = 2 * VERTEX_RADIUS * lod
+
+        rect = option.exposedRect.adjusted(-VERTEX_RADIUS, -VERTEX_RADIUS, VERTEX_RADIUS, VERTEX_RADIUS)
+        shown = np.flatnonzero((self.x >= rect.left()) & (self.x <= rect.right()) &
+                               (self.y >= rect.top()) & (self.y <= rect.bottom()))
+        exposed_area = option.exposedRect.width() * option.exposedRect.height()
+        crowded = len(shown) * (2 * VERTEX_RADIUS) ** 2 > MAX_COVERAGE * max(exposed_area, 1.0)
+
+        if crowded or diameter < POINT_DIAMETER_PIXELS:
+            if self._points is None:
+                self._points = self._group_points()
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            for vertex_type, points in self._points.items():
+                width = min(max(1.0, diameter), POINT_DIAMETER_PIXELS)
+                pen = QPen(TYPE_BRUSHES[vertex_type].color(), width, Qt.SolidLine, Qt.SquareCap)
+                pen.setCosmetic(True)
+                painter.setPen(pen)
+                painter.drawPoints(points)
+            return
+
+        # Vue rapprochée : seuls les sommets de la zone exposée
+        xs = self.x[shown].tolist()
+        ys = self.y[shown].tolist()
+        types = self.layer.graph.types[self.indices[shown]].tolist()
+
+        painter.setPen(VERTEX_PEN)
+        for vertex_type, x, y in zip(types, xs, ys):
+            painter.setBrush(TYPE_BRUSHES[vertex_type])
+            painter.drawEllipse(QPointF(x, y), VERTEX_RADIUS, VERTEX_RADIUS)
+
+        if lod < LABEL_ZOOM_THRESHOLD:
+            return
+
+        painter.setPen(Qt.white)
+        painter.setFont(LABEL_FONT)
+        ids = self.layer.graph.vertex_ids
+        size = 2 * VERTEX_RADIUS
+        for i, x, y in zip(self.indices[shown].tolist(), xs, ys):
+            painter.drawText(QRectF(x - VERTEX_RADIUS, y - VERTEX_RADIUS, size, size),
+                             Qt.AlignCenter, str(ids[i]))
+
+
+class HighlightTileItem(QGraphicsItem):
+    """
+    Sommets mis en évidence d'une tuile, dessinés sous les disques des
+    sommets : anneaux en vue rapprochée, points élargis en vue éloignée.
+    """
+
+    def __init__(self, layer, color, z):
+        super().__init__()
+        self.layer = layer
+        self.color = color
+        self.pen = QPen(color, 5)
+        self.x = self.y = np.empty(0)
+        self._points = None
+        self._bounds = QRectF()
+        self.setZValue(z)  # Entre les arêtes (-1) et les sommets (0)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def set_indices(self, indices):
+        """Remplace les sommets mis en évidence de la tuile"""
+        self.prepareGeometryChange()
+        self.x = self.layer.graph.x[indices]
+        self.y = self.layer.graph.y[indices]
+        self._points = None
+        if len(indices):
+            margin = HIGHLIGHT_RADIUS + self.pen.widthF()
+            self._bounds = QRectF(QPointF(self.x.min() - margin, self.y.min() - margin),
+                                  QPointF(self.x.max() + margin, self.y.max() + margin))
+        else:
+            self._bounds = QRectF()
+        self.setVisible(len(indices) > 0)
+        self.update()
+
+    def boundingRect(self):
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        diameter = 2 * VERTEX_RADIUS * lod
+
+        rect = option.exposedRect.adjusted(-HIGHLIGHT_RADIUS, -HIGHLIGHT_RADIUS,
+                                           HIGHLIGHT_RADIUS, HIGHLIGHT_RADIUS)
+        shown = np.flatnonzero((self.x >= rect.left()) & (self.x <= rect.right()) &
+                               (self.y >= rect.top()) & (self.y <= rect.bottom()))
+        exposed_area = option.exposedRect.width() * option.exposedRect.height()
+        crowded = len(shown) * (2 * VERTEX_RADIUS) ** 2 > MAX_COVERAGE * max(exposed_area, 1.0)
+
+        if crowded or diameter < POINT_DIAMETER_PIXELS:
+            if self._points is None:
+                self._points = _points(self.x, self.y)
+            width = min(max(1.0, diameter), POINT_DIAMETER_PIXELS) + HIGHLIGHT_POINT_PIXELS
+            pen = QPen(self.color, width, Qt.SolidLine, Qt.SquareCap)
+            pen.setCosmetic(True)
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setPen(pen)
+            painter.drawPoints(self._points)
+            return
+
+        painter.setPen(self.pen)
+        painter.setBrush(Qt.NoBrush)
+        for x, y in zip(self.x[shown].tolist(), self.y[shown].tolist()):
+            painter.drawEllipse(QPointF(x, y), HIGHLIGHT_RADIUS, HIGHLIGHT_RADIUS)
+
+
+class LargeGraphLayer:
+    """
+    Rendu par tuiles d'un grand graphe (models.graph.Graph) : quelques
+    items par tuile au lieu de plusieurs items par sommet et par arête.
+
+    Les sommets sans coordonnées ne sont pas affichés.
+
+    Le découpage en tuiles est calculé à la construction ; les items sont
+    créés par build() ou, tuile par tuile, par build_steps() pour répartir
+    l'affichage sur plusieurs tours de boucle d'événements.
+    """
+
+    def __init__(self, scene, graph):
+        self.scene = scene
+        self.graph = graph
+        # Couches de mise en évidence : sommets de la solution et sommets
+        # sélectionnés pour une modification groupée
+        self.selected = np.zeros(graph.num_vertices, dtype=bool)
+        self.marked = np.zeros(graph.num_vertices, dtype=bool)
+        self.highlight_tiles = {}  # numéro de tuile -> HighlightTileItem
+        self.mark_tiles = {}
+
+        self.visible = ~(np.isnan(graph.x) | np.isnan(graph.y))
+        self.vertex_tiles = {}  # numéro de tuile -> VertexTileItem
+        self.edge_tiles = []
+        self.tile_of_vertex = np.full(graph.num_vertices, -1, dtype=np.int64)
+        self.tile_of_edge = np.full(graph.num_edges, -1, dtype=np.int64)  # rang dans _edge_chunks
+
+        self._vertex_chunks = []  # (numéro de tuile, indices des sommets)
+        self._tile_members = {}   # numéro de tuile -> indices des sommets
+        self._edge_chunks = []    # (x1, y1, x2, y2, critiques) par tuile
+        self._edge_chunk_indices = []  # indices des arêtes de chaque tuile
+        self._partition()
+
+    @property
+    def num_tiles(self):
+        return len(self._vertex_chunks) + len(self._edge_chunks)
+
+    def _partition(self):
+        graph = self.graph
+        visible = np.flatnonzero(self.visible)
+        if len(visible) == 0:
+            return
+
+        x, y = graph.x, graph.y
+        x0, x1 = x[visible].min(), x[visible].max()
+        y0, y1 = y[visible].min(), y[visible].max()
+        side = max(1, int(np.ceil(np.sqrt(len(visible) / TILE_TARGET))))
+        tile_w = max((x1 - x0) / side, 1.0)
+        tile_h = max((y1 - y0) / side, 1.0)
+
+        def tile_index(px, py):
+            tx = np.minimum(((px - x0) / tile_w).astype(np.int64), side - 1)
+            ty = np.minimum(((py - y0) / tile_h).astype(np.int64), side - 1)
+            return tx * side + ty
+
+        # Sommets
+        self.tile_of_vertex[visible] = tile_index(x[visible], y[visible])
+        order = visible[np.argsort(self.tile_of_vertex[visible], kind='stable')]
+        tiles, starts = np.unique(self.tile_of_vertex[order], return_index=True)
+        self._vertex_chunks = list(zip(tiles.tolist(), np.split(order, starts[1:])))
+        self._tile_members = dict(self._vertex_chunks)
+
+        # Arêtes : rangées dans la tuile de leur milieu
+        shown = np.flatnonzero(self.visible[graph.src] & self.visible[graph.dst])
+        if len(shown) == 0:
+            return
+        src, dst = graph.src[shown], graph.dst[shown]
+        edge_tile = tile_index((x[src] + x[dst]) / 2, (y[src] + y[dst]) / 2)
+        order = np.argsort(edge_tile, kind='stable')
+        tiles, starts = np.unique(edge_tile[order], return_index=True)
+        for rank, chunk in enumerate(np.split(shown[order], starts[1:])):
+            self.tile_of_edge[chunk] = rank
+            self._edge_chunk_indices.append(chunk)
+            self._edge_chunks.append(self._edge_chunk(chunk))
+
+    def _edge_chunk(self, indices):
+        """Arguments d'EdgeTileItem pour des arêtes"""
+        graph = self.graph
+        u, v = graph.src[indices], graph.dst[indices]
+        return graph.x[u], graph.y[u], graph.x[v], graph.y[v], graph.critical[indices]
+
+    def build_steps(self):
+        """Crée les items de la scène, une tuile par itération"""
+        for tile, indices in self._vertex_chunks:
+            item = VertexTileItem(self, indices)
+            self.scene.addItem(item)
+            self.vertex_tiles[tile] = item
+            yield
+        for chunk in self._edge_chunks:
+            item = EdgeTileItem(*chunk)
+            self.scene.addItem(item)
+            self.edge_tiles.append(item)
+            yield
+
+    def build(self):
+        """Crée tous les items de la scène"""
+        for _ in self.build_steps():
+            pass
+
+    def bounding_rect(self):
+        """Rectangle englobant des sommets affichés (items créés ou non)"""
+        if not self.visible.any():
+            return QRectF()
+        x = self.graph.x[self.visible]
+        y = self.graph.y[self.visible]
+        margin = VERTEX_RADIUS + VERTEX_PEN.widthF()
+        return QRectF(QPointF(x.min() - margin, y.min() - margin),
+                      QPointF(x.max() + margin, y.max() + margin))
+
+    def set_selection(self, selected_ids):
+        """
+        Met en évidence les sommets d'une solution sur une couche séparée :
+        seules les tuiles de cette couche dont un sommet change d'état sont
+        redessinées, les tuiles des sommets gardent leur cache.
+        """
+        index = self.graph.index
+        selected = np.zeros(self.graph.num_vertices, dtype=bool)
+        selected[[index[v_id] for v_id in selected_ids if v_id in index]] = True
+        self._update_overlay(self.highlight_tiles, self.selected, selected, HIGHLIGHT_COLOR, -0.5)
+        self.selected = selected & self.visible
+
+    def set_marked(self, marked):
+        """
+        Sélection pour une modification groupée (masque de bool), sur une
+        couche séparée comme set_selection
+        """
+        self._update_overlay(self.mark_tiles, self.marked, marked, MARK_COLOR, -0.4)
+        self.marked = marked & self.visible
+
+    def _update_overlay(self, tiles, old, new, color, z):
+        new = new & self.visible
+        changed = np.flatnonzero(new != old)
+        for tile in np.unique(self.tile_of_vertex[changed]).tolist():
+            item = tiles.get(tile)
+            if item is None:
+                item = HighlightTileItem(self, color, z)
+                self.scene.addItem(item)
+                tiles[tile] = item
+            members = self._tile_members[tile]
+            item.set_indices(members[new[members]])
+
+    def update_types(self, changed):
+        """Types des sommets d'indices `changed` modifiés dans le graphe"""
+        for tile in np.unique(self.tile_of_vertex[changed]).tolist():
+            item = self.vertex_tiles.get(tile)
+            if item is not None:
+                item.invalidate()
+
+    def update_critical(self, changed):
+        """Statut critique des arêtes d'indices `changed` modifié dans le graphe"""
+        for rank in np.unique(self.tile_of_edge[changed]).tolist():
+            if rank < 0:
+                continue
+            chunk = self._edge_chunk(self._edge_chunk_indices[rank])
+            self._edge_chunks[rank] = chunk
+            # Tuiles pas encore créées : build_steps utilisera le nouveau découpage
+            if rank < len(self.edge_tiles):
+                self.scene.removeItem(self.edge_tiles[rank])
+                self.edge_tiles[rank] = EdgeTileItem(*chunk)
+                self.scene.addItem(self.edge_tiles[rank])
+
+    def vertices_in_rect(self, rect):
+        """Identifiants des sommets affichés dont le centre est dans le rectangle"""
+        x, y = self.graph.x, self.graph.y
+        inside = ((x >= rect.left()) & (x <= rect.right()) &
+                  (y >= rect.top()) & (y <= rect.bottom()))
+        ids = self.graph.vertex_ids
+        return [ids[i] for i in np.flatnonzero(inside).tolist()]
+
+    def vertex_at(self, px, py, radius):
+        """Identifiant du sommet affiché le plus proche dans un rayon (ou None)"""
+        d2 = (self.graph.x - px) ** 2 + (self.graph.y - py) ** 2
+        d2[~self.visible] = np.inf
+        if len(d2) == 0:
+            return None
+        i = int(np.argmin(d2))
+        return self.graph.vertex_ids[i] if d2[i] <= radius * radius else None
+
+
+def _points(x, y):
+    """QPolygonF rempli directement depuis deux tableaux de coordonnées"""
+    polygon = QPolygonF(len(x))
+    if len(x):
+        buffer = polygon.data()
+        buffer.setsize(len(x) * 2 * np.dtype(np.float64).itemsize)
+        coordinates = np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)
+        coordinates[:, 0] = x
+        coordinates[:, 1] = y
+    return polygon
+
+
+def _lines_path(segments):
+    """
+    Chemin composé d'un segment par ligne (x1, y1, x2, y2).
+
+    Le chemin est lu depuis sa forme sérialisée (QDataStream), construite
+    d'un bloc avec NumPy, plutôt qu'élément par élément depuis Python.
+    """
+    count = 2 * len(segments)
+    # Format QDataStream : nombre d'éléments, (type, x, y) par élément,
+    # indice du sous-chemin courant, règle de remplissage
+    element = np.dtype([('type', '>i4'), ('x', '>f8'), ('y', '>f8')])
+    elements = np.empty(count, dtype=element)
+    elements['type'][0::2] = QPainterPath.MoveToElement
+    elements['type'][1::2] = QPainterPath.LineToElement
+    elements['x'][0::2], elements['y'][0::2] = segments[:, 0], segments[:, 1]
+    elements['x'][1::2], elements['y'][1::2] = segments[:, 2], segments[:, 3]
+
+    data = QByteArray(np.array([count], dtype='>i4').tobytes() + elements.tobytes() +
+                      np.array([max(count - 2, 0), Qt.OddEvenFill], dtype='>i4').tobytes())
+    path = QPainterPath()
+    stream = QDataStream(data, QIODevice.ReadOnly)  # `data` doit rester référencé pendant la lecture
+    stream >> path
+    return path
@@ -4,10 +4,110 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QSpinBox, QGroupBox, QGraphicsLineItem,
                              QGraphicsEllipseItem, QGraphicsTextItem,
                              QGraphicsItem, QGraphicsItemGroup, QMenu,
-                             QSizePolicy, QMainWindow, QToolBar, QAction)
-from PyQt5.QtCore import Qt, pyqtSignal, QPointF, QRectF, QLineF, QEvent
+                             QSizePolicy, QMainWindow, QToolBar, QAction,
+                             QInputDialog, QMessageBox)
+from PyQt5.QtCore import Qt, pyqtSignal, QPointF, QRectF, QLineF, QEvent, QTimer
 from PyQt5.QtGui import QPen, QBrush, QColor, QFont, QPainter
-import math
+import numpy as np
+import time
+
+from gui.cost_table_model import TYPE_LABELS
+from gui.graph_layers import LargeGraphLayer
+from gui.selection_rule_dialog import SelectionRuleDialog
+from models.graph import Graph, VERTEX_TYPES, TYPE_CODES, TYPE_NORMAL
+from models.graph_delta import GraphDelta
+from utils.layout import layout_graph_data
+from utils.spatial_index import SpatialGrid
+
+# Rayon d'un sommet et rayon de recherche autour d'un clic
+VERTEX_RADIUS = 20
+HIT_RADIUS = 40
+
+# Intervalle de mise à jour des arêtes pendant un déplacement (~60 images/s)
+FRAME_INTERVAL_MS = 16
+
+# Au-delà de ce nombre d'éléments (sommets + arêtes), un graphe chargé est
+# affiché par tuiles (gui/graph_layers.py), en lecture seule
+LARGE_GRAPH_THRESHOLD = 5000
+
+# Durée maximale d'une tranche de chargement progressif, par tour de
+# boucle d'événements
+LOAD_SLICE_MS = 15
+
+# Défilement animé des solutions (incumbents reçus, solutions enregistrées) :
+# durée d'affichage de chacune
+SOLUTION_STEP_MS = 250
+
+# Facteur de zoom par cran de molette et bornes du zoom
+ZOOM_STEP = 1.15
+MIN_ZOOM, MAX_ZOOM = 0.001, 10.0
+
+def prepare_graph(graph_data):
+    """
+    Prépare l'affichage d'un graphe, sans créer d'item : peut s'exécuter
+    dans un thread de travail (voir gui/load_worker.py).
+    
+    Les données doivent être valides (voir utils.validation.validate_graph).
+    Les sommets sans coordonnées sont d'abord disposés automatiquement
+    (utils/layout.py) ; leurs positions sont écrites dans graph_data.
+    
+    Parameters:
+    -----------
+    graph_data : dict
+        Graphe au format dict de l'application
+    
+    Returns:
+    --------
+    dict : {'large': True, 'graph'} pour un grand graphe (forme tabulaire),
+           sinon {'large': False, 'vertices', 'edges', 'next_vertex_id',
+           'bounds'} avec les sommets (id, x, y, coût, type) et les arêtes
+           (clé, id1, id2, critique) sans doublons
+    """
+    vertices = graph_data.get('vertices', [])
+    edges = graph_data.get('edges', [])
+    if any(vertex.get('x') is None or vertex.get('y') is None for vertex in vertices):
+        # Sommets sans coordonnées : disposition automatique (en place)
+        layout_graph_data(graph_data)
+    if len(vertices) + len(edges) > LARGE_GRAPH_THRESHOLD:
+        return {'large': True, 'graph': Graph.from_graph_data(graph_data)}
+    
+    vertex_rows = []
+    next_vertex_id = 1
+    for vertex_data in vertices:
+        if 'id' in vertex_data and 'x' in vertex_data and 'y' in vertex_data:
+            vertex_id = vertex_data['id']
+            vertex_rows.append((vertex_id, float(vertex_data['x']), float(vertex_data['y']),
+                                vertex_data.get('cost', 1.0), vertex_data.get('type', 'normal')))
+            try:
+                num = int(vertex_id[1:])  # Extraire le numéro de V1, V2, etc.
+                next_vertex_id = max(next_vertex_id, num + 1)
+            except (TypeError, ValueError):
+                pass
+    
+    # Une arête en double remplace la précédente
+    known = {row[0] for row in vertex_rows}
+    edge_rows = {}
+    for edge_data in edges:
+        v1_id, v2_id = edge_data.get('from'), edge_data.get('to')
+        if v1_id in known and v2_id in known:
+            edge_key = tuple(sorted([v1_id, v2_id]))
+            edge_rows.pop(edge_key, None)
+            edge_rows[edge_key] = (edge_key, v1_id, v2_id, bool(edge_data.get('critical', False)))
+    
+    bounds = None
+    if vertex_rows:
+        xs = [row[1] for row in vertex_rows]
+        ys = [row[2] for row in vertex_rows]
+        bounds = QRectF(QPointF(min(xs), min(ys)), QPointF(max(xs), max(ys))).adjusted(
+            -2 * VERTEX_RADIUS, -2 * VERTEX_RADIUS, 2 * VERTEX_RADIUS, 2 * VERTEX_RADIUS)
+    
+    return {
+        'large': False,
+        'vertices': vertex_rows,
+        'edges': list(edge_rows.values()),
+        'next_vertex_id': next_vertex_id,
+        'bounds': bounds
+    }
 
 class VertexItem(QGraphicsItemGroup):
     """Classe personnalisée pour les sommets du graphe"""
@@ -37,6 +137,9 @@ class VertexItem(QGraphicsItemGroup):
         self.addToGroup(self.circle)
         self.addToGroup(self.text)
         
+        # Anneau de mise en évidence (solution), créé à la première utilisation
+        self.halo = None
+        
         # Initialiser l'état
         self.is_selected = False
         self.vertex_type = 'normal'
@@ -62,28 +165,41 @@ class VertexItem(QGraphicsItemGroup):
     def mouseReleaseEvent(self, event):
         """Gère le relâchement de la souris"""
         self.is_selected = False
-        # Retour à la couleur normale
-        if self.vertex_type == 'selected_solution':
-            self.circle.setBrush(QBrush(QColor(50, 205, 50)))  # Vert
-        elif self.vertex_type == 'mandatory':
-            self.circle.setBrush(QBrush(QColor(220, 20, 60)))  # Rouge
-        elif self.vertex_type == 'forbidden':
-            self.circle.setBrush(QBrush(QColor(128, 128, 128)))  # Gris
-        else:
-            self.circle.setBrush(QBrush(QColor(70, 130, 180)))  # Bleu normal
+        # Retour à la couleur du type
+        self.set_type(self.vertex_type)
         super().mouseReleaseEvent(event)
         
     def set_type(self, vertex_type):
         """Change le type du sommet (couleur)"""
         self.vertex_type = vertex_type
-        if vertex_type == 'selected_solution':
-            self.circle.setBrush(QBrush(QColor(50, 205, 50)))  # Vert
-        elif vertex_type == 'mandatory':
+        if vertex_type == 'mandatory':
             self.circle.setBrush(QBrush(QColor(220, 20, 60)))  # Rouge
         elif vertex_type == 'forbidden':
             self.circle.setBrush(QBrush(QColor(128, 128, 128)))  # Gris
         else:
             self.circle.setBrush(QBrush(QColor(70, 130, 180)))  # Bleu normal
+    
+    def set_highlighted(self, highlighted):
+        """
+        Affiche ou masque l'anneau de mise en évidence, dessiné sous le
+        disque : la couleur du type reste visible
+        """
+        if self.halo is None:
+            if not highlighted:
+                return
+            self.halo = QGraphicsEllipseItem(QRectF(-25, -25, 50, 50), self)
+            self.halo.setPen(QPen(QColor(50, 205, 50), 5))  # Vert
+            self.halo.setZValue(-1)
+            self.addToGroup(self.halo)
+        self.halo.setVisible(highlighted)
+    
+    def itemChange(self, change, value):
+        """Signale les déplacements au widget graphe"""
+        if change == QGraphicsItem.ItemPositionHasChanged and self.scene():
+            widget = self.scene().parent()
+            if hasattr(widget, 'vertex_moved'):
+                widget.vertex_moved(self)
+        return super().itemChange(change, value)
 
 class EdgeItem(QGraphicsLineItem):
     """Classe personnalisée pour les arêtes du graphe"""
@@ -110,13 +226,103 @@ class EdgeItem(QGraphicsLineItem):
         """Met à jour la position de l'arête quand les sommets bougent"""
         self.setLine(QLineF(v1_pos, v2_pos))
 
+class GraphView(QGraphicsView):
+    """
+    Vue du graphe avec zoom à la molette (centré sous le curseur).
+    
+    En mode défilement à la main (grands graphes), Maj + glisser trace un
+    rectangle de sélection, émis par rubber_band_selected.
+    """
+    
+    rubber_band_selected = pyqtSignal(QRectF)
+    
+    def __init__(self, scene, parent=None):
+        super().__init__(scene, parent)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self._band_rect = None  # Rectangle en cours (coordonnées de la scène)
+        self.rubberBandChanged.connect(self._on_rubber_band_changed)
+    
+    def mousePressEvent(self, event):
+        if self.dragMode() == QGraphicsView.ScrollHandDrag and event.modifiers() & Qt.ShiftModifier:
+            self.setDragMode(QGraphicsView.RubberBandDrag)
+            self._band_rect = QRectF()
+        super().mousePressEvent(event)
+    
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if self._band_rect is not None:
+            rect, self._band_rect = self._band_rect, None
+            self.setDragMode(QGraphicsView.ScrollHandDrag)
+            self.rubber_band_selected.emit(rect)
+    
+    def _on_rubber_band_changed(self, viewport_rect, from_scene, to_scene):
+        # Le dernier signal (fin du tracé) porte un rectangle vide
+        if self._band_rect is not None and not viewport_rect.isNull():
+            self._band_rect = QRectF(from_scene, to_scene).normalized()
+    
+    def wheelEvent(self, event):
+        factor = ZOOM_STEP if event.angleDelta().y() > 0 else 1 / ZOOM_STEP
+        zoom = self.transform().m11() * factor
+        if MIN_ZOOM <= zoom <= MAX_ZOOM:
+            self.scale(factor, factor)
+        event.accept()
+
 class GraphWidget(QWidget):
-    graph_changed = pyqtSignal(dict)
+    # Modifications fusionnées (models.graph_delta.GraphDelta), émises une
+    # fois par tour de boucle d'événements
+    graph_changed = pyqtSignal(object)
+    
+    # Chargement progressif : (éléments créés, total), puis terminé (True) ou annulé (False)
+    load_progress = pyqtSignal(int, int)
+    load_finished = pyqtSignal(bool)
     
     def __init__(self):
         super().__init__()
         self.vertices = {}  # id -> VertexItem
         self.edges = {}     # (id1, id2) -> EdgeItem
+        
+        # Rendu par tuiles des grands graphes (None pour un graphe éditable)
+        self.large_layer = None
+        
+        # Index spatial des positions des sommets (tests de clic, zones)
+        self.spatial_index = SpatialGrid(cell_size=HIT_RADIUS)
+        
+        # Index d'incidence : id de sommet -> clés de ses arêtes
+        self.incident_edges = {}
+        self.critical_count = 0
+        
+        # Couche de mise en évidence de la solution, indépendante des types :
+        # ids des sommets mis en évidence
+        self.highlighted = set()
+        
+        # Solutions en attente de défilement animé
+        self.solution_steps = []
+        self.solution_timer = QTimer(self)
+        self.solution_timer.setInterval(SOLUTION_STEP_MS)
+        self.solution_timer.timeout.connect(self.show_next_solution)
+        
+        # Sommets déplacés depuis la dernière image : leurs arêtes sont
+        # redessinées une seule fois par image
+        self.moved_vertices = set()
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.setInterval(FRAME_INTERVAL_MS)
+        self.frame_timer.timeout.connect(self.update_moved_edges)
+        
+        # Modifications en attente d'émission
+        self.pending_delta = GraphDelta()
+        self.delta_timer = QTimer(self)
+        self.delta_timer.setSingleShot(True)
+        self.delta_timer.setInterval(0)
+        self.delta_timer.timeout.connect(self.flush_changes)
+        
+        # Chargement progressif : générateur d'étapes consommé par tranches
+        self._load_steps = None
+        self._load_done = 0
+        self._load_total = 0
+        self.load_timer = QTimer(self)
+        self.load_timer.setInterval(0)
+        self.load_timer.timeout.connect(self.load_next_slice)
         self.next_vertex_id = 1
         self.current_mode = 'select'  # 'add_vertex', 'add_edge', 'critical', 'delete'
         self.temp_edge_start = None
@@ -227,11 +433,30 @@ class GraphWidget(QWidget):
         btn_resize.clicked.connect(self.show_resize_menu)
         toolbar_layout.addWidget(btn_resize)
         
+        # Menu des modifications groupées de la sélection
+        self.btn_selection = QPushButton("Sélection ▾")
+        self.btn_selection.setToolTip("Sélectionner des sommets et les modifier en une fois")
+        self.btn_selection.setStyleSheet("""
+            QPushButton {
+                background-color: #f3f4f6;
+                border: 1px solid #d1d5db;
+                padding: 8px 12px;
+                border-radius: 6px;
+                font-weight: 500;
+            }
+            QPushButton:hover {
+                background-color: #e5e7eb;
+            }
+        """)
+        self.btn_selection.clicked.connect(self.show_selection_menu)
+        toolbar_layout.insertWidget(toolbar_layout.indexOf(btn_clear), self.btn_selection)
+        
         layout.addWidget(toolbar_widget)
         
         # Vue graphique - IMPORTANT: Set size policy to expand
-        self.scene = QGraphicsScene()
-        self.view = QGraphicsView(self.scene)
+        self.scene = QGraphicsScene(self)
+        self.view = GraphView(self.scene)
+        self.view.rubber_band_selected.connect(self.select_in_rect)
         self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setRenderHint(QPainter.SmoothPixmapTransform)
         self.view.setRenderHint(QPainter.TextAntialiasing)
@@ -351,7 +576,7 @@ class GraphWidget(QWidget):
         """Réinitialise la sélection pour la création d'arête"""
         if self.first_vertex_selected:
             # Réinitialiser la couleur du premier sommet sélectionné
-            self.first_vertex_selected.circle.setBrush(QBrush(QColor(70, 130, 180)))
+            self.first_vertex_selected.set_type(self.first_vertex_selected.vertex_type)
             self.first_vertex_selected = None
         
         if self.temp_edge_item:
@@ -446,18 +671,26 @@ class GraphWidget(QWidget):
         
         # Stocker la référence
         self.vertices[vertex_id] = vertex
+        self.spatial_index.insert(vertex_id, pos.x(), pos.y())
+        self.incident_edges[vertex_id] = set()
         
         self.update_info()
-        self.graph_changed.emit(self.get_graph_data())
+        self.pending_delta.vertex_added(vertex_id, self.vertex_data(vertex))
+        self.schedule_changes()
     
-    def find_vertex_at(self, pos, radius=40):
-        """Trouve le sommet le plus proche d'une position"""
-        for vertex in self.vertices.values():
-            vertex_pos = vertex.scenePos()
-            distance = math.sqrt((vertex_pos.x() - pos.x())**2 + (vertex_pos.y() - pos.y())**2)
-            if distance <= radius:
-                return vertex
-        return None
+    def find_vertex_at(self, pos, radius=HIT_RADIUS):
+        """Trouve le sommet le plus proche d'une position (index spatial)"""
+        if self.large_layer:
+            # Les grands graphes n'ont pas d'item par sommet
+            return None
+        vertex_id = self.spatial_index.nearest(pos.x(), pos.y(), radius)
+        return self.vertices.get(vertex_id) if vertex_id is not None else None
+    
+    def vertices_in_rect(self, rect):
+        """Identifiants des sommets dont le centre est dans un rectangle de la scène"""
+        if self.large_layer:
+            return self.large_layer.vertices_in_rect(rect)
+        return self.spatial_index.query_rect(rect.left(), rect.top(), rect.right(), rect.bottom())
     
     def add_edge(self, vertex1_id, vertex2_id):
         """Ajoute une arête entre deux sommets"""
@@ -475,10 +708,11 @@ class GraphWidget(QWidget):
             self.scene.addItem(edge)
             
             # Stocker la référence
-            self.edges[edge_key] = edge
+            self._register_edge(edge_key, edge)
             
             self.update_info()
-            self.graph_changed.emit(self.get_graph_data())
+            self.pending_delta.edge_added(edge_key, self.edge_data(edge_key, edge))
+            self.schedule_changes()
     
     def toggle_edge_critical(self, pos):
         """Marque/démarque une arête comme critique"""
@@ -490,73 +724,183 @@ class GraphWidget(QWidget):
                 if edge_key in self.edges:
                     edge = self.edges[edge_key]
                     edge.set_critical(not edge.critical)
-                    self.graph_changed.emit(self.get_graph_data())
+                    self.critical_count += 1 if edge.critical else -1
+                    self.update_info()
+                    self.pending_delta.edge_changed(edge_key, {'critical': edge.critical})
+                    self.schedule_changes()
                     break
     
     def delete_item_at(self, pos):
         """Supprime l'élément à la position donnée"""
-        items = self.scene.items(pos)
-        for item in items:
-            if isinstance(item, VertexItem):
-                # Supprimer le sommet et toutes ses arêtes
-                vertex_id = item.vertex_id
-                
-                # Supprimer les arêtes connectées
-                edges_to_remove = []
-                for edge_key, edge in self.edges.items():
-                    if vertex_id in edge_key:
-                        self.scene.removeItem(edge)
-                        edges_to_remove.append(edge_key)
-                
-                for edge_key in edges_to_remove:
-                    del self.edges[edge_key]
-                
-                # Supprimer le sommet
-                self.scene.removeItem(item)
-                del self.vertices[vertex_id]
-                
-                self.update_info()
-                self.graph_changed.emit(self.get_graph_data())
-                break
-            
-            elif isinstance(item, EdgeItem):
-                # Supprimer l'arête
-                edge_key = tuple(sorted([item.vertex1_id, item.vertex2_id]))
-                if edge_key in self.edges:
-                    self.scene.removeItem(item)
-                    del self.edges[edge_key]
-                    
-                    self.update_info()
-                    self.graph_changed.emit(self.get_graph_data())
+        # Les sommets sont au-dessus des arêtes : chercher d'abord un sommet
+        vertex = self.find_vertex_at(pos, radius=VERTEX_RADIUS)
+        if vertex:
+            self.remove_vertex(vertex.vertex_id)
+            return
+        
+        for item in self.scene.items(pos):
+            if isinstance(item, EdgeItem):
+                self.remove_edge(tuple(sorted([item.vertex1_id, item.vertex2_id])))
                 break
     
+    def remove_vertex(self, vertex_id):
+        """Supprime un sommet et ses arêtes (en O(degré))"""
+        if self._remove_vertex_item(vertex_id):
+            self.update_info()
+            self.schedule_changes()
+    
+    def _remove_vertex_item(self, vertex_id):
+        """Retire un sommet de la scène et des index, et l'enregistre dans le delta"""
+        vertex = self.vertices.pop(vertex_id, None)
+        if vertex is None:
+            return False
+        
+        # Supprimer les arêtes connectées
+        for edge_key in list(self.incident_edges.get(vertex_id, ())):
+            self._unregister_edge(edge_key)
+        self.incident_edges.pop(vertex_id, None)
+        
+        # Supprimer le sommet
+        self.scene.removeItem(vertex)
+        self.spatial_index.remove(vertex_id)
+        self.moved_vertices.discard(vertex_id)
+        self.highlighted.discard(vertex_id)
+        self.pending_delta.vertex_removed(vertex_id)
+        return True
+    
+    def remove_edge(self, edge_key):
+        """Supprime une arête"""
+        if edge_key not in self.edges:
+            return
+        self._unregister_edge(edge_key)
+        
+        self.update_info()
+        self.schedule_changes()
+    
+    def _register_edge(self, edge_key, edge):
+        """Enregistre une arête dans les index"""
+        self.edges[edge_key] = edge
+        for vertex_id in edge_key:
+            self.incident_edges.setdefault(vertex_id, set()).add(edge_key)
+        if edge.critical:
+            self.critical_count += 1
+    
+    def _unregister_edge(self, edge_key):
+        """Retire une arête de la scène et des index"""
+        edge = self.edges.pop(edge_key)
+        self.scene.removeItem(edge)
+        for vertex_id in edge_key:
+            self.incident_edges.get(vertex_id, set()).discard(edge_key)
+        if edge.critical:
+            self.critical_count -= 1
+        self.pending_delta.edge_removed(edge_key)
+    
     def update_info(self):
         """Met à jour le label d'information"""
-        critical_count = sum(1 for edge in self.edges.values() if edge.critical)
+        if self.large_layer:
+            graph = self.large_layer.graph
+            self.info_label.setText(
+                f"📊 {graph.num_vertices} sommets • {graph.num_edges} arêtes • "
+                f"{int(graph.critical.sum())} critiques • affichage simplifié"
+            )
+            return
         self.info_label.setText(
-            f"📊 {len(self.vertices)} sommets • {len(self.edges)} arêtes • {critical_count} critiques"
+            f"📊 {len(self.vertices)} sommets • {len(self.edges)} arêtes • {self.critical_count} critiques"
         )
     
+    def vertex_moved(self, vertex):
+        """Enregistre le déplacement d'un sommet (appelé par VertexItem)"""
+        if self.vertices.get(vertex.vertex_id) is not vertex:
+            return
+        pos = vertex.scenePos()
+        self.spatial_index.move(vertex.vertex_id, pos.x(), pos.y())
+        self.pending_delta.vertex_changed(vertex.vertex_id, {'x': pos.x(), 'y': pos.y()})
+        self.schedule_changes()
+        
+        # Arêtes redessinées à la prochaine image
+        self.moved_vertices.add(vertex.vertex_id)
+        if not self.frame_timer.isActive():
+            self.frame_timer.start()
+    
+    def update_moved_edges(self):
+        """Replace les arêtes incidentes aux sommets déplacés depuis la dernière image"""
+        edge_keys = set()
+        for vertex_id in self.moved_vertices:
+            edge_keys.update(self.incident_edges.get(vertex_id, ()))
+        self.moved_vertices.clear()
+        
+        for edge_key in edge_keys:
+            edge = self.edges.get(edge_key)
+            if edge:
+                edge.update_position(self.vertices[edge.vertex1_id].scenePos(),
+                                     self.vertices[edge.vertex2_id].scenePos())
+    
+    def schedule_changes(self):
+        """Programme l'émission des modifications en attente"""
+        if not self.delta_timer.isActive():
+            self.delta_timer.start()
+    
+    def flush_changes(self):
+        """Émet immédiatement les modifications en attente"""
+        self.delta_timer.stop()
+        if self.pending_delta.is_empty():
+            return
+        delta = self.pending_delta
+        self.pending_delta = GraphDelta()
+        self.graph_changed.emit(delta)
+    
+    def vertex_data(self, vertex):
+        """Données d'un sommet au format dict"""
+        pos = vertex.scenePos()
+        return {
+            'id': vertex.vertex_id,
+            'x': pos.x(),
+            'y': pos.y(),
+            'cost': vertex.cost,
+            'type': vertex.vertex_type
+        }
+    
+    def edge_data(self, edge_key, edge):
+        """Données d'une arête au format dict"""
+        return {
+            'from': edge_key[0],
+            'to': edge_key[1],
+            'critical': edge.critical
+        }
+    
+    def vertex_arrays(self):
+        """
+        Identifiants, coûts et codes de type des sommets, sans parcourir
+        les arêtes.
+        
+        Returns:
+        --------
+        tuple : (identifiants, coûts float64, codes de type int8)
+        """
+        if self.large_layer:
+            graph = self.large_layer.graph
+            return list(graph.vertex_ids), graph.costs.copy(), graph.types.copy()
+        
+        vertices = list(self.vertices.values())
+        n = len(vertices)
+        costs = np.fromiter((vertex.cost for vertex in vertices), dtype=np.float64, count=n)
+        types = np.fromiter((TYPE_CODES.get(vertex.vertex_type, TYPE_NORMAL) for vertex in vertices),
+                            dtype=np.int8, count=n)
+        return list(self.vertices), costs, types
+    
     def get_graph_data(self):
-        """Retourne les données du graphe au format dict"""
-        vertices_list = []
-        for v_id, vertex in self.vertices.items():
-            pos = vertex.scenePos()
-            vertices_list.append({
-                'id': v_id,
-                'x': pos.x(),
-                'y': pos.y(),
-                'cost': vertex.cost,
-                'type': vertex.vertex_type
-            })
-        
-        edges_list = []
-        for (v1_id, v2_id), edge in self.edges.items():
-            edges_list.append({
-                'from': v1_id,
-                'to': v2_id,
-                'critical': edge.critical
-            })
+        """
+        Retourne les données complètes du graphe au format dict.
+        
+        Parcourt tout le graphe : à réserver à la résolution et à la
+        sauvegarde, les autres consommateurs suivent les modifications
+        émises par graph_changed.
+        """
+        if self.large_layer:
+            return self.large_layer.graph.to_graph_data()
+        
+        vertices_list = [self.vertex_data(vertex) for vertex in self.vertices.values()]
+        edges_list = [self.edge_data(key, edge) for key, edge in self.edges.items()]
         
         return {
             'vertices': vertices_list,
@@ -564,87 +908,475 @@ class GraphWidget(QWidget):
         }
     
     def clear_scene(self):
-        """Efface toute la scène"""
+        """Efface toute la scène (et annule un chargement en cours)"""
+        if self._load_steps is not None:
+            self._end_load(False)
         self.scene.clear()
+        self.set_large_layer(None)
         self.vertices.clear()
         self.edges.clear()
+        self.spatial_index.clear()
+        self.incident_edges.clear()
+        self.critical_count = 0
+        self.moved_vertices.clear()
+        self.highlighted.clear()
+        self.stop_solution_steps()
         self.next_vertex_id = 1
         self.first_vertex_selected = None
         self.temp_edge_start = None
         self.temp_edge_item = None
         self.update_info()
-        self.graph_changed.emit(self.get_graph_data())
+        # Remplacement complet : émis immédiatement
+        self.pending_delta.mark_reset()
+        self.flush_changes()
     
     def highlight_solution(self, selected_vertices):
-        """Met en évidence la solution"""
-        # Réinitialiser tous les sommets
-        for vertex in self.vertices.values():
-            vertex.set_type('normal')
+        """
+        Met en évidence une solution (et interrompt un défilement en cours).
+        
+        Seule la différence symétrique avec la solution affichée est
+        redessinée ; les sommets gardent la couleur de leur type.
+        
+        Parameters:
+        -----------
+        selected_vertices : iterable
+            Identifiants des sommets de la solution
+        """
+        self.stop_solution_steps()
+        self._apply_highlight(selected_vertices)
+    
+    def _apply_highlight(self, selected_vertices):
+        if self.large_layer:
+            self.large_layer.set_selection(selected_vertices)
+            return
+        
+        selected = {v_id for v_id in selected_vertices if v_id in self.vertices}
+        for v_id in self.highlighted - selected:
+            self.vertices[v_id].set_highlighted(False)
+        for v_id in selected - self.highlighted:
+            self.vertices[v_id].set_highlighted(True)
+        self.highlighted = selected
+    
+    def step_solutions(self, solutions, interval_ms=SOLUTION_STEP_MS):
+        """
+        Fait défiler des solutions (listes d'ids de sommets), une toutes
+        les interval_ms : la première est affichée immédiatement.
+        """
+        self.solution_steps = [list(selected) for selected in solutions]
+        self.solution_timer.setInterval(interval_ms)
+        self.solution_timer.stop()
+        self.show_next_solution()
+    
+    def queue_solution(self, selected_vertices):
+        """
+        Ajoute une solution au défilement, par exemple une solution
+        améliorante reçue pendant la résolution : affichée immédiatement si
+        aucun défilement n'est en cours, sinon à son tour.
+        """
+        self.solution_steps.append(list(selected_vertices))
+        if not self.solution_timer.isActive():
+            self.show_next_solution()
+    
+    def show_next_solution(self):
+        """Affiche la prochaine solution du défilement"""
+        if not self.solution_steps:
+            self.solution_timer.stop()
+            return
+        self._apply_highlight(self.solution_steps.pop(0))
+        self.solution_timer.start()
+    
+    def stop_solution_steps(self):
+        """Interrompt le défilement (la solution affichée reste)"""
+        self.solution_steps.clear()
+        self.solution_timer.stop()
+    
+    # ------------------------------------------------------------------
+    # Sélection et modifications groupées
+    # ------------------------------------------------------------------
+    def selected_vertex_ids(self):
+        """Identifiants des sommets sélectionnés (rectangle, règle)"""
+        if self.large_layer:
+            ids = self.large_layer.graph.vertex_ids
+            return [ids[i] for i in np.flatnonzero(self.large_layer.marked).tolist()]
+        return [item.vertex_id for item in self.scene.selectedItems() if isinstance(item, VertexItem)]
+    
+    def select_vertices(self, vertex_ids):
+        """Remplace la sélection"""
+        if self.large_layer:
+            index = self.large_layer.graph.index
+            marked = np.zeros(self.large_layer.graph.num_vertices, dtype=bool)
+            marked[[index[v_id] for v_id in vertex_ids if v_id in index]] = True
+            self.large_layer.set_marked(marked)
+        else:
+            self.scene.clearSelection()
+            for v_id in vertex_ids:
+                vertex = self.vertices.get(v_id)
+                if vertex is not None:
+                    vertex.setSelected(True)
+        self.help_label.setText(f"{len(self.selected_vertex_ids())} sommet(s) sélectionné(s)")
+    
+    def select_in_rect(self, rect):
+        """Sélectionne les sommets d'un rectangle de la scène"""
+        self.select_vertices(self.vertices_in_rect(rect))
+    
+    def select_by_rule(self, min_cost=None, max_cost=None, vertex_type=None, min_degree=None):
+        """
+        Sélectionne les sommets vérifiant tous les critères donnés, évalués
+        sur les tableaux des sommets.
+        
+        Parameters:
+        -----------
+        min_cost, max_cost : float ou None
+            Intervalle de coût (bornes incluses)
+        vertex_type : str ou None
+            'normal', 'mandatory' ou 'forbidden'
+        min_degree : int ou None
+            Nombre minimal d'arêtes incidentes
+        """
+        ids, costs, types = self.vertex_arrays()
+        mask = np.ones(len(ids), dtype=bool)
+        if min_cost is not None:
+            mask &= costs >= min_cost
+        if max_cost is not None:
+            mask &= costs <= max_cost
+        if vertex_type is not None:
+            mask &= types == TYPE_CODES[vertex_type]
+        if min_degree is not None:
+            mask &= self._degrees() >= min_degree
+        self.select_vertices([ids[i] for i in np.flatnonzero(mask).tolist()])
+    
+    def _degrees(self):
+        """Degrés des sommets, dans l'ordre de vertex_arrays"""
+        if self.large_layer:
+            graph = self.large_layer.graph
+            n = graph.num_vertices
+            return np.bincount(graph.src, minlength=n) + np.bincount(graph.dst, minlength=n)
+        return np.fromiter((len(self.incident_edges.get(v_id, ())) for v_id in self.vertices),
+                           dtype=np.int64, count=len(self.vertices))
+    
+    def set_vertex_values(self, vertex_ids, costs=None, types=None):
+        """
+        Modifie le coût et/ou le type de plusieurs sommets en une seule
+        mutation : une seule notification graph_changed.
+        
+        Parameters:
+        -----------
+        vertex_ids : list
+            Sommets à modifier
+        costs : float ou séquence, optionnel
+            Nouveau coût (commun ou par sommet)
+        types : str ou séquence, optionnel
+            Nouveau type (commun ou par sommet)
+        """
+        n = len(vertex_ids)
+        if costs is not None:
+            costs = np.broadcast_to(np.asarray(costs, dtype=np.float64), (n,)).tolist()
+        if isinstance(types, str):
+            types = [types] * n
+        
+        if self.large_layer:
+            graph = self.large_layer.graph
+            index = graph.index
+            positions = [k for k, v_id in enumerate(vertex_ids) if v_id in index]
+            rows = np.array([index[vertex_ids[k]] for k in positions], dtype=np.int64)
+            if costs is not None:
+                graph.costs[rows] = [costs[k] for k in positions]
+            if types is not None:
+                codes = np.array([TYPE_CODES.get(types[k], TYPE_NORMAL) for k in positions], dtype=np.int8)
+                changed = rows[graph.types[rows] != codes]
+                graph.types[rows] = codes
+                self.large_layer.update_types(changed)
+        else:
+            positions = [k for k, v_id in enumerate(vertex_ids) if v_id in self.vertices]
+            for k in positions:
+                vertex = self.vertices[vertex_ids[k]]
+                if costs is not None:
+                    vertex.cost = costs[k]
+                if types is not None:
+                    vertex.set_type(types[k])
+        
+        for k in positions:
+            data = {}
+            if costs is not None:
+                data['cost'] = costs[k]
+            if types is not None:
+                data['type'] = types[k]
+            self.pending_delta.vertex_changed(vertex_ids[k], data)
+        self.schedule_changes()
+    
+    def scale_costs(self, vertex_ids, factor):
+        """Multiplie le coût de plusieurs sommets par un facteur"""
+        ids, costs, _ = self.vertex_arrays()
+        current = dict(zip(ids, costs.tolist()))
+        kept = [v_id for v_id in vertex_ids if v_id in current]
+        self.set_vertex_values(kept, costs=[current[v_id] * factor for v_id in kept])
+    
+    def set_edges_critical(self, vertex_ids, critical=True):
+        """
+        Marque (ou démarque) comme critiques les arêtes dont les deux
+        extrémités sont dans vertex_ids, en une seule mutation
+        """
+        if self.large_layer:
+            graph = self.large_layer.graph
+            index = graph.index
+            inside = np.zeros(graph.num_vertices, dtype=bool)
+            inside[[index[v_id] for v_id in vertex_ids if v_id in index]] = True
+            changed = np.flatnonzero(inside[graph.src] & inside[graph.dst] & (graph.critical != critical))
+            graph.critical[changed] = critical
+            self.large_layer.update_critical(changed)
+            ids = graph.vertex_ids
+            for u, v in zip(graph.src[changed].tolist(), graph.dst[changed].tolist()):
+                self.pending_delta.edge_changed(tuple(sorted([ids[u], ids[v]])), {'critical': critical})
+        else:
+            inside = set(vertex_ids)
+            for v_id in inside:
+                for edge_key in self.incident_edges.get(v_id, ()):
+                    edge = self.edges[edge_key]
+                    if edge.critical != critical and edge_key[0] in inside and edge_key[1] in inside:
+                        edge.set_critical(critical)
+                        self.critical_count += 1 if critical else -1
+                        self.pending_delta.edge_changed(edge_key, {'critical': critical})
+        self.update_info()
+        self.schedule_changes()
+    
+    def remove_vertices(self, vertex_ids):
+        """Supprime plusieurs sommets et leurs arêtes en une seule mutation"""
+        if self.large_layer:
+            graph = self.large_layer.graph
+            index = graph.index
+            removed = np.zeros(graph.num_vertices, dtype=bool)
+            removed[[index[v_id] for v_id in vertex_ids if v_id in index]] = True
+            if not removed.any():
+                return
+            # Nouvelle forme tabulaire, tuiles reconstruites ; la vue est conservée
+            self.scene.clear()
+            self.highlighted.clear()
+            self.stop_solution_steps()
+            layer = LargeGraphLayer(self.scene, graph.without_vertices(removed))
+            layer.build()
+            self.set_large_layer(layer)
+            self.pending_delta.mark_reset()
+        else:
+            for v_id in vertex_ids:
+                self._remove_vertex_item(v_id)
+        self.update_info()
+        self.schedule_changes()
+    
+    def show_selection_menu(self):
+        """Menu de sélection et des modifications groupées"""
+        menu = QMenu(self)
+        selection = self.selected_vertex_ids()
+        enabled = self._load_steps is None
+        
+        menu.addAction("Tout sélectionner", lambda: self.select_vertices(self.vertex_arrays()[0]))
+        menu.addAction("Sélection par règle...", self.ask_selection_rule)
+        menu.addAction("Effacer la sélection", lambda: self.select_vertices([]))
+        if self.large_layer:
+            menu.addSection("Maj + glisser : sélection rectangulaire")
+        menu.addSeparator()
+        
+        menu.addSection(f"{len(selection)} sommet(s) sélectionné(s)")
+        edit_actions = [
+            menu.addAction("Définir le coût...", lambda: self.ask_cost(selection)),
+            menu.addAction("Multiplier les coûts...", lambda: self.ask_cost_factor(selection))
+        ]
+        type_menu = menu.addMenu("Définir le type")
+        for vertex_type, type_label in zip(VERTEX_TYPES, TYPE_LABELS):
+            type_menu.addAction(type_label, lambda t=vertex_type: self.set_vertex_values(selection, types=t))
+        edit_actions += [
+            type_menu.menuAction(),
+            menu.addAction("Marquer les arêtes internes critiques",
+                           lambda: self.set_edges_critical(selection, True)),
+            menu.addAction("Démarquer les arêtes internes critiques",
+                           lambda: self.set_edges_critical(selection, False)),
+            menu.addAction("Supprimer la sélection", lambda: self.confirm_remove(selection))
+        ]
+        for action in edit_actions:
+            action.setEnabled(enabled and bool(selection))
         
-        # Colorier les sommets sélectionnés
-        for v_id in selected_vertices:
-            if v_id in self.vertices:
-                self.vertices[v_id].set_type('selected_solution')
+        menu.exec_(self.btn_selection.mapToGlobal(self.btn_selection.rect().bottomLeft()))
+    
+    def ask_selection_rule(self):
+        """Demande une règle de sélection"""
+        dialog = SelectionRuleDialog(self)
+        if dialog.exec_():
+            self.select_by_rule(**dialog.rule())
+    
+    def ask_cost(self, vertex_ids):
+        """Demande un coût commun pour les sommets"""
+        cost, ok = QInputDialog.getDouble(self, "Définir le coût",
+                                          f"Coût de {len(vertex_ids)} sommet(s) (€) :",
+                                          1.0, 0.0, 1e9, 2)
+        if ok:
+            self.set_vertex_values(vertex_ids, costs=cost)
+    
+    def ask_cost_factor(self, vertex_ids):
+        """Demande un facteur multiplicatif des coûts"""
+        factor, ok = QInputDialog.getDouble(self, "Multiplier les coûts",
+                                            f"Facteur appliqué à {len(vertex_ids)} sommet(s) :",
+                                            1.0, 0.0, 1e6, 3)
+        if ok:
+            self.scale_costs(vertex_ids, factor)
+    
+    def confirm_remove(self, vertex_ids):
+        """Supprime les sommets après confirmation"""
+        reply = QMessageBox.question(self, "Supprimer la sélection",
+                                     f"Supprimer {len(vertex_ids)} sommet(s) et leurs arêtes ?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self.remove_vertices(vertex_ids)
     
     def load_graph_data(self, graph_data):
-        """Charge un graphe depuis des données structurées"""
-        # Effacer la scène actuelle
+        """Charge un graphe depuis des données structurées (en une fois)"""
+        self.begin_load(prepare_graph(graph_data))
+        self.finish_load()
+    
+    def begin_load(self, prepared):
+        """
+        Remplace le graphe par un graphe préparé (voir prepare_graph) et
+        lance son affichage progressif : les items sont créés par tranches
+        d'au plus LOAD_SLICE_MS par tour de boucle d'événements, la vue
+        restant utilisable entre deux tranches.
+        
+        load_progress est émis après chaque tranche et load_finished à la
+        fin (True) ou à l'annulation (False). Les modes d'édition sont
+        désactivés pendant le chargement.
+        
+        Parameters:
+        -----------
+        prepared : dict
+            Résultat de prepare_graph
+        """
         self.clear_scene()
         
-        # Vérifier et charger les sommets
-        for vertex_data in graph_data.get('vertices', []):
-            if 'id' in vertex_data and 'x' in vertex_data and 'y' in vertex_data:
-                pos = QPointF(vertex_data['x'], vertex_data['y'])
-                vertex_id = vertex_data['id']
-                
-                # Créer le sommet
-                vertex = VertexItem(vertex_id, pos)
-                vertex.cost = vertex_data.get('cost', 1.0)
-                vertex_type = vertex_data.get('type', 'normal')
-                vertex.set_type(vertex_type)
-                
-                # Rendre déplaçable selon le mode
-                vertex.set_movable(self.current_mode == 'select')
-                
-                self.scene.addItem(vertex)
-                self.vertices[vertex_id] = vertex
-                
-                # Mettre à jour l'ID suivant
-                try:
-                    num = int(vertex_id[1:])  # Extraire le numéro de V1, V2, etc.
-                    if num >= self.next_vertex_id:
-                        self.next_vertex_id = num + 1
-                except:
-                    pass
-        
-        # Charger les arêtes
-        for edge_data in graph_data.get('edges', []):
-            if 'from' in edge_data and 'to' in edge_data:
-                v1_id = edge_data['from']
-                v2_id = edge_data['to']
-                
-                if v1_id in self.vertices and v2_id in self.vertices:
-                    v1 = self.vertices[v1_id]
-                    v2 = self.vertices[v2_id]
-                    
-                    # Créer l'arête
-                    edge = EdgeItem(v1_id, v2_id, v1.scenePos(), v2.scenePos())
-                    
-                    # Marquer comme critique si nécessaire
-                    if edge_data.get('critical', False):
-                        edge.set_critical(True)
-                    
-                    self.scene.addItem(edge)
-                    
-                    # Stocker la référence
-                    edge_key = tuple(sorted([v1_id, v2_id]))
-                    self.edges[edge_key] = edge
+        if prepared['large']:
+            layer = LargeGraphLayer(self.scene, prepared['graph'])
+            self.set_large_layer(layer)
+            steps, total = layer.build_steps(), layer.num_tiles
+            rect = layer.bounding_rect()
+        else:
+            steps = self._item_load_steps(prepared)
+            total = len(prepared['vertices']) + len(prepared['edges'])
+            rect = prepared['bounds']
+        
+        self._load_steps = steps
+        self._load_done = 0
+        self._load_total = total
+        if self.current_mode != 'select':
+            self.mode_buttons['select'].setChecked(True)
+        self._update_mode_buttons()
+        
+        # La scène couvre tout le graphe dès le début : la vue peut être
+        # déplacée pendant le chargement
+        if prepared['large'] and not rect.isEmpty():
+            margin = max(rect.width(), rect.height()) * 0.05
+            self.scene.setSceneRect(rect.adjusted(-margin, -margin, margin, margin))
+            self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+        elif rect is not None:
+            self.scene.setSceneRect(self.scene.sceneRect().united(rect))
+        
+        self.load_timer.start()
+    
+    def is_loading(self):
+        """Vrai si un chargement progressif est en cours"""
+        return self._load_steps is not None
+    
+    def finish_load(self):
+        """Termine immédiatement le chargement en cours"""
+        if self._load_steps is None:
+            return
+        for _ in self._load_steps:
+            pass
+        self._load_done = self._load_total
+        self._end_load(True)
+    
+    def cancel_load(self):
+        """Annule le chargement en cours : le graphe partiel est effacé"""
+        if self._load_steps is not None:
+            self.clear_scene()
+    
+    def load_next_slice(self):
+        """Crée les items suivants pendant au plus LOAD_SLICE_MS"""
+        deadline = time.perf_counter() + LOAD_SLICE_MS / 1000
+        steps = self._load_steps
+        try:
+            while time.perf_counter() < deadline:
+                next(steps)
+                self._load_done += 1
+        except StopIteration:
+            self._end_load(True)
+            return
         
         self.update_info()
-        self.graph_changed.emit(self.get_graph_data())
+        self.load_progress.emit(self._load_done, self._load_total)
+    
+    def _end_load(self, completed):
+        """Quitte l'état de chargement (terminé ou annulé)"""
+        self.load_timer.stop()
+        self._load_steps = None
+        self._update_mode_buttons()
+        
+        if completed:
+            self.update_info()
+            self.load_progress.emit(self._load_total, self._load_total)
+            self.pending_delta.mark_reset()
+            self.flush_changes()
+        self.load_finished.emit(completed)
+    
+    def _item_load_steps(self, prepared):
+        """Crée les items d'un graphe éditable, un sommet ou une arête par itération"""
+        for vertex_id, x, y, cost, vertex_type in prepared['vertices']:
+            vertex = VertexItem(vertex_id, QPointF(x, y))
+            vertex.cost = cost
+            vertex.set_type(vertex_type)
+            vertex.set_movable(self.current_mode == 'select')
+            
+            self.scene.addItem(vertex)
+            self.vertices[vertex_id] = vertex
+            self.spatial_index.insert(vertex_id, x, y)
+            self.incident_edges[vertex_id] = set()
+            yield
+        
+        self.next_vertex_id = max(self.next_vertex_id, prepared['next_vertex_id'])
+        
+        for edge_key, v1_id, v2_id, critical in prepared['edges']:
+            # Positions courantes : un sommet a pu être déplacé pendant le chargement
+            v1 = self.vertices[v1_id]
+            v2 = self.vertices[v2_id]
+            edge = EdgeItem(v1_id, v2_id, v1.scenePos(), v2.scenePos())
+            if critical:
+                edge.set_critical(True)
+            
+            self.scene.addItem(edge)
+            self._register_edge(edge_key, edge)
+            yield
+    
+    def set_large_layer(self, layer):
+        """Active (layer) ou quitte (None) l'affichage par tuiles"""
+        was_large = self.large_layer is not None
+        self.large_layer = layer
+        large = layer is not None
+        
+        self._update_mode_buttons()
+        if large:
+            self.mode_buttons['select'].setChecked(True)
+            self.view.setDragMode(QGraphicsView.ScrollHandDrag)
+            self.help_label.setText("Grand graphe : affichage simplifié • Maj + glisser pour sélectionner • molette pour zoomer")
+        elif was_large:
+            self.view.resetTransform()
+            self.scene.setSceneRect(-500, -350, 1000, 700)
+            self.set_mode(self.current_mode)
+    
+    def _update_mode_buttons(self):
+        """Modes d'édition disponibles hors chargement, pour un graphe éditable"""
+        editable = self.large_layer is None and self._load_steps is None
+        for mode, button in self.mode_buttons.items():
+            button.setEnabled(mode == 'select' or editable)
     
     def is_empty(self):
         """Vérifie si le graphe est vide"""
+        if self.large_layer:
+            return self.large_layer.graph.num_vertices == 0
         return len(self.vertices) == 0
     
     def show_resize_menu(self):
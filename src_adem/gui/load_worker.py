@@ -0,0 +1,102 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from gui.graph_widget import prepare_graph
+from utils.file_io import load_graph_from_file
+from utils.layout import layout_graph_data
+from utils.validation import validate_graph, format_validation_report
+
+
+class LoadWorker(QThread):
+    """
+    Worker pour lire, valider et préparer un graphe dans un thread séparé.
+
+    Seule la création des items de la scène reste au thread GUI
+    (GraphWidget.begin_load), par tranches. L'annulation passe par
+    requestInterruption() : elle est prise en compte entre deux étapes.
+    """
+
+    # Signaux (done : résultat du chargement, émis depuis run() ; le signal
+    # finished de QThread n'est émis qu'une fois le thread terminé)
+    done = pyqtSignal(dict)
+    progress = pyqtSignal(int, str)  # Progression et message
+
+    def __init__(self, filename):
+        """
+        Parameters:
+        -----------
+        filename : str
+            Fichier à charger
+        """
+        super().__init__()
+        self.filename = filename
+
+    def run(self):
+        """Lit et prépare le graphe dans le thread"""
+        result = {'success': False, 'filename': self.filename, 'canceled': False, 'invalid': False}
+
+        try:
+            self.progress.emit(5, "Lecture du fichier...")
+            loaded = load_graph_from_file(self.filename)
+            if not loaded['success']:
+                result['error'] = loaded['error']
+                self.done.emit(result)
+                return
+            if self._interrupted(result):
+                return
+
+            self.progress.emit(25, "Validation des données...")
+            report = validate_graph(loaded['graph_data'])
+            result['report'] = report
+            if not report['valid']:
+                result['invalid'] = True
+                result['error'] = format_validation_report(report)
+                self.done.emit(result)
+                return
+            if self._interrupted(result):
+                return
+
+            # Sommets sans coordonnées : disposition automatique, écrite
+            # dans graph_data (partagée par l'éditeur et les solveurs)
+            laid_out = 0
+            if any(issue['code'] == 'missing_coordinates' for issue in report['warnings']):
+                self.progress.emit(30, "Disposition automatique...")
+                laid_out = layout_graph_data(loaded['graph_data'], progress=self._layout_progress)
+                if laid_out is None:  # Interrompue
+                    result['canceled'] = True
+                    self.done.emit(result)
+                    return
+
+            self.progress.emit(45, "Préparation de l'affichage...")
+            prepared = prepare_graph(loaded['graph_data'])
+            if self._interrupted(result):
+                return
+
+        except Exception as e:
+            result['error'] = str(e)
+            self.done.emit(result)
+            return
+
+        result.update({
+            'success': True,
+            'graph_data': loaded['graph_data'],
+            'parameters': loaded.get('parameters', {}),
+            'solution': loaded.get('solution'),
+            'metadata': loaded.get('metadata', {}),
+            'prepared': prepared,
+            'laid_out': laid_out
+        })
+        self.progress.emit(50, "Affichage du graphe...")
+        self.done.emit(result)
+
+    def _layout_progress(self, fraction):
+        """Avancement de la disposition automatique (de 30 à 45 %)"""
+        self.progress.emit(30 + int(15 * fraction), "Disposition automatique...")
+        return self.isInterruptionRequested()
+
+    def _interrupted(self, result):
+        """Émet un résultat annulé si l'interruption a été demandée"""
+        if not self.isInterruptionRequested():
+            return False
+        result['canceled'] = True
+        self.done.emit(result)
+        return True
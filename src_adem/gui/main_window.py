@@ -2,7 +2,7 @@ import sys
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QLabel, 
                              QHBoxLayout, QSplitter, QTabWidget,
                              QToolBar, QAction, QStatusBar, QMessageBox,
-                             QFileDialog, QProgressDialog)
+                             QFileDialog, QProgressBar, QPushButton)
 from PyQt5.QtCore import Qt, QSize, QTimer
 from PyQt5.QtGui import QIcon, QKeySequence
 from datetime import datetime
@@ -12,10 +12,18 @@ from gui.graph_widget import GraphWidget
 from gui.parameters_widget import ParametersWidget
 from gui.results_widget import ResultsWidget
 from gui.styles import get_stylesheet
+from gui.save_worker import SaveWorker
+from gui.load_worker import LoadWorker
 from solver.worker import SolverWorker
-from utils.file_io import (save_graph_to_file, load_graph_from_file, 
-                          export_solution_to_json, export_solution_to_csv,
-                          validate_graph_data)
+from models.graph import Graph, VERTEX_TYPES
+from utils.validation import format_validation_report
+
+# Intervalle de la sauvegarde automatique (2 minutes)
+AUTOSAVE_INTERVAL_MS = 2 * 60 * 1000
+
+# Solutions gardées pour être rejouées, et durée d'affichage de chacune
+SOLUTION_HISTORY = 10
+SOLUTION_REPLAY_MS = 800
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -30,7 +38,29 @@ class MainWindow(QMainWindow):
         self.current_file = None
         self.solution = None
         self.solver_worker = None
-        self.graph_data = None
+        
+        # Sommets des dernières solutions du graphe courant (la plus récente en dernier)
+        self.solution_history = []
+        
+        # Écritures en arrière-plan
+        self.save_worker = None
+        self.pending_save = None
+        
+        # Chargement en arrière-plan ; chaque worker (y compris annulé) est
+        # gardé dans load_threads jusqu'à la fin de son thread
+        self.load_worker = None
+        self.load_threads = set()
+        self.loading_result = None
+        
+        # Compteur de générations : incrémenté à chaque modification du graphe,
+        # comparé à la génération de la dernière sauvegarde réussie
+        self.generation = 0
+        self.saved_generation = 0
+        
+        # Sauvegarde automatique (désactivée par défaut)
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setInterval(AUTOSAVE_INTERVAL_MS)
+        self.autosave_timer.timeout.connect(self.autosave)
         
         # Créer l'interface
         self.create_ui()
@@ -39,6 +69,20 @@ class MainWindow(QMainWindow):
         self.connect_signals()
         
         # Status bar
+        self.save_progress = QProgressBar()
+        self.save_progress.setRange(0, 100)
+        self.save_progress.setMaximumWidth(160)
+        self.save_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.save_progress)
+        
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setMaximumWidth(160)
+        self.load_cancel_button = QPushButton("Annuler")
+        self.load_cancel_button.clicked.connect(self.cancel_loading)
+        self.hide_load_progress()
+        self.statusBar().addPermanentWidget(self.load_progress)
+        self.statusBar().addPermanentWidget(self.load_cancel_button)
         self.statusBar().showMessage("Prêt • Créez un graphe ou ouvrez un fichier")
     
     def create_ui(self):
@@ -108,10 +152,19 @@ class MainWindow(QMainWindow):
         save_as_action.setToolTip("Sauvegarder le graphe sous un nouveau nom (Ctrl+Shift+S)")
         save_as_action.triggered.connect(self.save_graph_as)
         
+        self.autosave_action = QAction("⏱ Sauvegarde auto", self)
+        self.autosave_action.setCheckable(True)
+        self.autosave_action.setToolTip(
+            f"Sauvegarder automatiquement toutes les {AUTOSAVE_INTERVAL_MS // 60000} minutes "
+            f"si le graphe a changé"
+        )
+        self.autosave_action.toggled.connect(self.toggle_autosave)
+        
         toolbar.addAction(new_action)
         toolbar.addAction(open_action)
         toolbar.addAction(save_action)
         toolbar.addAction(save_as_action)
+        toolbar.addAction(self.autosave_action)
         
         toolbar.addSeparator()
         
@@ -129,7 +182,12 @@ class MainWindow(QMainWindow):
         export_csv_action.setToolTip("Exporter la solution en CSV")
         export_csv_action.triggered.connect(self.export_solution_csv)
         
+        replay_action = QAction("🔁 Rejouer", self)
+        replay_action.setToolTip("Faire défiler les dernières solutions du graphe")
+        replay_action.triggered.connect(self.replay_solutions)
+        
         toolbar.addAction(run_action)
+        toolbar.addAction(replay_action)
         toolbar.addSeparator()
         toolbar.addAction(export_json_action)
         toolbar.addAction(export_csv_action)
@@ -150,6 +208,13 @@ class MainWindow(QMainWindow):
         """Connecte les signaux entre les widgets"""
         # Quand le graphe change, mettre à jour les paramètres
         self.graph_widget.graph_changed.connect(self.on_graph_changed)
+        self.graph_widget.load_progress.connect(self.on_graph_load_progress)
+        self.graph_widget.load_finished.connect(self.on_graph_load_finished)
+        
+        # Édition du tableau des coûts : répercutée sur le graphe
+        self.params_widget.costs_model.vertex_edited.connect(
+            lambda vertex_id, cost, vertex_type: self.graph_widget.set_vertex_values(
+                [vertex_id], [cost], [vertex_type]))
         
         # Quand on clique sur "Résoudre"
         self.params_widget.solve_clicked.connect(self.solve_problem)
@@ -158,28 +223,41 @@ class MainWindow(QMainWindow):
         self.results_widget.export_json_requested.connect(self.export_solution_json)
         self.results_widget.export_csv_requested.connect(self.export_solution_csv)
     
-    def on_graph_changed(self, graph_data):
-        """Quand le graphe change"""
-        self.graph_data = graph_data
-        self.params_widget.update_from_graph(graph_data)
+    def on_graph_changed(self, delta):
+        """Quand le graphe change (modifications fusionnées)"""
+        if delta.reset:
+            # Graphe remplacé : resynchronisation complète
+            self.params_widget.update_from_arrays(*self.graph_widget.vertex_arrays())
+        else:
+            self.params_widget.apply_delta(delta)
         
         # Marquer comme non sauvegardé
-        if self.current_file:
-            self.file_label.setText(f"*{os.path.basename(self.current_file)}")
-        else:
-            self.file_label.setText("*Non sauvegardé")
+        self.generation += 1
+        self.update_file_label()
+    
+    def is_modified(self):
+        """Vrai si le graphe a changé depuis la dernière sauvegarde"""
+        return self.generation != self.saved_generation
+    
+    def update_file_label(self):
+        """Met à jour le nom du fichier courant (préfixé de * si modifié)"""
+        name = os.path.basename(self.current_file) if self.current_file else "Non sauvegardé"
+        self.file_label.setText(f"*{name}" if self.is_modified() else name)
     
     def new_graph(self):
         """Crée un nouveau graphe vide"""
         if self.check_unsaved_changes():
             return
         
+        self.cancel_loading()
         self.graph_widget.clear_scene()
         self.params_widget.clear()
         self.results_widget.clear()
         self.solution = None
+        self.solution_history.clear()
         self.current_file = None
-        self.file_label.setText("Non sauvegardé")
+        self.saved_generation = self.generation
+        self.update_file_label()
         self.statusBar().showMessage("Nouveau graphe créé • Prêt à ajouter des sommets")
         
         # Ajouter un exemple si le graphe est vide
@@ -202,9 +280,8 @@ class MainWindow(QMainWindow):
     
     def check_unsaved_changes(self):
         """Vérifie s'il y a des changements non sauvegardés"""
-        if self.graph_data and self.current_file:
-            # Vérifier si le graphe a changé depuis le dernier chargement/sauvegarde
-            # Pour simplifier, on demande toujours
+        if self.current_file and self.is_modified():
+            # Le graphe a changé depuis le dernier chargement/sauvegarde
             reply = QMessageBox.question(
                 self, 
                 "Changements non sauvegardés",
@@ -221,7 +298,7 @@ class MainWindow(QMainWindow):
         return False
     
     def open_graph(self):
-        """Ouvre un graphe depuis un fichier JSON"""
+        """Ouvre un graphe depuis un fichier JSON (lecture en arrière-plan)"""
         if self.check_unsaved_changes():
             return
         
@@ -235,82 +312,159 @@ class MainWindow(QMainWindow):
         if not filename:
             return
         
-        # Afficher une boîte de dialogue de progression
-        progress = QProgressDialog("Chargement du fichier...", "Annuler", 0, 100, self)
-        progress.setWindowTitle("Chargement")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setValue(10)
+        self.cancel_loading()
         
-        # Charger le fichier
-        result = load_graph_from_file(filename)
+        # Lecture, validation et préparation dans un thread, puis affichage
+        # progressif par le widget graphe : la fenêtre reste utilisable
+        self.load_worker = LoadWorker(filename)
+        self.load_worker.progress.connect(self.on_load_progress)
+        self.load_worker.done.connect(self.on_load_worker_finished)
+        self.load_worker.finished.connect(self.release_load_worker)
+        self.load_threads.add(self.load_worker)
         
-        progress.setValue(50)
+        self.load_progress.setValue(0)
+        self.load_progress.setVisible(True)
+        self.load_cancel_button.setVisible(True)
+        self.load_worker.start()
+    
+    def cancel_loading(self):
+        """Annule le chargement en cours (lecture ou affichage)"""
+        if self.load_worker and self.load_worker.isRunning():
+            # Le thread finit son étape en cours ; son résultat sera ignoré
+            self.load_worker.requestInterruption()
+            self.load_worker = None
+            self.hide_load_progress()
+            self.statusBar().showMessage("Chargement annulé")
+        
+        elif self.graph_widget.is_loading():
+            self.graph_widget.cancel_load()
+    
+    def hide_load_progress(self):
+        """Masque la progression du chargement"""
+        self.load_progress.setVisible(False)
+        self.load_cancel_button.setVisible(False)
+    
+    def on_load_progress(self, progress, message):
+        """Progression de la lecture du fichier"""
+        self.load_progress.setValue(progress)
+        self.statusBar().showMessage(f"📂 {message}")
+    
+    def on_load_worker_finished(self, result):
+        """Fichier lu et préparé : lancement de l'affichage progressif"""
+        if self.sender() is not self.load_worker:
+            # Chargement annulé entre-temps
+            return
+        self.load_worker = None
         
-        if not result['success']:
-            progress.close()
-            QMessageBox.critical(self, "Erreur de chargement", result['error'])
+        if result['canceled']:
+            self.hide_load_progress()
+            self.statusBar().showMessage("Chargement annulé")
             return
         
-        # Valider les données
-        graph_data = result['graph_data']
-        is_valid, error_msg = validate_graph_data(graph_data)
+        if not result['success']:
+            self.hide_load_progress()
+            self.statusBar().showMessage("Échec du chargement")
+            if result['invalid']:
+                QMessageBox.critical(self, "Données invalides", result['error'])
+            else:
+                QMessageBox.critical(self, "Erreur de chargement", result['error'])
+            return
         
-        progress.setValue(70)
+        self.results_widget.clear()
+        self.solution = None
+        self.solution_history.clear()
+        self.current_file = None
+        self.graph_widget.begin_load(result['prepared'])
+        # Après begin_load : le remplacement du graphe peut signaler
+        # l'annulation d'un affichage précédent
+        self.loading_result = result
+    
+    def release_load_worker(self):
+        """Libère un worker de chargement une fois son thread terminé"""
+        worker = self.sender()
+        worker.wait()
+        self.load_threads.discard(worker)
+    
+    def on_graph_load_progress(self, done, total):
+        """Progression de l'affichage du graphe"""
+        if total:
+            self.load_progress.setValue(50 + 50 * done // total)
+        self.statusBar().showMessage(f"📂 Affichage du graphe... {done}/{total}")
+    
+    def on_graph_load_finished(self, completed):
+        """Fin (ou annulation) de l'affichage progressif"""
+        result, self.loading_result = self.loading_result, None
+        self.hide_load_progress()
+        
+        if not completed:
+            # Graphe partiel effacé : l'éditeur repart d'un graphe vide
+            self.saved_generation = self.generation
+            self.update_file_label()
+            self.statusBar().showMessage("Chargement annulé")
+            return
         
-        if not is_valid:
-            progress.close()
-            QMessageBox.critical(self, "Données invalides", error_msg)
+        if result is None:
+            # Chargement direct (load_graph_data) : rien d'autre à appliquer
             return
         
-        # Charger le graphe dans l'interface
-        try:
-            self.graph_widget.load_graph_data(graph_data)
-            self.params_widget.update_from_graph(graph_data)
-            
-            # Charger les paramètres
-            parameters = result.get('parameters', {})
-            if parameters:
-                self.params_widget.set_parameters(parameters)
-            
-            # Charger la solution si elle existe
-            solution = result.get('solution')
-            if solution:
-                self.solution = solution
-                self.results_widget.display_solution(solution)
-                self.graph_widget.highlight_solution(solution.get('selected_vertices', []))
-            
-            # Mettre à jour l'état
-            self.current_file = filename
-            self.file_label.setText(os.path.basename(filename))
-            
-            metadata = result.get('metadata', {})
-            save_date = metadata.get('save_date', 'Date inconnue')
-            
-            progress.setValue(100)
-            progress.close()
-            
-            self.statusBar().showMessage(
-                f"Fichier chargé : {os.path.basename(filename)} • "
-                f"{len(graph_data['vertices'])} sommets, {len(graph_data['edges'])} arêtes"
-            )
-            
-            # Afficher un message d'information
-            QMessageBox.information(
-                self,
-                "Fichier chargé",
-                f"<b>{os.path.basename(filename)}</b><br><br>"
-                f"• {len(graph_data['vertices'])} sommets<br>"
-                f"• {len(graph_data['edges'])} arêtes<br>"
-                f"• Sauvegardé le : {save_date[:10] if 'T' in save_date else save_date}"
-            )
-            
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                "Erreur d'affichage",
-                f"Impossible d'afficher le graphe : {str(e)}"
-            )
+        filename = result['filename']
+        graph_data = result['graph_data']
+        report = result['report']
+        
+        # Charger les paramètres ; les coûts et types par sommet sont aussi
+        # appliqués au graphe, que lisent les modifications groupées
+        parameters = result.get('parameters', {})
+        if parameters:
+            self.params_widget.set_parameters(parameters)
+            if parameters.get('vertices'):
+                ids, costs, types = self.params_widget.costs_model.arrays()
+                self.graph_widget.set_vertex_values(ids, costs, [VERTEX_TYPES[t] for t in types.tolist()])
+                # Émis maintenant : ne compte pas comme une modification non sauvegardée
+                self.graph_widget.flush_changes()
+        
+        # Charger la solution si elle existe
+        solution = result.get('solution')
+        if solution:
+            self.solution = solution
+            prepared = result['prepared']
+            graph = prepared['graph'] if prepared['large'] else Graph.from_graph_data(graph_data)
+            self.results_widget.display_solution(solution, graph)
+            self.graph_widget.highlight_solution(solution.get('selected_vertices', []))
+            self.add_to_history(solution.get('selected_vertices', []))
+        
+        # Mettre à jour l'état ; des positions calculées à la lecture ne
+        # sont pas encore dans le fichier
+        laid_out = result.get('laid_out', 0)
+        self.current_file = filename
+        self.saved_generation = self.generation - 1 if laid_out else self.generation
+        self.update_file_label()
+        
+        metadata = result.get('metadata', {})
+        save_date = metadata.get('save_date', 'Date inconnue')
+        
+        warnings_info = ""
+        warnings_html = ""
+        if report['warnings']:
+            warnings_info = f" • {len(report['warnings'])} avertissement(s)"
+            warnings_html = "<br><br>" + format_validation_report(report).replace("\n", "<br>")
+        if laid_out:
+            warnings_info += f" • {laid_out} sommet(s) disposé(s) automatiquement"
+        self.statusBar().showMessage(
+            f"Fichier chargé : {os.path.basename(filename)} • "
+            f"{len(graph_data['vertices'])} sommets, {len(graph_data['edges'])} arêtes"
+            f"{warnings_info}"
+        )
+        
+        # Afficher un message d'information
+        QMessageBox.information(
+            self,
+            "Fichier chargé",
+            f"<b>{os.path.basename(filename)}</b><br><br>"
+            f"• {len(graph_data['vertices'])} sommets<br>"
+            f"• {len(graph_data['edges'])} arêtes<br>"
+            f"• Sauvegardé le : {save_date[:10] if 'T' in save_date else save_date}"
+            f"{warnings_html}"
+        )
     
     def save_graph(self):
         """Sauvegarde le graphe dans le fichier courant"""
@@ -335,49 +489,155 @@ class MainWindow(QMainWindow):
         
         return self._save_to_file(filename)
     
-    def _save_to_file(self, filename):
-        """Sauvegarde dans un fichier spécifique"""
-        if not self.graph_data:
-            QMessageBox.warning(self, "Avertissement", "Aucun graphe à sauvegarder.")
+    def _save_to_file(self, filename, autosave=False):
+        """Sauvegarde dans un fichier spécifique (en arrière-plan)"""
+        if self.graph_widget.is_loading():
+            if not autosave:
+                self.statusBar().showMessage("Chargement du graphe en cours...")
             return False
         
-        # Récupérer les données actuelles
-        graph_data = self.graph_widget.get_graph_data()
-        parameters = self.params_widget.get_parameters()
-        
-        # Afficher une boîte de progression
-        progress = QProgressDialog("Sauvegarde en cours...", "Annuler", 0, 100, self)
-        progress.setWindowTitle("Sauvegarde")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setValue(30)
-        
-        # Sauvegarder
-        result = save_graph_to_file(graph_data, parameters, self.solution, filename)
-        
-        progress.setValue(80)
-        
-        if not result['success']:
-            progress.close()
-            QMessageBox.critical(self, "Erreur de sauvegarde", result['error'])
+        if self.graph_widget.is_empty():
+            if not autosave:
+                QMessageBox.warning(self, "Avertissement", "Aucun graphe à sauvegarder.")
             return False
         
-        # Mettre à jour l'état
-        self.current_file = filename
-        self.file_label.setText(os.path.basename(filename))
+        return self.start_write('graph', filename, self.take_snapshot(), self.generation, autosave)
+    
+    def take_snapshot(self):
+        """
+        Prend un instantané des données à écrire.
+        
+        Les structures retournées sont construites pour l'occasion : le thread
+        d'écriture ne partage rien avec l'éditeur, qui reste modifiable.
+        """
+        # Appliquer les modifications en attente (met à jour la génération)
+        self.graph_widget.flush_changes()
+        return {
+            'graph_data': self.graph_widget.get_graph_data(),
+            'parameters': self.params_widget.get_parameters(),
+            'solution': dict(self.solution) if self.solution else None
+        }
+    
+    def start_write(self, kind, filename, snapshot, generation, autosave=False):
+        """Lance l'écriture d'un fichier dans un thread séparé"""
+        if self.save_worker and self.save_worker.isRunning():
+            if autosave:
+                return False
+            # Une seule écriture en attente : la demande la plus récente
+            self.pending_save = (kind, filename, snapshot, generation)
+            self.statusBar().showMessage("Écriture en attente de la précédente...")
+            return True
+        
+        self.save_worker = SaveWorker(kind, filename, snapshot, generation, autosave)
+        self.save_worker.progress.connect(self.on_save_progress)
+        self.save_worker.done.connect(self.on_save_finished)
+        # L'écriture en attente n'est lancée qu'une fois le thread terminé
+        self.save_worker.finished.connect(self.start_pending_save)
+        
+        self.save_progress.setValue(0)
+        self.save_progress.setVisible(True)
+        self.save_worker.start()
+        return True
+    
+    def on_save_progress(self, progress, message):
+        """Mise à jour de la progression de l'écriture"""
+        self.save_progress.setValue(progress)
+        self.statusBar().showMessage(f"💾 {message}")
+    
+    def on_save_finished(self, result):
+        """Fin d'une écriture en arrière-plan"""
+        self.save_progress.setVisible(False)
         
-        progress.setValue(100)
-        progress.close()
+        kind = result['kind']
+        basename = os.path.basename(result.get('filename') or '')
         
-        self.statusBar().showMessage(f"Fichier sauvegardé : {os.path.basename(filename)}")
+        if not result['success']:
+            if result['autosave']:
+                self.statusBar().showMessage(f"❌ Échec de la sauvegarde automatique : {result['error']}")
+            else:
+                title = "Erreur de sauvegarde" if kind == 'graph' else "Erreur d'export"
+                QMessageBox.critical(self, title, result['error'])
         
-        # Afficher un message de confirmation
-        QMessageBox.information(
-            self,
-            "Sauvegarde réussie",
-            f"Le graphe a été sauvegardé dans :<br><b>{os.path.basename(filename)}</b>"
-        )
+        elif kind == 'graph':
+            # Mettre à jour l'état
+            self.current_file = result['filename']
+            self.saved_generation = result['generation']
+            self.update_file_label()
+            
+            if result['autosave']:
+                self.statusBar().showMessage(
+                    f"Sauvegarde automatique : {basename} ({datetime.now().strftime('%H:%M:%S')})"
+                )
+            else:
+                self.statusBar().showMessage(f"Fichier sauvegardé : {basename}")
+                
+                # Afficher un message de confirmation
+                QMessageBox.information(
+                    self,
+                    "Sauvegarde réussie",
+                    f"Le graphe a été sauvegardé dans :<br><b>{basename}</b>"
+                )
+        
+        elif kind == 'json':
+            self.statusBar().showMessage(f"Solution exportée en JSON : {basename}")
+            
+            QMessageBox.information(
+                self,
+                "Export réussi",
+                f"La solution a été exportée dans :<br><b>{basename}</b>"
+            )
         
-        return True
+        else:
+            self.statusBar().showMessage(f"Rapport exporté en CSV : {basename}")
+            
+            QMessageBox.information(
+                self,
+                "Export réussi",
+                f"Le rapport a été exporté dans :<br><b>{basename}</b>"
+            )
+    
+    def start_pending_save(self):
+        """Lance l'écriture en attente, après la fin du thread de la précédente"""
+        if self.sender() is not self.save_worker or not self.pending_save:
+            return
+        # finished est émis juste avant la fin effective du thread
+        self.save_worker.wait()
+        kind, filename, snapshot, generation = self.pending_save
+        self.pending_save = None
+        self.start_write(kind, filename, snapshot, generation)
+    
+    def toggle_autosave(self, enabled):
+        """Active ou désactive la sauvegarde automatique"""
+        if enabled:
+            self.autosave_timer.start()
+            self.statusBar().showMessage("Sauvegarde automatique activée")
+        else:
+            self.autosave_timer.stop()
+            self.statusBar().showMessage("Sauvegarde automatique désactivée")
+    
+    def autosave(self):
+        """Sauvegarde automatique, uniquement si le graphe a changé"""
+        if not self.current_file or not self.is_modified():
+            return
+        self._save_to_file(self.current_file, autosave=True)
+    
+    def closeEvent(self, event):
+        """Termine les écritures en cours avant de fermer la fenêtre"""
+        for worker in list(self.load_threads):
+            if worker.isRunning():
+                worker.requestInterruption()
+                worker.wait()
+        
+        if self.save_worker and self.save_worker.isRunning():
+            self.statusBar().showMessage("Finalisation de l'écriture en cours...")
+            self.save_worker.wait()
+        
+        if self.pending_save:
+            kind, filename, snapshot, generation = self.pending_save
+            self.pending_save = None
+            SaveWorker(kind, filename, snapshot, generation).run()
+        
+        super().closeEvent(event)
     
     def export_solution_json(self):
         """Exporte la solution en JSON"""
@@ -397,35 +657,8 @@ class MainWindow(QMainWindow):
         if not filename:
             return
         
-        # Afficher une boîte de progression
-        progress = QProgressDialog("Export en cours...", "Annuler", 0, 100, self)
-        progress.setWindowTitle("Export JSON")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setValue(30)
-        
-        # Exporter
-        graph_data = self.graph_widget.get_graph_data()
-        parameters = self.params_widget.get_parameters()
-        
-        result = export_solution_to_json(self.solution, graph_data, parameters, filename)
-        
-        progress.setValue(80)
-        
-        if not result['success']:
-            progress.close()
-            QMessageBox.critical(self, "Erreur d'export", result['error'])
-            return
-        
-        progress.setValue(100)
-        progress.close()
-        
-        self.statusBar().showMessage(f"Solution exportée en JSON : {os.path.basename(filename)}")
-        
-        QMessageBox.information(
-            self,
-            "Export réussi",
-            f"La solution a été exportée dans :<br><b>{os.path.basename(filename)}</b>"
-        )
+        # Exporter en arrière-plan
+        self.start_write('json', filename, self.take_snapshot(), self.generation)
     
     def export_solution_csv(self):
         """Exporte la solution en CSV"""
@@ -445,36 +678,18 @@ class MainWindow(QMainWindow):
         if not filename:
             return
         
-        # Afficher une boîte de progression
-        progress = QProgressDialog("Export en cours...", "Annuler", 0, 100, self)
-        progress.setWindowTitle("Export CSV")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setValue(30)
-        
-        # Exporter
-        result = export_solution_to_csv(self.solution, filename)
-        
-        progress.setValue(80)
-        
-        if not result['success']:
-            progress.close()
-            QMessageBox.critical(self, "Erreur d'export", result['error'])
-            return
-        
-        progress.setValue(100)
-        progress.close()
-        
-        self.statusBar().showMessage(f"Rapport exporté en CSV : {os.path.basename(filename)}")
-        
-        QMessageBox.information(
-            self,
-            "Export réussi",
-            f"Le rapport a été exporté dans :<br><b>{os.path.basename(filename)}</b>"
-        )
+        # Exporter en arrière-plan (seule la solution est nécessaire)
+        snapshot = {'solution': dict(self.solution)}
+        self.start_write('csv', filename, snapshot, self.generation)
     
     def solve_problem(self):
         """Résout le problème de couverture de sommets"""
-        # Récupérer les données du graphe
+        if self.graph_widget.is_loading():
+            self.statusBar().showMessage("Chargement du graphe en cours...")
+            return
+        
+        # Récupérer les données du graphe (instantané complet)
+        self.graph_widget.flush_changes()
         graph_data = self.graph_widget.get_graph_data()
         
         # Récupérer les paramètres
@@ -511,6 +726,8 @@ class MainWindow(QMainWindow):
         self.solver_worker.finished.connect(self.on_solver_finished)
         self.solver_worker.error.connect(self.on_solver_error)
         self.solver_worker.progress.connect(self.on_solver_progress)
+        # Solutions améliorantes affichées au fil de la résolution
+        self.solver_worker.incumbent.connect(self.graph_widget.queue_solution)
         
         # Lancer le worker
         self.solver_worker.start()
@@ -530,19 +747,22 @@ class MainWindow(QMainWindow):
         # Afficher les résultats
         status = solution['status']
         
-        if status in ['optimal', 'suboptimal']:
-            self.results_widget.display_solution(solution)
+        if status in ['optimal', 'suboptimal', 'heuristic']:
+            self.results_widget.display_solution(solution, self.solver_worker.graph)
             self.graph_widget.highlight_solution(solution['selected_vertices'])
+            self.add_to_history(solution['selected_vertices'])
             
             # Message selon le statut
             if status == 'optimal':
                 prefix = "✅ Solution OPTIMALE"
+            elif status == 'heuristic':
+                prefix = "🔎 Solution HEURISTIQUE"
             else:
                 prefix = "⚠️ Solution SOUS-OPTIMALE"
             
-            # Informations supplémentaires
+            # Informations supplémentaires (pas de gap pour une solution gloutonne)
             gap_info = ""
-            if 'gap' in solution and solution['gap'] > 0:
+            if solution.get('gap'):
                 gap_info = f" (Gap: {solution['gap']*100:.2f}%)"
             
             time_msg = f" en {solution.get('solve_time', 0):.2f} secondes"
@@ -579,6 +799,20 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage(f"⚠️ {solution.get('message', 'Statut inconnu')}")
             self.results_widget.display_solution(solution)
     
+    def add_to_history(self, selected_vertices):
+        """Garde une solution pour la relecture (les plus anciennes sont oubliées)"""
+        self.solution_history.append(list(selected_vertices))
+        del self.solution_history[:-SOLUTION_HISTORY]
+    
+    def replay_solutions(self):
+        """Fait défiler les dernières solutions, jusqu'à la plus récente"""
+        if not self.solution_history:
+            self.statusBar().showMessage("Aucune solution à rejouer • Résolvez d'abord le problème")
+            return
+        self.graph_widget.step_solutions(self.solution_history, SOLUTION_REPLAY_MS)
+        self.statusBar().showMessage(
+            f"🔁 Relecture de {len(self.solution_history)} solution(s)")
+    
     def on_solver_error(self, error_message):
         """Erreur pendant la résolution"""
         self.params_widget.solve_button.setEnabled(True)
@@ -1,16 +1,18 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                             QTableWidget, QTableWidgetItem, QGroupBox,
-                             QPushButton, QLabel, QSpinBox, QComboBox,
+                             QTableView, QAbstractItemView, QGroupBox,
+                             QPushButton, QLabel, QSpinBox,
                              QCheckBox, QHeaderView)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtGui import QFont
 
+from gui.cost_table_model import VertexCostModel, VertexTypeDelegate, COLUMN_TYPE
+from models.graph_delta import VERTEX_ADDED, VERTEX_REMOVED, VERTEX_CHANGED
+
 class ParametersWidget(QWidget):
     solve_clicked = pyqtSignal()
     
     def __init__(self):
         super().__init__()
-        self.graph_data = None
         self.create_ui()
     
     def create_ui(self):
@@ -38,27 +40,34 @@ class ParametersWidget(QWidget):
         self.costs_group = QGroupBox("Coûts des Sommets")
         costs_layout = QVBoxLayout()
         
-        self.costs_table = QTableWidget()
-        self.costs_table.setColumnCount(3)
-        self.costs_table.setHorizontalHeaderLabels(["Sommet", "Coût (€)", "Type"])
+        # Vue sur un modèle à tableaux : seules les lignes visibles sont dessinées
+        self.costs_model = VertexCostModel(self)
+        self.costs_table = QTableView()
+        self.costs_table.setModel(self.costs_model)
+        self.costs_table.setItemDelegateForColumn(COLUMN_TYPE, VertexTypeDelegate(self.costs_table))
+        self.costs_table.setEditTriggers(QAbstractItemView.DoubleClicked |
+                                         QAbstractItemView.SelectedClicked |
+                                         QAbstractItemView.EditKeyPressed)
         self.costs_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.costs_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.costs_table.verticalHeader().setDefaultSectionSize(40)
         self.costs_table.setMaximumHeight(250)
         
         # Style de la table - AMÉLIORÉ pour meilleure lisibilité
         self.costs_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 border: 2px solid #d1d5db;
                 border-radius: 6px;
                 gridline-color: #e5e7eb;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px;
                 border-bottom: 1px solid #f3f4f6;
                 color: #111827;
                 font-size: 13px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #3b82f6;
                 color: white;
                 font-weight: bold;
@@ -72,7 +81,7 @@ class ParametersWidget(QWidget):
                 border-bottom: 2px solid #d1d5db;
                 color: #111827;
             }
-            QTableWidget QComboBox {
+            QTableView QComboBox {
                 font-size: 13px;
                 padding: 6px;
                 border: 1px solid #d1d5db;
@@ -80,10 +89,10 @@ class ParametersWidget(QWidget):
                 background-color: white;
                 color: #111827;
             }
-            QTableWidget QComboBox::drop-down {
+            QTableView QComboBox::drop-down {
                 border: none;
             }
-            QTableWidget QComboBox::down-arrow {
+            QTableView QComboBox::down-arrow {
                 image: none;
                 border-left: 1px solid #d1d5db;
                 padding: 0 8px;
@@ -97,7 +106,7 @@ class ParametersWidget(QWidget):
         costs_layout.addWidget(self.costs_table)
         
         # Instructions sous la table
-        instructions = QLabel("Double-cliquez sur une cellule pour modifier le coût")
+        instructions = QLabel("Double-cliquez sur une cellule pour modifier le coût ou le type")
         instructions.setStyleSheet("""
             QLabel {
                 color: #6b7280;
@@ -282,76 +291,52 @@ class ParametersWidget(QWidget):
         layout.addStretch()
     
     def update_from_graph(self, graph_data):
-        """Met à jour les paramètres depuis le graphe"""
-        self.graph_data = graph_data
-        
-        # Mettre à jour la table des coûts
-        self.costs_table.setRowCount(len(graph_data['vertices']))
-        
-        for i, vertex in enumerate(graph_data['vertices']):
-            # Sommet
-            item = QTableWidgetItem(vertex['id'])
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setFont(QFont("Segoe UI", 11, QFont.Bold))  # Police améliorée
-            self.costs_table.setItem(i, 0, item)
-            
-            # Coût
-            cost_item = QTableWidgetItem(f"{vertex.get('cost', 1.0):.2f}")
-            cost_item.setTextAlignment(Qt.AlignCenter)
-            cost_item.setFont(QFont("Segoe UI", 11))  # Police améliorée
-            self.costs_table.setItem(i, 1, cost_item)
-            
-            # Type
-            type_combo = QComboBox()
-            type_combo.addItems(["Normal", "Obligatoire", "Interdit"])
-            type_combo.setFont(QFont("Segoe UI", 11))  # Police améliorée
-            
-            # Déterminer le type actuel
-            vertex_type = vertex.get('type', 'normal')
-            if vertex_type == 'mandatory':
-                type_combo.setCurrentText("Obligatoire")
-                type_combo.setStyleSheet("""
-                    QComboBox {
-                        background-color: #fee2e2;
-                        color: #dc2626;
-                        font-weight: 500;
-                    }
-                """)
-            elif vertex_type == 'forbidden':
-                type_combo.setCurrentText("Interdit")
-                type_combo.setStyleSheet("""
-                    QComboBox {
-                        background-color: #f3f4f6;
-                        color: #6b7280;
-                        font-weight: 500;
-                    }
-                """)
-            else:
-                type_combo.setCurrentText("Normal")
-                type_combo.setStyleSheet("""
-                    QComboBox {
-                        background-color: white;
-                        color: #111827;
-                    }
-                """)
-            
-            self.costs_table.setCellWidget(i, 2, type_combo)
-            
-            # Définir une hauteur de ligne pour meilleure lisibilité
-            self.costs_table.setRowHeight(i, 40)
-        
-        # Adapter la hauteur de la table
+        """Reconstruit la table des coûts depuis le graphe complet"""
+        self.costs_model.set_vertices(graph_data['vertices'])
+        self._adjust_height()
+    
+    def update_from_arrays(self, ids, costs, types):
+        """Reconstruit la table des coûts depuis des tableaux (voir GraphWidget.vertex_arrays)"""
+        self.costs_model.set_arrays(ids, costs, types)
+        self._adjust_height()
+    
+    def apply_delta(self, delta):
+        """
+        Applique les modifications du graphe (models.graph_delta.GraphDelta)
+        à la table des coûts, sans la reconstruire.
+        """
+        removed = []
+        changed = {}
+        for event, vertex_id, data in delta.events():
+            if event == VERTEX_REMOVED:
+                removed.append(vertex_id)
+            elif event == VERTEX_ADDED:
+                self.costs_model.add_vertex(vertex_id, data.get('cost', 1.0), data.get('type', 'normal'))
+            elif event == VERTEX_CHANGED and ('cost' in data or 'type' in data):
+                changed[vertex_id] = data
+        
+        # Modifications groupées : une seule mise à jour de la table
+        if len(removed) == 1:
+            self.costs_model.remove_vertex(removed[0])
+        elif removed:
+            self.costs_model.remove_vertices(removed)
+        if len(changed) == 1:
+            (vertex_id, data), = changed.items()
+            self.costs_model.update_vertex(vertex_id, data.get('cost'), data.get('type'))
+        elif changed:
+            self.costs_model.set_vertex_parameters(changed)
+        
+        self._adjust_height()
+    
+    def _adjust_height(self):
+        """Adapte la hauteur de la table au nombre de lignes"""
         row_height = 40
         header_height = self.costs_table.horizontalHeader().height()
-        table_height = header_height + len(graph_data['vertices']) * row_height
+        table_height = header_height + self.costs_model.rowCount() * row_height
         self.costs_table.setMinimumHeight(min(250, table_height))
     
     def get_parameters(self):
         """Récupère tous les paramètres"""
-        if not self.graph_data:
-            return {}
-        
         params = {
             'budget': self.budget_spin.value() if self.budget_spin.value() > 0 else None,
             'advanced': {
@@ -360,35 +345,8 @@ class ParametersWidget(QWidget):
             }
         }
         
-        # Récupérer les coûts et types depuis la table
-        vertex_params = {}
-        for i in range(self.costs_table.rowCount()):
-            vertex_id = self.costs_table.item(i, 0).text()
-            
-            # Coût
-            cost_item = self.costs_table.item(i, 1)
-            cost = 1.0
-            if cost_item:
-                try:
-                    cost_text = cost_item.text().replace(',', '.')
-                    cost = float(cost_text)
-                except ValueError:
-                    cost = 1.0
-            
-            # Type
-            type_combo = self.costs_table.cellWidget(i, 2)
-            vertex_type = 'normal'
-            if type_combo:
-                type_text = type_combo.currentText().lower()
-                if type_text == 'obligatoire':
-                    vertex_type = 'mandatory'
-                elif type_text == 'interdit':
-                    vertex_type = 'forbidden'
-            
-            vertex_params[vertex_id] = {
-                'cost': cost,
-                'type': vertex_type
-            }
+        # Coûts et types : copie en bloc des tableaux du modèle
+        vertex_params = self.costs_model.vertex_parameters()
         
         params['vertices'] = vertex_params
         return params
@@ -405,72 +363,32 @@ class ParametersWidget(QWidget):
     
     def clear(self):
         """Réinitialise le panneau"""
-        self.costs_table.setRowCount(0)
+        self.costs_model.clear()
         self.budget_spin.setValue(0)
         self.min_cover_check.setChecked(False)
         self.redundancy_spin.setValue(1)
         self.advanced_check.setChecked(False)
         self.advanced_group.setVisible(False)
     
-        def set_parameters(self, parameters):
-            """Définit les paramètres depuis un dictionnaire"""
-            # Budget
-            budget = parameters.get('budget')
-            if budget:
-                self.budget_spin.setValue(int(budget))
-            else:
-                self.budget_spin.setValue(0)
-            
-            # Options avancées
-            advanced = parameters.get('advanced', {})
-            if advanced.get('min_cover', False):
-                self.advanced_check.setChecked(True)
-                self.min_cover_check.setChecked(True)
-                self.redundancy_spin.setValue(advanced.get('redundancy', 1))
-            else:
-                self.advanced_check.setChecked(False)
-                self.min_cover_check.setChecked(False)
-                self.redundancy_spin.setValue(1)
-            
-            # Mettre à jour les types des sommets dans la table
-            vertex_params = parameters.get('vertices', {})
-            for i in range(self.costs_table.rowCount()):
-                vertex_id = self.costs_table.item(i, 0).text()
-                if vertex_id in vertex_params:
-                    # Type
-                    type_combo = self.costs_table.cellWidget(i, 2)
-                    vertex_type = vertex_params[vertex_id].get('type', 'normal')
-                    
-                    if vertex_type == 'mandatory':
-                        type_combo.setCurrentText("Obligatoire")
-                        type_combo.setStyleSheet("""
-                            QComboBox {
-                                background-color: #fee2e2;
-                                color: #dc2626;
-                                font-weight: 500;
-                            }
-                        """)
-                    elif vertex_type == 'forbidden':
-                        type_combo.setCurrentText("Interdit")
-                        type_combo.setStyleSheet("""
-                            QComboBox {
-                                background-color: #f3f4f6;
-                                color: #6b7280;
-                                font-weight: 500;
-                            }
-                        """)
-                    else:
-                        type_combo.setCurrentText("Normal")
-                        type_combo.setStyleSheet("""
-                            QComboBox {
-                                background-color: white;
-                                color: #111827;
-                            }
-                        """)
-                    
-                    # Coût
-                    cost = vertex_params[vertex_id].get('cost', 1.0)
-                    cost_item = QTableWidgetItem(f"{cost:.2f}")
-                    cost_item.setTextAlignment(Qt.AlignCenter)
-                    cost_item.setFont(QFont("Segoe UI", 11))
-                    self.costs_table.setItem(i, 1, cost_item)
\ No newline at end of file
+    def set_parameters(self, parameters):
+        """Définit les paramètres depuis un dictionnaire"""
+        # Budget
+        budget = parameters.get('budget')
+        if budget:
+            self.budget_spin.setValue(int(budget))
+        else:
+            self.budget_spin.setValue(0)
+        
+        # Options avancées
+        advanced = parameters.get('advanced', {})
+        if advanced.get('min_cover', False):
+            self.advanced_check.setChecked(True)
+            self.min_cover_check.setChecked(True)
+            self.redundancy_spin.setValue(advanced.get('redundancy', 1))
+        else:
+            self.advanced_check.setChecked(False)
+            self.min_cover_check.setChecked(False)
+            self.redundancy_spin.setValue(1)
+        
+        # Coûts et types des sommets
+        self.costs_model.set_vertex_parameters(parameters.get('vertices', {}))
@@ -0,0 +1,262 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt5.QtGui import QColor, QFont
+import numpy as np
+
+from gui.cost_table_model import TYPE_LABELS, TYPE_COLORS
+
+VERTEX_HEADERS = ("Sommet", "Coût (€)", "Type")
+EDGE_HEADERS = ("Arête", "Critique", "Couverte par", "Statut")
+EDGE_COLUMN_EDGE, EDGE_COLUMN_CRITICAL, EDGE_COLUMN_COVER, EDGE_COLUMN_STATUS = 0, 1, 2, 3
+
+COVERED_COLOR = QColor("#059669")
+UNCOVERED_COLOR = QColor("#dc2626")
+
+
+class _SortedArrayModel(QAbstractTableModel):
+    """
+    Base des modèles de résultats : les lignes affichées sont un tableau
+    d'indices (`_rows`) dans des tableaux NumPy. Filtrer ou trier ne
+    recalcule que ce tableau ; la vue ne demande que les lignes visibles.
+    """
+
+    headers = ()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = np.empty(0, dtype=np.int64)
+        self._ids = []
+        self._id_ranks = None  # Calculés au premier tri
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._font = QFont("Segoe UI", 11)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return QVariant()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Trie les lignes affichées (appelé par la vue, en-têtes cliquables)"""
+        self._sort_column, self._sort_order = column, order
+        self.layoutAboutToBeChanged.emit()
+        self._rows = self._ordered(self._rows)
+        self.layoutChanged.emit()
+
+    def _ordered(self, rows):
+        """Indices `rows` dans l'ordre du tri courant (tri stable)"""
+        if self._sort_column < 0 or len(rows) == 0:
+            return rows
+        keys = self._sort_keys(self._sort_column, rows)
+        order = np.lexsort(keys[::-1])
+        if self._sort_order == Qt.DescendingOrder:
+            order = order[::-1]
+        return rows[order]
+
+    def _sort_keys(self, column, rows):
+        """Clés de tri des lignes, de la plus importante à la moins importante"""
+        raise NotImplementedError
+
+    def _reset_rows(self, rows):
+        self.beginResetModel()
+        self._rows = self._ordered(rows)
+        self.endResetModel()
+
+    def _ranks(self):
+        """Rang de chaque identifiant de sommet dans l'ordre alphabétique"""
+        if self._id_ranks is None:
+            ids = self._ids
+            self._id_ranks = np.empty(len(ids), dtype=np.int64)
+            order = np.argsort(np.array([str(v_id) for v_id in ids]), kind='stable')
+            self._id_ranks[order] = np.arange(len(ids))
+        return self._id_ranks
+
+
+class SelectedVerticesModel(_SortedArrayModel):
+    """Sommets sélectionnés d'une solution : identifiant, coût et type"""
+
+    headers = VERTEX_HEADERS
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._costs = np.empty(0)
+        self._types = np.empty(0, dtype=np.int8)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        i, column = int(self._rows[index.row()]), index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return str(self._ids[i])
+            if column == 1:
+                cost = self._costs[i]
+                return "?" if np.isnan(cost) else f"{cost:.2f}"
+            return TYPE_LABELS[self._types[i]]
+
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        if role == Qt.FontRole:
+            return self._font
+
+        if column == 2 and role in (Qt.BackgroundRole, Qt.ForegroundRole):
+            background, foreground = TYPE_COLORS[self._types[i]]
+            return background if role == Qt.BackgroundRole else foreground
+
+        return QVariant()
+
+    def set_vertices(self, ids, costs, types):
+        """
+        Remplace les sommets affichés.
+
+        Parameters:
+        -----------
+        ids : list
+            Identifiants des sommets sélectionnés
+        costs : ndarray
+            Coûts (NaN si inconnus)
+        types : ndarray
+            Codes de type (models.graph)
+        """
+        self._ids = list(ids)
+        self._costs = np.asarray(costs, dtype=np.float64)
+        self._types = np.asarray(types, dtype=np.int8)
+        self._id_ranks = None
+        self._reset_rows(np.arange(len(self._ids)))
+
+    def clear(self):
+        self.set_vertices([], np.empty(0), np.empty(0, dtype=np.int8))
+
+    def _sort_keys(self, column, rows):
+        ranks = self._ranks()[rows]
+        if column == 1:
+            return [self._costs[rows], ranks]
+        if column == 2:
+            return [self._types[rows], ranks]
+        return [ranks]
+
+
+class EdgeCoverageModel(_SortedArrayModel):
+    """
+    Couverture des arêtes par une solution, calculée sur les tableaux du
+    graphe (models.graph.Graph) : une arête normale est couverte par une
+    extrémité sélectionnée, une arête critique par les deux.
+
+    Filtres : arêtes non couvertes seulement, arêtes critiques seulement.
+    """
+
+    headers = EDGE_HEADERS
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._src = np.empty(0, dtype=np.int64)
+        self._dst = np.empty(0, dtype=np.int64)
+        self._critical = np.empty(0, dtype=bool)
+        self._selected = np.empty(0, dtype=bool)
+        self._count = np.empty(0, dtype=np.int8)
+        self._uncovered = np.empty(0, dtype=bool)
+
+        self.uncovered_only = False
+        self.critical_only = False
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        e, column = int(self._rows[index.row()]), index.column()
+
+        if role == Qt.DisplayRole:
+            u, v = int(self._src[e]), int(self._dst[e])
+            if column == EDGE_COLUMN_EDGE:
+                return f"{self._ids[u]} – {self._ids[v]}"
+            if column == EDGE_COLUMN_CRITICAL:
+                return "Oui" if self._critical[e] else ""
+            if column == EDGE_COLUMN_COVER:
+                covering = [str(self._ids[w]) for w in (u, v) if self._selected[w]]
+                return ", ".join(covering) if covering else "—"
+            if not self._uncovered[e]:
+                return "✅ Couverte"
+            return "❌ Non couverte" if self._count[e] == 0 else "❌ Une seule extrémité"
+
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        if role == Qt.FontRole:
+            return self._font
+
+        if role == Qt.ForegroundRole and column == EDGE_COLUMN_STATUS:
+            return UNCOVERED_COLOR if self._uncovered[e] else COVERED_COLOR
+
+        return QVariant()
+
+    def set_coverage(self, graph, selected):
+        """
+        Calcule la couverture des arêtes d'un graphe.
+
+        Parameters:
+        -----------
+        graph : Graph
+            Graphe résolu (forme tabulaire)
+        selected : ndarray de bool
+            Sommets sélectionnés, dans l'ordre de graph.vertex_ids
+        """
+        self._ids = graph.vertex_ids
+        self._src, self._dst, self._critical = graph.src, graph.dst, graph.critical
+        self._selected = np.asarray(selected, dtype=bool)
+        self._count = self._selected[self._src].astype(np.int8) + self._selected[self._dst]
+        self._uncovered = self._count < np.where(self._critical, 2, 1)
+        self._id_ranks = None
+        self._reset_rows(self._filtered())
+
+    def clear(self):
+        self._ids = []
+        self._src = self._dst = np.empty(0, dtype=np.int64)
+        self._critical = self._selected = self._uncovered = np.empty(0, dtype=bool)
+        self._count = np.empty(0, dtype=np.int8)
+        self._id_ranks = None
+        self._reset_rows(np.empty(0, dtype=np.int64))
+
+    def set_filters(self, uncovered_only=None, critical_only=None):
+        """Modifie les filtres (None : inchangé)"""
+        if uncovered_only is not None:
+            self.uncovered_only = uncovered_only
+        if critical_only is not None:
+            self.critical_only = critical_only
+        self._reset_rows(self._filtered())
+
+    def counts(self):
+        """
+        Returns:
+        --------
+        tuple : (nombre d'arêtes, non couvertes, critiques, affichées)
+        """
+        return (len(self._src), int(self._uncovered.sum()),
+                int(self._critical.sum()), len(self._rows))
+
+    def _filtered(self):
+        mask = np.ones(len(self._src), dtype=bool)
+        if self.uncovered_only:
+            mask &= self._uncovered
+        if self.critical_only:
+            mask &= self._critical
+        return np.flatnonzero(mask)
+
+    def _sort_keys(self, column, rows):
+        ranks = self._ranks()
+        edge_keys = [ranks[self._src[rows]], ranks[self._dst[rows]]]
+        if column == EDGE_COLUMN_CRITICAL:
+            return [self._critical[rows]] + edge_keys
+        if column == EDGE_COLUMN_COVER:
+            return [self._count[rows]] + edge_keys
+        if column == EDGE_COLUMN_STATUS:
+            return [self._uncovered[rows]] + edge_keys
+        return edge_keys
+
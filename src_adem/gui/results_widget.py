@@ -1,9 +1,30 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
-                             QLabel, QTextEdit, QTableWidget,
-                             QTableWidgetItem, QPushButton, QGroupBox,
-                             QHeaderView, QProgressBar)
+                             QLabel, QTableView, QPushButton, QGroupBox,
+                             QHeaderView, QCheckBox, QAbstractItemView)
 from PyQt5.QtCore import (Qt, pyqtSignal)
-import json
+import numpy as np
+
+from gui.results_models import SelectedVerticesModel, EdgeCoverageModel
+from models.graph import TYPE_NORMAL
+
+# Style commun des tables de résultats
+TABLE_STYLE = """
+    QTableView {
+        background-color: white;
+        border: 1px solid #e5e7eb;
+        border-radius: 6px;
+    }
+    QTableView::item {
+        padding: 6px;
+    }
+    QHeaderView::section {
+        background-color: #f3f4f6;
+        font-weight: 600;
+        padding: 8px;
+        border: none;
+        border-bottom: 2px solid #d1d5db;
+    }
+"""
 
 class ResultsWidget(QWidget):
     export_json_requested = pyqtSignal()
@@ -99,32 +120,11 @@ class ResultsWidget(QWidget):
         details_group = QGroupBox("Détails des Sommets Sélectionnés")
         details_layout = QVBoxLayout()
         
-        self.details_table = QTableWidget()
-        self.details_table.setColumnCount(3)
-        self.details_table.setHorizontalHeaderLabels(["Sommet", "Coût (€)", "Type"])
-        self.details_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Modèle/vue : seules les lignes visibles sont demandées au modèle
+        self.details_model = SelectedVerticesModel(self)
+        self.details_table = self._create_table(self.details_model)
         self.details_table.setMaximumHeight(150)
         
-        # Style de la table
-        self.details_table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #e5e7eb;
-                border-radius: 6px;
-            }
-            QTableWidget::item {
-                padding: 6px;
-                text-align: center;
-            }
-            QHeaderView::section {
-                background-color: #f3f4f6;
-                font-weight: 600;
-                padding: 8px;
-                border: none;
-                border-bottom: 2px solid #d1d5db;
-            }
-        """)
-        
         details_layout.addWidget(self.details_table)
         
         details_group.setLayout(details_layout)
@@ -134,20 +134,25 @@ class ResultsWidget(QWidget):
         coverage_group = QGroupBox("Couverture des Arêtes")
         coverage_layout = QVBoxLayout()
         
-        self.coverage_text = QTextEdit()
-        self.coverage_text.setReadOnly(True)
-        self.coverage_text.setMaximumHeight(120)
-        self.coverage_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #f9fafb;
-                border: 1px solid #e5e7eb;
-                border-radius: 6px;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-                padding: 8px;
-            }
-        """)
-        coverage_layout.addWidget(self.coverage_text)
+        # Filtres
+        filters_layout = QHBoxLayout()
+        self.uncovered_check = QCheckBox("Non couvertes seulement")
+        self.uncovered_check.toggled.connect(self.update_coverage_filters)
+        self.critical_check = QCheckBox("Critiques seulement")
+        self.critical_check.toggled.connect(self.update_coverage_filters)
+        filters_layout.addWidget(self.uncovered_check)
+        filters_layout.addWidget(self.critical_check)
+        filters_layout.addStretch()
+        coverage_layout.addLayout(filters_layout)
+        
+        self.coverage_label = QLabel("Aucun détail de couverture disponible.")
+        self.coverage_label.setStyleSheet("color: #6b7280; font-size: 12px;")
+        coverage_layout.addWidget(self.coverage_label)
+        
+        self.coverage_model = EdgeCoverageModel(self)
+        self.coverage_table = self._create_table(self.coverage_model)
+        self.coverage_table.setMaximumHeight(180)
+        coverage_layout.addWidget(self.coverage_table)
         
         coverage_group.setLayout(coverage_layout)
         layout.addWidget(coverage_group)
@@ -199,9 +204,37 @@ class ResultsWidget(QWidget):
         
         layout.addStretch()
     
-    def display_solution(self, solution):
-        """Affiche la solution"""
-        if solution['status'] != 'optimal':
+    def _create_table(self, model):
+        """Vue d'un modèle de résultats : triable, lignes de hauteur fixe"""
+        table = QTableView()
+        table.setModel(model)
+        # Pas de tri tant qu'aucun en-tête n'a été cliqué
+        table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        table.setSortingEnabled(True)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.verticalHeader().setVisible(False)
+        # Hauteur fixe : la vue n'a pas à mesurer chaque ligne
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(30)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setStyleSheet(TABLE_STYLE)
+        return table
+    
+    def display_solution(self, solution, graph=None):
+        """
+        Affiche la solution.
+        
+        Parameters:
+        -----------
+        solution : dict
+            Solution renvoyée par le solveur
+        graph : Graph, optionnel
+            Graphe résolu (forme tabulaire) : coûts et types des sommets
+            sélectionnés, couverture des arêtes ; sans graphe, seuls les
+            coûts de la solution sont affichés
+        """
+        if solution['status'] not in ('optimal', 'heuristic'):
             self.show_error(solution)
             return
         
@@ -214,6 +247,7 @@ class ResultsWidget(QWidget):
         # Déterminer l'icône de statut
         status_icon = {
             'optimal': '✅',
+            'heuristic': '🔎',
             'infeasible': '❌',
             'unbounded': '⚠️',
             'error': '🚫'
@@ -221,6 +255,7 @@ class ResultsWidget(QWidget):
         
         status_text = {
             'optimal': 'Solution Optimale',
+            'heuristic': 'Solution Heuristique',
             'infeasible': 'Problème Insoluble',
             'unbounded': 'Problème Non Borné',
             'error': 'Erreur'
@@ -232,42 +267,43 @@ class ResultsWidget(QWidget):
         if 'solve_time' in solution:
             self.time_label.setText(f"Temps de résolution : {solution['solve_time']:.3f} secondes")
         
-        # Détails dans la table
-        self.details_table.setRowCount(len(selected))
-        for i, vertex_id in enumerate(selected):
-            # ID du sommet
-            item_id = QTableWidgetItem(vertex_id)
-            item_id.setTextAlignment(Qt.AlignCenter)
-            self.details_table.setItem(i, 0, item_id)
-            
-            # Coût du sommet
-            cost = solution.get('detailed_costs', {}).get(vertex_id, '?')
-            item_cost = QTableWidgetItem(f"{cost}")
-            item_cost.setTextAlignment(Qt.AlignCenter)
-            self.details_table.setItem(i, 1, item_cost)
-            
-            # Type
-            item_type = QTableWidgetItem("✓ Sélectionné")
-            item_type.setTextAlignment(Qt.AlignCenter)
-            item_type.setForeground(Qt.darkGreen)
-            self.details_table.setItem(i, 2, item_type)
-        
-        # Couverture des arêtes
-        coverage_text = "Détail de la couverture des arêtes :\n"
-        coverage_text += "═" * 40 + "\n"
-        
-        if 'cover_details' in solution and solution['cover_details']:
-            for edge, covering_vertices in solution['cover_details'].items():
-                if covering_vertices:
-                    status_icon = "✅"
-                    coverage_text += f"{status_icon} {edge} → {', '.join(covering_vertices)}\n"
-                else:
-                    status_icon = "❌"
-                    coverage_text += f"{status_icon} {edge} → Non couverte\n"
+        # Détails des sommets et couverture des arêtes, sur les tableaux du graphe
+        if graph is None:
+            costs = solution.get('detailed_costs', {})
+            self.details_model.set_vertices(
+                selected,
+                np.fromiter((costs.get(v_id, np.nan) for v_id in selected),
+                            dtype=np.float64, count=len(selected)),
+                np.full(len(selected), TYPE_NORMAL, dtype=np.int8))
+            self.coverage_model.clear()
         else:
-            coverage_text += "Aucun détail de couverture disponible.\n"
-        
-        self.coverage_text.setText(coverage_text)
+            index = graph.index
+            rows = np.fromiter((index[v_id] for v_id in selected if v_id in index), dtype=np.int64)
+            self.details_model.set_vertices([graph.vertex_ids[i] for i in rows.tolist()],
+                                            graph.costs[rows], graph.types[rows])
+            mask = np.zeros(graph.num_vertices, dtype=bool)
+            mask[rows] = True
+            self.coverage_model.set_coverage(graph, mask)
+        self.update_coverage_label()
+    
+    def update_coverage_filters(self):
+        """Applique les filtres de la couverture (cases à cocher)"""
+        self.coverage_model.set_filters(uncovered_only=self.uncovered_check.isChecked(),
+                                        critical_only=self.critical_check.isChecked())
+        self.update_coverage_label()
+    
+    def update_coverage_label(self, message=None):
+        """Résumé de la couverture au-dessus de la table"""
+        total, uncovered, critical, shown = self.coverage_model.counts()
+        if message is None:
+            if total == 0:
+                message = "Aucun détail de couverture disponible."
+            else:
+                message = (f"{total} arêtes • {uncovered} non couverte(s) • "
+                           f"{critical} critique(s)")
+                if shown != total:
+                    message += f" • {shown} affichée(s)"
+        self.coverage_label.setText(message)
     
     def show_loading(self):
         """Affiche un indicateur de chargement"""
@@ -275,8 +311,9 @@ class ResultsWidget(QWidget):
         self.vertices_value.setText("--")
         self.status_value.setText("⚡ En cours...")
         self.time_label.setText("Temps de résolution : --")
-        self.details_table.setRowCount(0)
-        self.coverage_text.setText("Résolution en cours...\nVeuillez patienter.")
+        self.details_model.clear()
+        self.coverage_model.clear()
+        self.update_coverage_label("Résolution en cours... Veuillez patienter.")
     
     def show_error(self, solution):
         """Affiche un message d'erreur"""
@@ -291,8 +328,9 @@ class ResultsWidget(QWidget):
         
         self.status_value.setText(f"{status_icon} {solution['status']}")
         self.time_label.setText("Temps de résolution : --")
-        self.details_table.setRowCount(0)
-        self.coverage_text.setText(f"Erreur : {solution.get('message', 'Inconnue')}")
+        self.details_model.clear()
+        self.coverage_model.clear()
+        self.update_coverage_label(f"Erreur : {solution.get('message', 'Inconnue')}")
     
     def clear(self):
         """Efface les résultats"""
@@ -300,8 +338,9 @@ class ResultsWidget(QWidget):
         self.vertices_value.setText("--")
         self.status_value.setText("--")
         self.time_label.setText("Temps de résolution : --")
-        self.details_table.setRowCount(0)
-        self.coverage_text.clear()
+        self.details_model.clear()
+        self.coverage_model.clear()
+        self.update_coverage_label()
     
     def export_json(self):
         """Exporte les résultats en JSON"""
@@ -0,0 +1,71 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from utils.file_io import save_graph_to_file, export_solution_to_json, export_solution_to_csv
+
+
+class SaveWorker(QThread):
+    """
+    Worker pour écrire un fichier (sauvegarde ou export) dans un thread séparé.
+
+    Le worker ne travaille que sur un instantané des données pris par le
+    thread GUI au moment de la demande : l'éditeur peut continuer à
+    modifier le graphe pendant l'écriture.
+    """
+
+    # Signaux (done : résultat de l'écriture, émis depuis run() ; le signal
+    # finished de QThread n'est émis qu'une fois le thread terminé)
+    done = pyqtSignal(dict)
+    progress = pyqtSignal(int, str)  # Progression et message
+
+    def __init__(self, kind, filename, snapshot, generation=0, autosave=False):
+        """
+        Parameters:
+        -----------
+        kind : str
+            'graph' (sauvegarde), 'json' ou 'csv' (export de la solution)
+        filename : str
+            Fichier de destination
+        snapshot : dict
+            Instantané {'graph_data', 'parameters', 'solution'}
+        generation : int
+            Génération du graphe correspondant à l'instantané
+        autosave : bool
+            Vrai si la demande vient de la sauvegarde automatique
+        """
+        super().__init__()
+        self.kind = kind
+        self.filename = filename
+        self.snapshot = snapshot
+        self.generation = generation
+        self.autosave = autosave
+
+    def run(self):
+        """Écrit le fichier dans le thread"""
+        self.progress.emit(10, "Préparation des données...")
+
+        graph_data = self.snapshot.get('graph_data')
+        parameters = self.snapshot.get('parameters')
+        solution = self.snapshot.get('solution')
+
+        try:
+            self.progress.emit(40, "Écriture du fichier...")
+            if self.kind == 'graph':
+                result = save_graph_to_file(graph_data, parameters, solution, self.filename)
+            elif self.kind == 'json':
+                result = export_solution_to_json(solution, graph_data, parameters, self.filename)
+            elif self.kind == 'csv':
+                result = export_solution_to_csv(solution, self.filename)
+            else:
+                result = {'success': False, 'error': f"Type d'écriture inconnu : {self.kind}"}
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+
+        # Les fonctions d'écriture peuvent ajouter l'extension .json
+        result.setdefault('filename', self.filename)
+        result.pop('data', None)
+        result['kind'] = self.kind
+        result['generation'] = self.generation
+        result['autosave'] = self.autosave
+
+        self.progress.emit(100, "Terminé")
+        self.done.emit(result)
@@ -0,0 +1,67 @@
+from PyQt5.QtWidgets import (QDialog, QFormLayout, QDoubleSpinBox, QSpinBox,
+                             QComboBox, QDialogButtonBox)
+
+from gui.cost_table_model import TYPE_LABELS
+from models.graph import VERTEX_TYPES
+
+# Valeur spéciale du coût maximal (toute valeur négative) : pas de limite
+NO_LIMIT = -1
+
+
+class SelectionRuleDialog(QDialog):
+    """
+    Règle de sélection de sommets : intervalle de coût, type et degré
+    minimal. Les critères sont combinés (et logique).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Sélection par règle")
+
+        layout = QFormLayout(self)
+
+        self.min_cost_spin = QDoubleSpinBox()
+        self.min_cost_spin.setRange(0, 1e9)
+        self.min_cost_spin.setDecimals(2)
+        self.min_cost_spin.setSuffix(" €")
+        layout.addRow("Coût minimal :", self.min_cost_spin)
+
+        # Valeur minimale NO_LIMIT : pas de coût maximal (0 sélectionne les
+        # sommets gratuits)
+        self.max_cost_spin = QDoubleSpinBox()
+        self.max_cost_spin.setRange(NO_LIMIT, 1e9)
+        self.max_cost_spin.setDecimals(2)
+        self.max_cost_spin.setSuffix(" €")
+        self.max_cost_spin.setSpecialValueText("Sans limite")
+        self.max_cost_spin.setValue(NO_LIMIT)
+        layout.addRow("Coût maximal :", self.max_cost_spin)
+
+        self.type_combo = QComboBox()
+        self.type_combo.addItem("Tous")
+        self.type_combo.addItems(TYPE_LABELS)
+        layout.addRow("Type :", self.type_combo)
+
+        self.min_degree_spin = QSpinBox()
+        self.min_degree_spin.setRange(0, 1000000)
+        layout.addRow("Degré minimal :", self.min_degree_spin)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+    def rule(self):
+        """
+        Critères saisis, au format des arguments de GraphWidget.select_by_rule
+
+        Returns:
+        --------
+        dict : min_cost, max_cost, vertex_type, min_degree (None : pas de critère)
+        """
+        type_index = self.type_combo.currentIndex()
+        return {
+            'min_cost': self.min_cost_spin.value() or None,
+            'max_cost': self.max_cost_spin.value() if self.max_cost_spin.value() >= 0 else None,
+            'vertex_type': VERTEX_TYPES[type_index - 1] if type_index > 0 else None,
+            'min_degree': self.min_degree_spin.value() or None
+        }
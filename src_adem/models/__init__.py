@@ -2,7 +2,7 @@
 Module models pour l'application de surveillance
 """
 
-from .data_models import SurveillanceNode, Edge, SolutionResult
 from .graph import Graph
+from .data_models import SolutionResult
 
-__all__ = ['SurveillanceNode', 'Edge', 'SolutionResult', 'Graph']
+__all__ = ['Graph', 'SolutionResult']
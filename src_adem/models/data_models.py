@@ -0,0 +1,215 @@
+import base64
+
+import numpy as np
+
+# Nombre de bits à 1 pour chaque octet (popcount par table)
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Champs volumineux d'une solution, reconstruits depuis le bitset
+_EXPANDED_KEYS = ('selected_vertices', 'detailed_costs', 'cover_details')
+
+
+class SolutionResult:
+    """
+    Représentation compacte d'une solution : un bitset sur l'index des
+    sommets du graphe (ordre de graph.vertex_ids) et ses métadonnées
+    (statut, coût, temps, gap, message...).
+
+    Les bits sont stockés compactés (8 sommets par octet), ce qui permet de
+    conserver des milliers de solutions et de les comparer par opérations
+    bit à bit.
+    """
+
+    def __init__(self, bits, num_vertices, metadata=None):
+        self.bits = np.asarray(bits, dtype=np.uint8)
+        self.num_vertices = int(num_vertices)
+        self.metadata = dict(metadata or {})
+
+        if len(self.bits) != (self.num_vertices + 7) // 8:
+            raise ValueError(
+                f"Bitset de {len(self.bits)} octets incompatible avec {self.num_vertices} sommets"
+            )
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_mask(cls, mask, metadata=None):
+        """Construit la solution depuis un masque booléen sur les sommets"""
+        mask = np.asarray(mask, dtype=bool)
+        return cls(np.packbits(mask), len(mask), metadata)
+
+    @classmethod
+    def from_solution(cls, solution, graph):
+        """
+        Construit la solution compacte depuis le dict retourné par les solveurs.
+
+        Parameters:
+        -----------
+        solution : dict
+            Solution au format des solveurs (selected_vertices, total_cost...)
+        graph : models.graph.Graph
+            Graphe dont l'index des sommets définit l'ordre des bits. Les
+            sommets sélectionnés absents du graphe sont listés dans
+            'dropped_vertices' et total_cost est alors recalculé (la valeur
+            du solveur est conservée dans 'solver_total_cost').
+        """
+        mask = np.zeros(graph.num_vertices, dtype=bool)
+        index = graph.index
+        selected_ids = solution.get('selected_vertices', [])
+        selected = [index[v_id] for v_id in selected_ids if v_id in index]
+        mask[selected] = True
+
+        metadata = {k: v for k, v in solution.items() if k not in _EXPANDED_KEYS}
+        dropped = [v_id for v_id in selected_ids if v_id not in index]
+        if dropped:
+            # Sommets supprimés du graphe depuis la résolution : le coût est
+            # recalculé sur les sommets conservés (cohérent avec detailed_costs)
+            # et les sommets retirés sont conservés dans les métadonnées
+            metadata['dropped_vertices'] = list(metadata.get('dropped_vertices', [])) + dropped
+            _set_total_cost(metadata, float(graph.costs[mask].sum()))
+        return cls.from_mask(mask, metadata)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruit la solution depuis sa forme JSON (bits en base64)"""
+        bits = np.frombuffer(base64.b64decode(data['bits']), dtype=np.uint8)
+        metadata = {k: v for k, v in data.items() if k not in ('format', 'bits', 'num_vertices')}
+        return cls(bits, data['num_vertices'], metadata)
+
+    # ------------------------------------------------------------------
+    # Accès
+    # ------------------------------------------------------------------
+    @property
+    def mask(self):
+        """Masque booléen des sommets sélectionnés"""
+        return np.unpackbits(self.bits, count=self.num_vertices).astype(bool)
+
+    @property
+    def num_selected(self):
+        return int(_POPCOUNT[self.bits].sum())
+
+    def selected_indices(self):
+        """Indices des sommets sélectionnés"""
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.num_vertices))
+
+    def selected_vertices(self, graph):
+        """Identifiants des sommets sélectionnés"""
+        ids = graph.vertex_ids
+        return [ids[i] for i in self.selected_indices().tolist()]
+
+    # ------------------------------------------------------------------
+    # Opérations rapides
+    # ------------------------------------------------------------------
+    def diff(self, other):
+        """
+        Compare deux solutions.
+
+        Returns:
+        --------
+        tuple : (retirés, ajoutés) - indices des sommets présents uniquement
+                dans self, puis uniquement dans other
+        """
+        self._check_compatible(other)
+        removed = np.unpackbits(self.bits & ~other.bits, count=self.num_vertices)
+        added = np.unpackbits(other.bits & ~self.bits, count=self.num_vertices)
+        return np.flatnonzero(removed), np.flatnonzero(added)
+
+    def intersection(self, other):
+        """Sommets sélectionnés dans les deux solutions"""
+        self._check_compatible(other)
+        return SolutionResult(self.bits & other.bits, self.num_vertices)
+
+    def union(self, other):
+        """Sommets sélectionnés dans au moins une des deux solutions"""
+        self._check_compatible(other)
+        return SolutionResult(self.bits | other.bits, self.num_vertices)
+
+    def hamming(self, other):
+        """Nombre de sommets dont la sélection diffère entre les deux solutions"""
+        self._check_compatible(other)
+        return int(_POPCOUNT[self.bits ^ other.bits].sum())
+
+    def recompute_cost(self, graph):
+        """Recalcule le coût total avec les coûts actuels du graphe"""
+        self._check_graph(graph)
+        return float(graph.costs[self.mask].sum())
+
+    def uncovered_edges(self, graph):
+        """
+        Indices des arêtes non couvertes : aucune extrémité sélectionnée
+        (ou pas les deux pour une arête critique).
+        """
+        self._check_graph(graph)
+        mask = self.mask
+        src_in = mask[graph.src]
+        dst_in = mask[graph.dst]
+        covered = np.where(graph.critical, src_in & dst_in, src_in | dst_in)
+        return np.flatnonzero(~covered)
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+    def to_dict(self):
+        """Forme JSON compacte (bits encodés en base64)"""
+        data = dict(self.metadata)
+        data.update({
+            'format': 'bitmask',
+            'num_vertices': self.num_vertices,
+            'bits': base64.b64encode(self.bits.tobytes()).decode('ascii')
+        })
+        return data
+
+    def to_solution(self, graph):
+        """
+        Reconstruit le dict complet attendu par l'interface et les exports.
+
+        total_cost est recalculé avec les coûts actuels du graphe, comme
+        detailed_costs : si les coûts ont été modifiés depuis la résolution,
+        la valeur du solveur est conservée dans 'solver_total_cost'.
+        """
+        self._check_graph(graph)
+        mask = self.mask
+        ids = graph.vertex_ids
+        selected = self.selected_indices().tolist()
+
+        cover_details = {}
+        for u, v, u_in, v_in in zip(graph.src.tolist(), graph.dst.tolist(),
+                                    mask[graph.src].tolist(), mask[graph.dst].tolist()):
+            covering = []
+            if u_in:
+                covering.append(ids[u])
+            if v_in:
+                covering.append(ids[v])
+            cover_details[f"{ids[u]}-{ids[v]}"] = covering
+
+        solution = dict(self.metadata)
+        _set_total_cost(solution, float(graph.costs[mask].sum()))
+        solution.update({
+            'selected_vertices': [ids[i] for i in selected],
+            'detailed_costs': {ids[i]: float(graph.costs[i]) for i in selected},
+            'cover_details': cover_details,
+            'num_selected': len(selected)
+        })
+        return solution
+
+    def _check_compatible(self, other):
+        if self.num_vertices != other.num_vertices:
+            raise ValueError("Les solutions portent sur des graphes de tailles différentes")
+
+    def _check_graph(self, graph):
+        if self.num_vertices != graph.num_vertices:
+            raise ValueError(
+                f"Solution sur {self.num_vertices} sommets, graphe de {graph.num_vertices} sommets"
+            )
+
+
+def _set_total_cost(metadata, total_cost):
+    """
+    Remplace total_cost par le coût recalculé, en conservant la valeur
+    d'origine du solveur dans 'solver_total_cost' si elle diffère.
+    """
+    original = metadata.get('total_cost')
+    if original is not None and 'solver_total_cost' not in metadata and not np.isclose(original, total_cost):
+        metadata['solver_total_cost'] = original
+    metadata['total_cost'] = total_cost
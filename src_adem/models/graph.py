@@ -0,0 +1,140 @@
+import numpy as np
+
+# Codes des types de sommets dans la forme tabulaire
+VERTEX_TYPES = ('normal', 'mandatory', 'forbidden')
+TYPE_NORMAL, TYPE_MANDATORY, TYPE_FORBIDDEN = 0, 1, 2
+
+# 'selected_solution' était un état d'affichage de l'éditeur qui a pu se
+# retrouver dans d'anciens fichiers sauvegardés : il est traité comme 'normal'
+TYPE_CODES = {
+    'normal': TYPE_NORMAL,
+    'selected_solution': TYPE_NORMAL,
+    'mandatory': TYPE_MANDATORY,
+    'forbidden': TYPE_FORBIDDEN
+}
+
+
+class Graph:
+    """
+    Forme tabulaire (tableaux NumPy) d'un graphe de surveillance.
+
+    Les sommets sont indexés de 0 à n-1 dans l'ordre de `vertex_ids`,
+    les arêtes sont stockées sous forme de deux tableaux d'indices.
+    """
+
+    def __init__(self, vertex_ids, costs, types, src, dst, critical, x=None, y=None):
+        self.vertex_ids = list(vertex_ids)
+        n = len(self.vertex_ids)
+
+        self.costs = np.asarray(costs, dtype=np.float64)
+        self.types = np.asarray(types, dtype=np.int8)
+        self.src = np.asarray(src, dtype=np.int64)
+        self.dst = np.asarray(dst, dtype=np.int64)
+        self.critical = np.asarray(critical, dtype=bool)
+
+        # Coordonnées (NaN si absentes)
+        self.x = np.full(n, np.nan) if x is None else np.asarray(x, dtype=np.float64)
+        self.y = np.full(n, np.nan) if y is None else np.asarray(y, dtype=np.float64)
+
+        self._index = None
+
+    @property
+    def num_vertices(self):
+        return len(self.vertex_ids)
+
+    @property
+    def num_edges(self):
+        return len(self.src)
+
+    @property
+    def index(self):
+        """Dictionnaire id -> indice (construit à la demande)"""
+        if self._index is None:
+            self._index = {v_id: i for i, v_id in enumerate(self.vertex_ids)}
+        return self._index
+
+    @classmethod
+    def from_graph_data(cls, graph_data):
+        """
+        Construit la forme tabulaire depuis le format dict de l'application.
+
+        Les données doivent être valides (voir utils.validation.validate_graph).
+        """
+        vertices = graph_data.get('vertices', [])
+        edges = graph_data.get('edges', [])
+        n = len(vertices)
+        m = len(edges)
+
+        vertex_ids = [v['id'] for v in vertices]
+        costs = np.fromiter((v.get('cost', 1.0) for v in vertices), dtype=np.float64, count=n)
+        types = np.fromiter((TYPE_CODES.get(v.get('type', 'normal'), TYPE_NORMAL) for v in vertices),
+                            dtype=np.int8, count=n)
+        x = np.fromiter((_coordinate(v.get('x')) for v in vertices), dtype=np.float64, count=n)
+        y = np.fromiter((_coordinate(v.get('y')) for v in vertices), dtype=np.float64, count=n)
+
+        graph = cls(vertex_ids, costs, types,
+                    np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                    np.empty(0, dtype=bool), x, y)
+
+        index = graph.index
+        graph.src = np.fromiter(map(index.__getitem__, (e['from'] for e in edges)),
+                                dtype=np.int64, count=m)
+        graph.dst = np.fromiter(map(index.__getitem__, (e['to'] for e in edges)),
+                                dtype=np.int64, count=m)
+        graph.critical = np.fromiter((bool(e.get('critical', False)) for e in edges),
+                                     dtype=bool, count=m)
+        return graph
+
+    def without_vertices(self, removed):
+        """
+        Copie du graphe sans certains sommets ni leurs arêtes.
+
+        Parameters:
+        -----------
+        removed : ndarray de bool
+            Sommets à retirer
+
+        Returns:
+        --------
+        Graph : graphe réindexé
+        """
+        keep = ~np.asarray(removed, dtype=bool)
+        new_index = np.cumsum(keep) - 1
+        kept_edges = keep[self.src] & keep[self.dst]
+        ids = self.vertex_ids
+        return Graph([ids[i] for i in np.flatnonzero(keep).tolist()],
+                     self.costs[keep], self.types[keep],
+                     new_index[self.src[kept_edges]], new_index[self.dst[kept_edges]],
+                     self.critical[kept_edges], self.x[keep], self.y[keep])
+
+    def to_graph_data(self):
+        """Retourne le graphe au format dict de l'application"""
+        vertices_list = []
+        for i, v_id in enumerate(self.vertex_ids):
+            vertex = {
+                'id': v_id,
+                'cost': float(self.costs[i]),
+                'type': VERTEX_TYPES[self.types[i]]
+            }
+            if not (np.isnan(self.x[i]) or np.isnan(self.y[i])):
+                vertex['x'] = float(self.x[i])
+                vertex['y'] = float(self.y[i])
+            vertices_list.append(vertex)
+
+        ids = self.vertex_ids
+        edges_list = [
+            {'from': ids[u], 'to': ids[v], 'critical': bool(c)}
+            for u, v, c in zip(self.src.tolist(), self.dst.tolist(), self.critical.tolist())
+        ]
+
+        return {
+            'vertices': vertices_list,
+            'edges': edges_list
+        }
+
+
+def _coordinate(value):
+    """Convertit une coordonnée en float (NaN si absente ou invalide)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return np.nan
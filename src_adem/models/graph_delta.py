@@ -0,0 +1,119 @@
+"""
+Événements de modification incrémentale du graphe.
+
+L'éditeur enregistre chaque modification dans un GraphDelta, qui fusionne
+les modifications successives d'un même élément ; le delta est émis une
+fois par tour de boucle d'événements et appliqué localement par chaque
+consommateur, sans reconstruire le graphe complet.
+"""
+
+VERTEX_ADDED = 'vertex_added'
+VERTEX_REMOVED = 'vertex_removed'
+VERTEX_CHANGED = 'vertex_changed'
+EDGE_ADDED = 'edge_added'
+EDGE_REMOVED = 'edge_removed'
+EDGE_CHANGED = 'edge_changed'
+
+_ADDED, _REMOVED, _CHANGED = 'added', 'removed', 'changed'
+
+
+class GraphDelta:
+    """
+    Ensemble fusionné de modifications du graphe.
+
+    Pour un même élément :
+    - ajout puis modification -> ajout (données fusionnées)
+    - ajout puis suppression -> rien
+    - modification puis suppression -> suppression
+    - suppression puis ajout -> modification (données complètes)
+
+    `reset` signale un remplacement complet du graphe (chargement,
+    effacement) : les consommateurs doivent alors se resynchroniser sur un
+    instantané complet, les autres modifications sont ignorées.
+    """
+
+    def __init__(self):
+        self.vertices = {}  # id -> (opération, données)
+        self.edges = {}     # (id1, id2) -> (opération, données)
+        self.reset = False
+
+    def is_empty(self):
+        return not (self.reset or self.vertices or self.edges)
+
+    def vertex_added(self, vertex_id, data):
+        self._record(self.vertices, vertex_id, _ADDED, data)
+
+    def vertex_removed(self, vertex_id):
+        self._record(self.vertices, vertex_id, _REMOVED, None)
+
+    def vertex_changed(self, vertex_id, data):
+        self._record(self.vertices, vertex_id, _CHANGED, data)
+
+    def edge_added(self, edge_key, data):
+        self._record(self.edges, edge_key, _ADDED, data)
+
+    def edge_removed(self, edge_key):
+        self._record(self.edges, edge_key, _REMOVED, None)
+
+    def edge_changed(self, edge_key, data):
+        self._record(self.edges, edge_key, _CHANGED, data)
+
+    def mark_reset(self):
+        """Remplacement complet du graphe"""
+        self.vertices.clear()
+        self.edges.clear()
+        self.reset = True
+
+    def events(self):
+        """
+        Liste des événements fusionnés.
+
+        Les suppressions d'arêtes précèdent les suppressions de sommets, et
+        les ajouts de sommets précèdent les ajouts d'arêtes, pour qu'un
+        consommateur puisse appliquer les événements dans l'ordre.
+
+        Returns:
+        --------
+        list[tuple] : (type d'événement, id ou clé d'arête, données ou None)
+        """
+        events = []
+        for key, (op, data) in self.edges.items():
+            if op == _REMOVED:
+                events.append((EDGE_REMOVED, key, None))
+        for key, (op, data) in self.vertices.items():
+            if op == _REMOVED:
+                events.append((VERTEX_REMOVED, key, None))
+        for key, (op, data) in self.vertices.items():
+            if op == _ADDED:
+                events.append((VERTEX_ADDED, key, data))
+            elif op == _CHANGED:
+                events.append((VERTEX_CHANGED, key, data))
+        for key, (op, data) in self.edges.items():
+            if op == _ADDED:
+                events.append((EDGE_ADDED, key, data))
+            elif op == _CHANGED:
+                events.append((EDGE_CHANGED, key, data))
+        return events
+
+    def _record(self, table, key, op, data):
+        if self.reset:
+            return
+
+        previous = table.get(key)
+        if previous is None:
+            table[key] = (op, dict(data) if data else None)
+            return
+
+        prev_op, prev_data = previous
+        if op == _REMOVED:
+            if prev_op == _ADDED:
+                del table[key]
+            else:
+                table[key] = (_REMOVED, None)
+        elif prev_op == _REMOVED:
+            # Élément recréé : ses données complètes remplacent l'ancien état
+            table[key] = (_CHANGED, dict(data))
+        else:
+            merged = dict(prev_data or {})
+            merged.update(data or {})
+            table[key] = (prev_op, merged)
@@ -0,0 +1,74 @@
+"""
+Résolution par lots, sans interface graphique.
+
+Exemple :
+    python solve_batch.py sites/ "archives/*.json" -o resultats --solver auto --time-limit 60
+"""
+import argparse
+import os
+import sys
+
+# Add src_adem directory to path for absolute imports
+project_dir = os.path.dirname(os.path.abspath(__file__))
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+from solver.batch import SOLVERS, collect_files, run_batch, write_summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Résout des fichiers de graphe en parallèle, sans interface graphique."
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help="Dossiers, motifs glob ou fichiers de graphe (.json)")
+    parser.add_argument('-o', '--output-dir', default='results',
+                        help="Dossier des solutions (défaut : results)")
+    parser.add_argument('--solver', choices=SOLVERS, default='auto',
+                        help="Solveur à utiliser (défaut : auto)")
+    parser.add_argument('--time-limit', type=float, default=30,
+                        help="Limite de temps par graphe en secondes (défaut : 30)")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument('--threads', type=int, default=None,
+                        help="Threads Gurobi par processus (défaut : cœurs / processus)")
+    parser.add_argument('--summary', default=None,
+                        help="Fichier CSV de synthèse (défaut : <output-dir>/summary.csv)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    files = collect_files(args.inputs)
+    if not files:
+        print("Aucun fichier de graphe trouvé.", file=sys.stderr)
+        return 2
+
+    print(f"{len(files)} fichier(s) à résoudre avec le solveur '{args.solver}'")
+
+    done = [0]
+
+    def report(row):
+        done[0] += 1
+        cost = row['total_cost']
+        cost = f"{cost:.2f}" if isinstance(cost, (int, float)) else '-'
+        print(f"[{done[0]}/{len(files)}] {os.path.basename(row['file'])} : "
+              f"{row['status']} (coût {cost})")
+
+    rows = run_batch(files, args.output_dir, args.solver, args.time_limit,
+                     args.workers, args.threads, on_result=report)
+
+    summary = args.summary or os.path.join(args.output_dir, 'summary.csv')
+    write_summary(rows, summary)
+    print(f"Synthèse écrite dans {summary}")
+
+    failed = sum(1 for row in rows if row['status'] not in ('optimal', 'suboptimal', 'heuristic'))
+    if failed:
+        print(f"{failed} fichier(s) sans solution", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
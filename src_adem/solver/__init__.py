@@ -3,6 +3,16 @@ Module solveur pour l'application de surveillance
 """
 
 from .vertex_cover_solver import VertexCoverSolver
-from .worker import SolverWorker
+from .greedy_solver import GreedyVertexCoverSolver
 
-__all__ = ['VertexCoverSolver', 'SolverWorker']
\ No newline at end of file
+
+def __getattr__(name):
+    # SolverWorker dépend de PyQt5 : importé seulement à la demande pour que
+    # le solveur reste utilisable sans interface (voir solve_batch.py)
+    if name == 'SolverWorker':
+        from .worker import SolverWorker
+        return SolverWorker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['VertexCoverSolver', 'GreedyVertexCoverSolver', 'SolverWorker']
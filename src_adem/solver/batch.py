@@ -0,0 +1,233 @@
+import csv
+import glob
+import hashlib
+import importlib.util
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils.file_io import load_graph_from_file, export_solution_to_json
+from utils.validation import validate_graph, format_validation_report
+
+SOLVERS = ('auto', 'gurobi', 'greedy')
+
+# Colonnes du fichier de synthèse
+SUMMARY_FIELDS = [
+    'file', 'status', 'solver', 'total_cost', 'gap', 'num_selected',
+    'num_vertices', 'num_edges', 'load_time', 'solve_time', 'write_time',
+    'total_time', 'output', 'message'
+]
+
+
+def solve_graph(graph_data, parameters, solver='auto', time_limit=30, threads=None):
+    """
+    Résout un graphe avec le solveur demandé, sans dépendance à l'interface.
+
+    Parameters:
+    -----------
+    graph_data : dict
+        Graphe au format de l'application
+    parameters : dict
+        Paramètres du problème (budget, options avancées)
+    solver : str
+        'gurobi', 'greedy' ou 'auto' (Gurobi s'il est installé, sinon glouton)
+    time_limit : float
+        Limite de temps de Gurobi en secondes
+    threads : int ou None
+        Nombre de threads de Gurobi
+
+    Returns:
+    --------
+    tuple : (solution, nom du solveur utilisé). Une solution du solveur
+            glouton a le statut 'heuristic' et un gap None : elle n'est
+            pas prouvée optimale.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Solveur inconnu : {solver}")
+
+    if solver == 'auto':
+        solver = 'gurobi' if importlib.util.find_spec('gurobipy') else 'greedy'
+
+    if solver == 'gurobi':
+        from .vertex_cover_solver import VertexCoverSolver
+        engine = VertexCoverSolver(time_limit=time_limit, threads=threads)
+    else:
+        from .greedy_solver import GreedyVertexCoverSolver
+        engine = GreedyVertexCoverSolver()
+
+    solution = engine.solve(graph_data['vertices'], graph_data['edges'], parameters or {})
+    return solution, solver
+
+
+def solution_paths(files, output_dir):
+    """
+    Fichiers de solution des graphes : l'arborescence des entrées est
+    reproduite sous output_dir à partir de leur dossier commun, de sorte
+    que deux graphes de même nom (sites/A/graph.json, sites/B/graph.json)
+    ne s'écrasent pas.
+
+    Returns:
+    --------
+    dict : Fichier de graphe -> fichier de solution
+    """
+    if not files:
+        return {}
+    try:
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(f)) for f in files])
+    except ValueError:
+        # Entrées sur des lecteurs différents : nom suffixé d'un hachage du chemin
+        return {
+            f: os.path.join(output_dir, f"{os.path.splitext(os.path.basename(f))[0]}-"
+                                        f"{hashlib.sha1(os.path.abspath(f).encode()).hexdigest()[:8]}"
+                                        f".solution.json")
+            for f in files
+        }
+    return {
+        f: os.path.join(output_dir, os.path.splitext(os.path.relpath(os.path.abspath(f), root))[0]
+                        + '.solution.json')
+        for f in files
+    }
+
+
+def solve_file(filename, output, solver='auto', time_limit=30, threads=None):
+    """
+    Charge, valide et résout un fichier de graphe puis écrit sa solution
+    dans `output` (voir solution_paths).
+
+    Exécutée dans un processus du pool : ne lève pas d'exception, toute
+    erreur est retournée dans la ligne de synthèse.
+
+    Returns:
+    --------
+    dict : Ligne de synthèse (voir SUMMARY_FIELDS)
+    """
+    start = time.perf_counter()
+    row = {field: '' for field in SUMMARY_FIELDS}
+    row.update({'file': filename, 'status': 'error', 'solver': solver})
+
+    try:
+        # Chargement et validation
+        loaded = load_graph_from_file(filename)
+        if not loaded['success']:
+            row['message'] = loaded['error']
+            return row
+
+        graph_data = loaded['graph_data']
+        report = validate_graph(graph_data)
+        row['num_vertices'] = report['num_vertices']
+        row['num_edges'] = report['num_edges']
+        if not report['valid']:
+            row['status'] = 'invalid'
+            row['message'] = format_validation_report(report).replace('\n', ' ')
+            return row
+        row['load_time'] = time.perf_counter() - start
+
+        # Résolution
+        solve_start = time.perf_counter()
+        solution, used = solve_graph(graph_data, loaded['parameters'], solver, time_limit, threads)
+        row['solve_time'] = time.perf_counter() - solve_start
+        row['solver'] = used
+        row['status'] = solution.get('status', 'error')
+        row['message'] = solution.get('message', '').replace('\n', ' ')
+        for key in ('total_cost', 'gap', 'num_selected'):
+            # Gap None (solution gloutonne) : colonne laissée vide
+            if solution.get(key) is not None:
+                row[key] = solution[key]
+
+        # Écriture de la solution
+        write_start = time.perf_counter()
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        result = export_solution_to_json(solution, graph_data, loaded['parameters'], output)
+        row['write_time'] = time.perf_counter() - write_start
+        if result['success']:
+            row['output'] = result['filename']
+        else:
+            row['message'] = f"Erreur d'écriture : {result['error']}"
+
+    except Exception as e:
+        row['status'] = 'error'
+        row['message'] = f"Erreur inattendue : {e}"
+
+    row['total_time'] = time.perf_counter() - start
+    return row
+
+
+def collect_files(inputs):
+    """
+    Liste les fichiers de graphe à traiter.
+
+    Chaque entrée est un dossier (tous ses fichiers .json), un motif glob
+    ou un fichier. Les doublons sont ignorés, l'ordre est conservé.
+    """
+    files = []
+    for entry in inputs:
+        if os.path.isdir(entry):
+            matches = sorted(glob.glob(os.path.join(entry, '*.json')))
+        else:
+            matches = sorted(glob.glob(entry)) or [entry]
+        files.extend(matches)
+    return list(dict.fromkeys(os.path.abspath(f) for f in files))
+
+
+def run_batch(files, output_dir, solver='auto', time_limit=30, workers=None,
+              threads=None, on_result=None):
+    """
+    Résout une liste de fichiers en parallèle dans un pool de processus.
+
+    Parameters:
+    -----------
+    files : list[str]
+        Fichiers de graphe à résoudre
+    output_dir : str
+        Dossier des fichiers de solution (arborescence des entrées
+        reproduite sous ce dossier, voir solution_paths)
+    workers : int ou None
+        Nombre de processus (None : nombre de cœurs)
+    threads : int ou None
+        Threads Gurobi par processus (None : cœurs répartis entre les processus)
+    on_result : callable ou None
+        Appelé avec chaque ligne de synthèse dès qu'un fichier est terminé
+
+    Returns:
+    --------
+    list[dict] : Lignes de synthèse, dans l'ordre de `files`
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cpu_count = os.cpu_count() or 1
+    workers = max(1, min(workers or cpu_count, len(files) or 1))
+    if threads is None:
+        threads = max(1, cpu_count // workers)
+
+    outputs = solution_paths(files, output_dir)
+    rows = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(solve_file, f, outputs[f], solver, time_limit, threads): f
+            for f in files
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                row = future.result()
+            except Exception as e:
+                # Processus interrompu (mémoire, signal...)
+                row = {field: '' for field in SUMMARY_FIELDS}
+                row.update({'file': filename, 'status': 'error', 'solver': solver,
+                            'message': f"Processus interrompu : {e}"})
+            rows[filename] = row
+            if on_result:
+                on_result(row)
+
+    return [rows[f] for f in files]
+
+
+def write_summary(rows, filename):
+    """Écrit la synthèse du lot en CSV"""
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({
+                key: f"{value:.6g}" if isinstance(value, float) else value
+                for key, value in row.items()
+            })
@@ -5,6 +5,9 @@ class GreedyVertexCoverSolver:
     """
     Solveur glouton pour le problème de couverture de sommets.
     Utilisé comme solution de secours si Gurobi n'est pas disponible.
+    
+    Ses solutions ne sont pas prouvées optimales : elles ont le statut
+    'heuristic' et pas de gap (None).
     """
     
     def __init__(self):
@@ -146,12 +149,12 @@ class GreedyVertexCoverSolver:
             self.solve_time = time.time() - start_time
             
             return {
-                'status': 'optimal',
+                'status': 'heuristic',
                 'total_cost': total_cost,
                 'selected_vertices': selected_vertices,
                 'cover_details': cover_details,
                 'solve_time': self.solve_time,
-                'gap': 0.0,
+                'gap': None,
                 'num_selected': len(selected_vertices),
                 'detailed_costs': detailed_costs,
                 'message': 'Solution gloutonne trouvée (approximative)'
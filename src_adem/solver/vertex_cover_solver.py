@@ -7,12 +7,22 @@ class VertexCoverSolver:
     Minimise le coût total de sélection des sommets pour couvrir toutes les arêtes.
     """
     
-    def __init__(self):
+    def __init__(self, time_limit=30, threads=None):
+        """
+        Parameters:
+        -----------
+        time_limit : float
+            Limite de temps de résolution en secondes
+        threads : int ou None
+            Nombre de threads Gurobi (None : choix automatique de Gurobi)
+        """
         self.solution = None
         self.solve_time = 0
         self.model = None
+        self.time_limit = time_limit
+        self.threads = threads
         
-    def solve(self, vertices, edges, parameters):
+    def solve(self, vertices, edges, parameters, on_incumbent=None):
         """
         Résout le problème de couverture de sommets avec Gurobi.
         
@@ -24,10 +34,14 @@ class VertexCoverSolver:
             Liste des arêtes avec from, to, critical
         parameters : dict
             Paramètres additionnels (budget, options avancées)
+        on_incumbent : callable ou None
+            Appelé, depuis l'optimisation, avec la liste des sommets de
+            chaque nouvelle meilleure solution trouvée par Gurobi
             
         Returns:
         --------
-        dict : Solution et métadonnées
+        dict : Solution et métadonnées (build_time : temps de construction
+               du modèle, compris dans solve_time)
         """
         start_time = time.time()
         
@@ -53,7 +67,9 @@ class VertexCoverSolver:
             try:
                 self.model = gp.Model("Vertex_Cover")
                 self.model.setParam('OutputFlag', 0)  # Désactiver la sortie console
-                self.model.setParam('TimeLimit', 30)   # Limite de temps de 30 secondes
+                self.model.setParam('TimeLimit', self.time_limit)
+                if self.threads:
+                    self.model.setParam('Threads', self.threads)
             except gp.GurobiError as e:
                 return {
                     'status': 'error',
@@ -122,7 +138,19 @@ class VertexCoverSolver:
                                        name=f"redundancy_{u}_{v}")
             
             # Résoudre le modèle
-            self.model.optimize()
+            build_time = time.time() - start_time
+            if on_incumbent is not None:
+                x_vars = [x[v_id] for v_id in vertex_ids]
+                
+                def report_incumbent(model, where):
+                    if where == GRB.Callback.MIPSOL:
+                        values = model.cbGetSolution(x_vars)
+                        on_incumbent([v_id for v_id, value in zip(vertex_ids, values)
+                                      if value > 0.5])
+                
+                self.model.optimize(report_incumbent)
+            else:
+                self.model.optimize()
             
             # Traiter les résultats
             solve_time = time.time() - start_time
@@ -155,6 +183,7 @@ class VertexCoverSolver:
                     'selected_vertices': selected_vertices,
                     'cover_details': cover_details,
                     'solve_time': solve_time,
+                    'build_time': build_time,
                     'gap': self.model.MIPGap,
                     'num_selected': len(selected_vertices),
                     'detailed_costs': detailed_costs,
@@ -186,6 +215,7 @@ class VertexCoverSolver:
                         'selected_vertices': selected_vertices,
                         'cover_details': {},
                         'solve_time': solve_time,
+                        'build_time': build_time,
                         'gap': self.model.MIPGap,
                         'num_selected': len(selected_vertices),
                         'detailed_costs': detailed_costs,
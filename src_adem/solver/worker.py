@@ -1,6 +1,8 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 import time
 
+from models.graph import Graph
+
 class SolverWorker(QThread):
     """
     Worker pour exécuter le solveur dans un thread séparé.
@@ -12,18 +14,22 @@ class SolverWorker(QThread):
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
     progress = pyqtSignal(int, str)  # Progression et message
+    incumbent = pyqtSignal(list)  # Sommets de chaque solution améliorante (Gurobi)
     
     def __init__(self, graph_data, parameters):
         super().__init__()
         self.graph_data = graph_data
         self.parameters = parameters
+        # Forme tabulaire du graphe résolu (affichage des résultats),
+        # construite dans le thread
+        self.graph = None
     
     def run(self):
         """Exécute le solveur dans le thread"""
         try:
             self.started.emit()
             self.progress.emit(10, "Initialisation...")
-            time.sleep(0.1)
+            self.graph = Graph.from_graph_data(self.graph_data)
             
             # Essayer d'utiliser Gurobi
             try:
@@ -36,7 +42,8 @@ class SolverWorker(QThread):
                 solution = solver.solve(
                     self.graph_data['vertices'],
                     self.graph_data['edges'],
-                    self.parameters
+                    self.parameters,
+                    on_incumbent=self.incumbent.emit
                 )
                 
                 self.progress.emit(90, "Solution trouvée !")
@@ -59,7 +66,7 @@ class SolverWorker(QThread):
                 )
                 
                 # Ajouter un message indiquant que c'est une solution gloutonne
-                if solution['status'] == 'optimal':
+                if solution['status'] == 'heuristic':
                     solution['message'] = "Solution gloutonne (approximative) - Gurobi non installé"
                 
                 self.progress.emit(90, "Solution gloutonne trouvée")
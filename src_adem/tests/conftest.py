@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pytest
+
+# Les modules de l'application s'importent depuis src_adem (models, utils...)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Modules et paquets de premier niveau de l'application
+APP_MODULES = {os.path.splitext(name)[0] for name in os.listdir(ROOT)
+               if name.endswith('.py') or os.path.isfile(os.path.join(ROOT, name, '__init__.py'))}
+
+
+def use_app_modules():
+    """
+    Place src_adem en tête de sys.path et oublie les modules de même nom
+    importés d'ailleurs.
+
+    src_yosr a aussi un module 'solver' : lancés ensemble depuis la racine
+    du dépôt, ses tests peuvent l'avoir importé avant les nôtres (y compris
+    un import paresseux de l'interface : gui.main_window -> solver.worker).
+    """
+    if sys.path[0] != ROOT:
+        sys.path.insert(0, ROOT)
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None) or ''
+        if name.split('.')[0] in APP_MODULES and not path.startswith(ROOT + os.sep):
+            del sys.modules[name]
+
+
+def pytest_collectstart(collector):
+    # Les modules de test importent l'application à leur collecte
+    if isinstance(collector, pytest.Module):
+        use_app_modules()
+
+
+@pytest.fixture(autouse=True)
+def app_modules():
+    """Imports faits pendant les tests"""
+    use_app_modules()
@@ -0,0 +1,73 @@
+import json
+import os
+import time
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+QtWidgets = pytest.importorskip('PyQt5.QtWidgets')
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def window(app, monkeypatch):
+    from gui.main_window import MainWindow
+
+    for name in ('information', 'warning', 'critical'):
+        monkeypatch.setattr(QtWidgets.QMessageBox, name, staticmethod(lambda *args, **kwargs: None))
+    window = MainWindow()
+    window.check_unsaved_changes = lambda: False
+    yield window
+    window.close()
+
+
+def load(app, window, monkeypatch, filename):
+    """Ouvre un fichier comme le ferait l'utilisateur et attend la fin de l'affichage"""
+    monkeypatch.setattr(QtWidgets.QFileDialog, 'getOpenFileName',
+                        staticmethod(lambda *args, **kwargs: (filename, '')))
+    window.open_graph()
+    deadline = time.monotonic() + 10
+    while (window.load_worker or window.graph_widget.is_loading()) and time.monotonic() < deadline:
+        app.processEvents()
+    app.processEvents()
+
+
+def test_load_then_scale_then_select(app, window, monkeypatch, tmp_path):
+    # Coûts du graphe à 1.0, coûts réels (édités dans la table) dans les paramètres
+    filename = str(tmp_path / 'graph.json')
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump({
+            'metadata': {'version': '2.1'},
+            'graph_data': {
+                'vertices': [{'id': v, 'x': 50.0 * k, 'y': 0.0, 'cost': 1.0, 'type': 'normal'}
+                             for k, v in enumerate(['V1', 'V2', 'V3'])],
+                'edges': [{'from': 'V1', 'to': 'V2', 'critical': False},
+                          {'from': 'V2', 'to': 'V3', 'critical': False}]
+            },
+            'parameters': {
+                'budget': None,
+                'vertices': {'V1': {'cost': 10.0, 'type': 'normal'},
+                             'V2': {'cost': 30.0, 'type': 'mandatory'}}
+            }
+        }, f)
+
+    load(app, window, monkeypatch, filename)
+    graph = window.graph_widget
+    table = window.params_widget.costs_model
+    assert graph.vertex_arrays()[1].tolist() == [10.0, 30.0, 1.0]
+    assert table.arrays()[1].tolist() == [10.0, 30.0, 1.0]
+    assert not window.is_modified()
+
+    graph.scale_costs(['V1', 'V2'], 2)
+    graph.flush_changes()
+    assert table.arrays()[1].tolist() == [20.0, 60.0, 1.0]
+    assert window.params_widget.get_parameters()['vertices']['V2'] == {'cost': 60.0, 'type': 'mandatory'}
+
+    graph.select_by_rule(min_cost=5)
+    assert sorted(graph.selected_vertex_ids()) == ['V1', 'V2']
+    graph.select_by_rule(vertex_type='mandatory')
+    assert graph.selected_vertex_ids() == ['V2']
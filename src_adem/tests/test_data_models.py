@@ -0,0 +1,178 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from models.data_models import SolutionResult
+from models.graph import Graph
+from utils.file_io import _expand_solution, load_graph_from_file, save_graph_to_file
+
+EXEMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'exemples')
+
+
+@pytest.fixture
+def graph_data():
+    # Chemin V1 - V2 - ... - V10 (10 sommets : le bitset déborde sur un 2e octet)
+    return {
+        'vertices': [{'id': f"V{i}", 'x': 10.0 * i, 'y': 0.0, 'cost': float(i), 'type': 'normal'}
+                     for i in range(1, 11)],
+        'edges': [{'from': f"V{i}", 'to': f"V{i + 1}", 'critical': i == 1}
+                  for i in range(1, 10)]
+    }
+
+
+@pytest.fixture
+def solution():
+    selected = ['V1', 'V2', 'V4', 'V6', 'V8', 'V10']
+    return {
+        'status': 'optimal',
+        'total_cost': 31.0,
+        'selected_vertices': selected,
+        'detailed_costs': {v: float(v[1:]) for v in selected},
+        'cover_details': {},
+        'num_selected': len(selected),
+        'solve_time': 0.5,
+        'gap': 0.0,
+        'message': 'ok'
+    }
+
+
+def test_dict_round_trip(graph_data, solution):
+    graph = Graph.from_graph_data(graph_data)
+    compact = SolutionResult.from_solution(solution, graph)
+
+    data = json.loads(json.dumps(compact.to_dict()))
+    assert data['format'] == 'bitmask'
+    assert data['num_vertices'] == 10
+    assert 'selected_vertices' not in data and 'cover_details' not in data
+
+    restored = SolutionResult.from_dict(data)
+    assert restored.num_vertices == 10
+    assert np.array_equal(restored.bits, compact.bits)
+    assert restored.metadata == compact.metadata
+    assert restored.num_selected == 6
+
+
+def test_to_solution_rebuilds_lists(graph_data, solution):
+    graph = Graph.from_graph_data(graph_data)
+    expanded = SolutionResult.from_dict(SolutionResult.from_solution(solution, graph).to_dict()).to_solution(graph)
+
+    assert expanded['selected_vertices'] == solution['selected_vertices']
+    assert expanded['detailed_costs'] == solution['detailed_costs']
+    assert expanded['num_selected'] == 6
+    assert expanded['total_cost'] == 31.0
+    assert 'solver_total_cost' not in expanded
+    assert expanded['cover_details']['V1-V2'] == ['V1', 'V2']
+    assert expanded['cover_details']['V2-V3'] == ['V2']
+    for key in ('status', 'solve_time', 'gap', 'message'):
+        assert expanded[key] == solution[key]
+
+
+def test_deleted_vertices_are_dropped(graph_data, solution):
+    # V10 supprimé du graphe depuis la résolution
+    graph_data['vertices'].pop()
+    graph_data['edges'].pop()
+    graph = Graph.from_graph_data(graph_data)
+    compact = SolutionResult.from_solution(solution, graph)
+
+    assert compact.metadata['dropped_vertices'] == ['V10']
+    assert compact.metadata['total_cost'] == 21.0
+    assert compact.metadata['solver_total_cost'] == 31.0
+
+    expanded = compact.to_solution(graph)
+    assert expanded['selected_vertices'] == ['V1', 'V2', 'V4', 'V6', 'V8']
+    assert expanded['total_cost'] == 21.0
+    assert expanded['solver_total_cost'] == 31.0
+    assert expanded['dropped_vertices'] == ['V10']
+
+
+def test_changed_costs_keep_solver_total(graph_data, solution):
+    graph = Graph.from_graph_data(graph_data)
+    compact = SolutionResult.from_solution(solution, graph)
+
+    graph_data['vertices'][0]['cost'] = 11.0
+    expanded = compact.to_solution(Graph.from_graph_data(graph_data))
+    assert expanded['total_cost'] == 41.0
+    assert expanded['detailed_costs']['V1'] == 11.0
+    assert expanded['solver_total_cost'] == 31.0
+
+
+def test_graph_size_mismatch(graph_data, solution):
+    compact = SolutionResult.from_solution(solution, Graph.from_graph_data(graph_data))
+    graph_data['vertices'].append({'id': 'V11', 'cost': 1.0})
+    with pytest.raises(ValueError):
+        compact.to_solution(Graph.from_graph_data(graph_data))
+    with pytest.raises(ValueError):
+        SolutionResult(compact.bits[:1], 10)
+
+
+def test_save_and_load_file(tmp_path, graph_data, solution):
+    filename = str(tmp_path / 'graph.json')
+    assert save_graph_to_file(graph_data, {'budget': 0}, solution, filename)['success']
+
+    with open(filename, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved['metadata']['version'] == '2.1'
+    assert saved['solution']['format'] == 'bitmask'
+
+    loaded = load_graph_from_file(filename)
+    assert loaded['success']
+    assert loaded['solution']['selected_vertices'] == solution['selected_vertices']
+    assert loaded['solution']['total_cost'] == 31.0
+
+
+def test_legacy_list_solution_is_kept():
+    loaded = load_graph_from_file(os.path.join(EXEMPLES, 'solution_20251206_222021.json'))
+    assert loaded['success']
+    assert loaded['metadata']['version'] == '2.0'
+    assert loaded['solution']['selected_vertices'] == ['V2', 'V4', 'V7', 'V8']
+    assert loaded['solution']['total_cost'] == 4.0
+
+    # Stockée en liste, la solution est retournée telle quelle
+    assert _expand_solution(loaded['solution'], loaded['graph_data']) is loaded['solution']
+
+
+def test_inconsistent_bitmask_is_ignored(graph_data, solution):
+    data = SolutionResult.from_solution(solution, Graph.from_graph_data(graph_data)).to_dict()
+    graph_data['vertices'].append({'id': 'V11', 'cost': 1.0})
+    assert _expand_solution(data, graph_data) is None
+
+
+def test_set_operations():
+    a = SolutionResult.from_mask([True, True, False, False, True, False, False, False, False, True])
+    b = SolutionResult.from_mask([True, False, True, False, True, False, False, False, True, False])
+
+    removed, added = a.diff(b)
+    assert removed.tolist() == [1, 9]
+    assert added.tolist() == [2, 8]
+    assert a.intersection(b).selected_indices().tolist() == [0, 4]
+    assert a.union(b).selected_indices().tolist() == [0, 1, 2, 4, 8, 9]
+    assert a.hamming(b) == 4
+    assert a.hamming(a) == 0
+    assert [x.tolist() for x in a.diff(a)] == [[], []]
+
+
+def test_set_operations_match_brute_force():
+    rng = np.random.default_rng(0)
+    for n in (1, 7, 8, 9, 100):
+        x, y = rng.random(n) < 0.5, rng.random(n) < 0.5
+        a, b = SolutionResult.from_mask(x), SolutionResult.from_mask(y)
+        removed, added = a.diff(b)
+        assert removed.tolist() == np.flatnonzero(x & ~y).tolist()
+        assert added.tolist() == np.flatnonzero(y & ~x).tolist()
+        assert np.array_equal(a.intersection(b).mask, x & y)
+        assert a.hamming(b) == int((x != y).sum())
+
+
+def test_set_operations_on_different_graphs(graph_data, solution):
+    small = SolutionResult.from_solution(solution, Graph.from_graph_data(graph_data))
+    graph_data['vertices'].append({'id': 'V11', 'cost': 1.0})
+    large = SolutionResult.from_solution(solution, Graph.from_graph_data(graph_data))
+
+    for operation in (small.diff, small.intersection, small.union, small.hamming):
+        with pytest.raises(ValueError):
+            operation(large)
+    # Même nombre d'octets, nombre de sommets différent
+    with pytest.raises(ValueError):
+        SolutionResult.from_mask([True] * 9).hamming(SolutionResult.from_mask([True] * 10))
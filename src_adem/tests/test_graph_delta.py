@@ -0,0 +1,130 @@
+from models.graph_delta import (
+    EDGE_ADDED, EDGE_CHANGED, EDGE_REMOVED, VERTEX_ADDED, VERTEX_CHANGED, VERTEX_REMOVED, GraphDelta
+)
+
+
+def vertex(v_id, x=0.0, y=0.0, cost=1.0):
+    return {'id': v_id, 'x': x, 'y': y, 'cost': cost, 'type': 'normal'}
+
+
+def edge(u, v, critical=False):
+    return {'from': u, 'to': v, 'critical': critical}
+
+
+def test_add_then_remove_is_empty():
+    delta = GraphDelta()
+    delta.vertex_added('V1', vertex('V1'))
+    delta.vertex_changed('V1', {'x': 5.0})
+    delta.vertex_removed('V1')
+    delta.edge_added(('V2', 'V3'), edge('V2', 'V3'))
+    delta.edge_removed(('V2', 'V3'))
+
+    assert delta.is_empty()
+    assert delta.events() == []
+
+
+def test_add_then_change_is_an_add():
+    delta = GraphDelta()
+    delta.vertex_added('V1', vertex('V1'))
+    delta.vertex_changed('V1', {'cost': 4.0})
+    assert delta.events() == [(VERTEX_ADDED, 'V1', vertex('V1', cost=4.0))]
+
+
+def test_remove_then_add_is_a_change():
+    delta = GraphDelta()
+    delta.vertex_removed('V1')
+    delta.vertex_added('V1', vertex('V1', x=3.0))
+    delta.edge_removed(('V1', 'V2'))
+    delta.edge_added(('V1', 'V2'), edge('V1', 'V2', critical=True))
+
+    assert delta.events() == [
+        (VERTEX_CHANGED, 'V1', vertex('V1', x=3.0)),
+        (EDGE_CHANGED, ('V1', 'V2'), edge('V1', 'V2', critical=True))
+    ]
+
+
+def test_change_then_remove_is_a_remove():
+    delta = GraphDelta()
+    delta.vertex_changed('V1', {'x': 1.0})
+    delta.vertex_removed('V1')
+    assert delta.events() == [(VERTEX_REMOVED, 'V1', None)]
+
+
+def test_repeated_moves_keep_last_position():
+    delta = GraphDelta()
+    for step in range(1, 6):
+        delta.vertex_changed('V1', {'x': float(step), 'y': -float(step)})
+    delta.vertex_changed('V1', {'cost': 2.0})
+
+    assert delta.events() == [(VERTEX_CHANGED, 'V1', {'x': 5.0, 'y': -5.0, 'cost': 2.0})]
+
+
+def test_recorded_data_is_copied():
+    delta = GraphDelta()
+    data = {'x': 1.0, 'y': 1.0}
+    delta.vertex_changed('V1', data)
+    data['x'] = 9.0
+    assert delta.events() == [(VERTEX_CHANGED, 'V1', {'x': 1.0, 'y': 1.0})]
+
+
+def test_edges_of_removed_vertex():
+    # Suppression d'un sommet par l'éditeur : ses arêtes d'abord, puis le sommet
+    delta = GraphDelta()
+    delta.vertex_added('V3', vertex('V3'))
+    delta.edge_added(('V1', 'V3'), edge('V1', 'V3'))
+    delta.edge_changed(('V1', 'V2'), {'critical': True})
+    delta.vertex_changed('V2', {'x': 8.0})
+    delta.vertex_added('V4', vertex('V4'))
+    delta.edge_added(('V2', 'V4'), edge('V2', 'V4'))
+
+    delta.edge_removed(('V1', 'V2'))
+    delta.edge_removed(('V2', 'V4'))
+    delta.vertex_removed('V2')
+
+    # Les arêtes ajoutées puis retirées disparaissent ; les suppressions
+    # d'arêtes précèdent celles des sommets, les ajouts de sommets ceux des arêtes
+    assert delta.events() == [
+        (EDGE_REMOVED, ('V1', 'V2'), None),
+        (VERTEX_REMOVED, 'V2', None),
+        (VERTEX_ADDED, 'V3', vertex('V3')),
+        (VERTEX_ADDED, 'V4', vertex('V4')),
+        (EDGE_ADDED, ('V1', 'V3'), edge('V1', 'V3'))
+    ]
+
+
+def test_events_can_be_applied_in_order():
+    graph = {'vertices': {'V1': vertex('V1'), 'V2': vertex('V2')}, 'edges': {('V1', 'V2'): edge('V1', 'V2')}}
+    delta = GraphDelta()
+    delta.edge_removed(('V1', 'V2'))
+    delta.vertex_removed('V2')
+    delta.vertex_added('V2', vertex('V2', x=4.0))
+    delta.vertex_added('V5', vertex('V5'))
+    delta.edge_added(('V2', 'V5'), edge('V2', 'V5'))
+
+    for kind, key, data in delta.events():
+        if kind == EDGE_REMOVED:
+            assert all(v in graph['vertices'] for v in key)
+            del graph['edges'][key]
+        elif kind == VERTEX_REMOVED:
+            assert not any(key in k for k in graph['edges'])
+            del graph['vertices'][key]
+        elif kind in (VERTEX_ADDED, VERTEX_CHANGED):
+            graph['vertices'][key] = data
+        else:
+            assert all(v in graph['vertices'] for v in key)
+            graph['edges'][key] = data
+
+    assert graph['vertices']['V2']['x'] == 4.0
+    assert set(graph['edges']) == {('V2', 'V5')}
+
+
+def test_reset_drops_other_changes():
+    delta = GraphDelta()
+    delta.vertex_added('V1', vertex('V1'))
+    delta.mark_reset()
+    delta.vertex_changed('V1', {'x': 2.0})
+    delta.edge_added(('V1', 'V2'), edge('V1', 'V2'))
+
+    assert delta.reset
+    assert not delta.is_empty()
+    assert delta.events() == []
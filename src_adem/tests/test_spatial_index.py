@@ -0,0 +1,128 @@
+import math
+
+import numpy as np
+import pytest
+
+from utils.spatial_index import SpatialGrid
+
+CELL = 40.0
+
+
+def random_points(rng, count):
+    """Points aléatoires dont un tiers exactement sur des bords de cellules"""
+    points = {}
+    for k in range(count):
+        if k % 3 == 0:
+            x, y = CELL * rng.integers(-5, 6), CELL * rng.integers(-5, 6) + rng.choice([0.0, 13.5])
+        else:
+            x, y = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        points[f"V{k}"] = (float(x), float(y))
+    return points
+
+
+def brute_nearest_distance(points, x, y, radius):
+    distances = [math.hypot(px - x, py - y) for px, py in points.values()]
+    inside = [d for d in distances if d <= radius]
+    return min(inside) if inside else None
+
+
+def brute_rect(points, x1, y1, x2, y2):
+    x1, x2 = sorted((x1, x2))
+    y1, y2 = sorted((y1, y2))
+    return {k for k, (px, py) in points.items() if x1 <= px <= x2 and y1 <= py <= y2}
+
+
+def check(grid, points, rng, queries=200):
+    assert len(grid) == len(points)
+    for key, position in points.items():
+        assert grid.position(key) == position
+
+    for q in range(queries):
+        if q % 4 == 0:
+            # Requêtes centrées sur des bords et des coins de cellules
+            x, y = CELL * rng.integers(-5, 6), CELL * rng.integers(-5, 6)
+        else:
+            x, y = rng.uniform(-220, 220), rng.uniform(-220, 220)
+        radius = float(rng.choice([0.0, 5.0, CELL, 2.5 * CELL]))
+
+        key = grid.nearest(x, y, radius)
+        expected = brute_nearest_distance(points, x, y, radius)
+        if expected is None:
+            assert key is None
+        else:
+            # En cas d'égalité, n'importe lequel des plus proches convient
+            px, py = points[key]
+            assert math.hypot(px - x, py - y) == pytest.approx(expected)
+
+        x2 = x + rng.choice([0.0, CELL, rng.uniform(-300, 300)])
+        y2 = y + rng.choice([0.0, CELL, rng.uniform(-300, 300)])
+        found = grid.query_rect(x, y, x2, y2)
+        assert len(found) == len(set(found))
+        assert set(found) == brute_rect(points, x, y, x2, y2)
+
+    # Rectangle plus grand que la zone occupée (parcours des cellules non vides)
+    assert sorted(grid.query_rect(-1e4, -1e4, 1e4, 1e4)) == sorted(points)
+    assert set(grid.query_rect(-1e4, 0.0, 1e4, 1e4)) == brute_rect(points, -1e4, 0.0, 1e4, 1e4)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_queries_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    points = random_points(rng, 300)
+    grid = SpatialGrid(CELL)
+    for key, (x, y) in points.items():
+        grid.insert(key, x, y)
+    check(grid, points, rng)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_moves_and_removals_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    points = random_points(rng, 300)
+    grid = SpatialGrid(CELL)
+    for key, (x, y) in points.items():
+        grid.insert(key, x, y)
+
+    keys = list(points)
+    for k, key in enumerate(keys):
+        if k % 3 == 0:
+            grid.remove(key)
+            del points[key]
+        elif k % 3 == 1:
+            # Déplacement, parfois sur un bord ou dans la même cellule
+            x, y = points[key]
+            if k % 2:
+                x, y = CELL * rng.integers(-5, 6), y + 1.0
+            else:
+                x, y = x + rng.uniform(-100, 100), y + rng.uniform(-100, 100)
+            grid.move(key, x, y)
+            points[key] = (x, y)
+
+    # insert sur un point existant le déplace
+    key = keys[2]
+    grid.insert(key, 1000.0, 1000.0)
+    points[key] = (1000.0, 1000.0)
+
+    check(grid, points, rng)
+    assert keys[0] not in grid
+    # Aucune cellule vide conservée
+    assert all(grid._cells.values())
+
+
+def test_edge_cases():
+    grid = SpatialGrid(CELL)
+    assert grid.nearest(0, 0, 100) is None
+    assert grid.query_rect(-10, -10, 10, 10) == []
+
+    grid.insert('A', 0.0, 0.0)
+    grid.insert('B', CELL, CELL)
+    grid.remove('missing')
+    assert grid.nearest(CELL / 2, CELL / 2, CELL / 2) is None
+    assert grid.nearest(-1e-9, -1e-9, 0.1) == 'A'
+    assert sorted(grid.query_rect(CELL, CELL, 0, 0)) == ['A', 'B']
+    assert grid.query_rect(CELL, CELL, CELL, CELL) == ['B']
+
+    grid.move('missing', 1.0, 1.0)
+    assert grid.position('missing') == (1.0, 1.0)
+    grid.clear()
+    assert len(grid) == 0
@@ -0,0 +1,194 @@
+import math
+
+import numpy as np
+import pytest
+
+from models.graph import TYPE_FORBIDDEN, TYPE_MANDATORY
+from utils.validation import format_validation_report, validate_graph, validate_graph_data
+
+
+@pytest.fixture
+def graph_data():
+    # Triangle V1 - V2 - V3, plus V4 relié à V3
+    return {
+        'vertices': [{'id': f"V{i}", 'x': 10.0 * i, 'y': 0.0, 'cost': float(i), 'type': 'normal'}
+                     for i in range(1, 5)],
+        'edges': [
+            {'from': 'V1', 'to': 'V2', 'critical': False},
+            {'from': 'V2', 'to': 'V3', 'critical': True},
+            {'from': 'V3', 'to': 'V1', 'critical': False},
+            {'from': 'V3', 'to': 'V4', 'critical': False}
+        ]
+    }
+
+
+def issues(report, bucket='errors'):
+    """Problèmes du rapport par code"""
+    return {issue['code']: issue for issue in report[bucket]}
+
+
+def test_valid_graph(graph_data):
+    graph_data['vertices'][0]['type'] = 'mandatory'
+    graph_data['vertices'][3]['type'] = 'forbidden'
+    report = validate_graph(graph_data)
+
+    assert report['valid']
+    assert report['errors'] == [] and report['warnings'] == []
+    assert (report['num_vertices'], report['num_edges']) == (4, 4)
+
+    graph = report['graph']
+    assert graph.vertex_ids == ['V1', 'V2', 'V3', 'V4']
+    assert graph.costs.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert graph.types[0] == TYPE_MANDATORY and graph.types[3] == TYPE_FORBIDDEN
+    assert graph.src.tolist() == [0, 1, 2, 2]
+    assert graph.dst.tolist() == [1, 2, 0, 3]
+    assert graph.critical.tolist() == [False, True, False, False]
+
+
+@pytest.mark.parametrize('graph_data', [None, [], {'vertices': []}, {'vertices': {}, 'edges': []}])
+def test_invalid_structure(graph_data):
+    report = validate_graph(graph_data)
+    assert not report['valid']
+    assert set(issues(report)) <= {'invalid_structure', 'missing_key'}
+    assert report['graph'] is None
+
+
+def test_duplicate_and_missing_vertex_ids(graph_data):
+    vertices = graph_data['vertices']
+    vertices.append({'id': 'V2', 'cost': 1.0})
+    vertices.append({'id': 'V3', 'cost': 1.0})
+    vertices.append({'cost': 1.0})
+    vertices.append({'id': 7, 'cost': 1.0})
+    vertices.append('V9')
+    found = issues(validate_graph(graph_data))
+
+    assert found['duplicate_vertex_id']['count'] == 2
+    assert found['duplicate_vertex_id']['samples'] == ['V2', 'V3']
+    assert found['missing_vertex_id']['samples'] == ['#6']
+    assert found['invalid_vertex_id']['samples'] == ['#7 (7)']
+    assert found['vertex_not_dict']['samples'] == ['#8']
+
+
+@pytest.mark.parametrize('cost, code', [
+    ('5', 'invalid_cost_type'),
+    (None, 'invalid_cost_type'),
+    (True, 'invalid_cost_type'),
+    (-1, 'negative_cost'),
+    (-0.5, 'negative_cost'),
+    (math.nan, 'non_finite_cost'),
+    (math.inf, 'non_finite_cost')
+])
+def test_invalid_costs(graph_data, cost, code):
+    graph_data['vertices'][1]['cost'] = cost
+    found = issues(validate_graph(graph_data))
+    assert list(found) == [code]
+    assert found[code]['count'] == 1
+    assert found[code]['samples'][0].startswith('V2')
+
+
+def test_zero_and_integer_costs_are_valid(graph_data):
+    graph_data['vertices'][0]['cost'] = 0
+    graph_data['vertices'][1]['cost'] = 3
+    del graph_data['vertices'][2]['cost']
+    report = validate_graph(graph_data)
+    assert report['valid']
+    assert report['graph'].costs.tolist() == [0.0, 3.0, 1.0, 4.0]
+
+
+def test_invalid_vertex_type(graph_data):
+    graph_data['vertices'][0]['type'] = 'critical'
+    assert list(issues(validate_graph(graph_data))) == ['invalid_vertex_type']
+
+
+def test_missing_coordinates_are_a_warning(graph_data):
+    del graph_data['vertices'][0]['x']
+    graph_data['vertices'][1]['y'] = None
+    report = validate_graph(graph_data)
+    assert report['valid']
+    assert issues(report, 'warnings')['missing_coordinates']['samples'] == ['V1', 'V2']
+    assert np.isnan(report['graph'].x[0])
+
+
+def test_self_loop(graph_data):
+    graph_data['edges'].append({'from': 'V4', 'to': 'V4', 'critical': False})
+    found = issues(validate_graph(graph_data))
+    assert list(found) == ['self_loop']
+    assert found['self_loop']['samples'] == ['#4 (V4-V4)']
+
+
+def test_duplicate_and_reversed_edges_are_warnings(graph_data):
+    graph_data['edges'].append({'from': 'V1', 'to': 'V2', 'critical': False})
+    graph_data['edges'].append({'from': 'V4', 'to': 'V3', 'critical': False})
+    graph_data['edges'].append({'from': 'V2', 'to': 'V1', 'critical': True})
+    report = validate_graph(graph_data)
+
+    assert report['valid']
+    duplicates = issues(report, 'warnings')['duplicate_edge']
+    # La première occurrence est conservée, les suivantes signalées
+    assert duplicates['count'] == 3
+    assert duplicates['samples'] == ['#4 (V1-V2)', '#5 (V4-V3)', '#6 (V2-V1)']
+
+
+def test_unknown_and_missing_endpoints(graph_data):
+    graph_data['edges'].append({'from': 'V1', 'to': 'V9', 'critical': False})
+    graph_data['edges'].append({'from': 'V0', 'to': 'V2'})
+    graph_data['edges'].append({'from': ['V1'], 'to': 'V2'})
+    graph_data['edges'].append({'to': 'V2'})
+    graph_data['edges'].append(('V1', 'V2'))
+    found = issues(validate_graph(graph_data))
+
+    assert found['unknown_endpoint']['samples'] == ['#4 (V1-V9)', '#5 (V0-V2)', "#6 (['V1']-V2)"]
+    assert found['missing_endpoint']['samples'] == ['#7']
+    assert found['edge_not_dict']['samples'] == ['#8']
+
+
+def test_invalid_critical(graph_data):
+    graph_data['edges'][0]['critical'] = 'yes'
+    graph_data['edges'][1]['critical'] = 1
+    found = issues(validate_graph(graph_data))
+    assert list(found) == ['invalid_critical']
+    assert found['invalid_critical']['count'] == 2
+
+
+def test_critical_and_forbidden_contradictions(graph_data):
+    # V2-V3 est critique ; V1-V3 devient impossible à couvrir
+    graph_data['vertices'][0]['type'] = 'forbidden'
+    graph_data['vertices'][2]['type'] = 'forbidden'
+    found = issues(validate_graph(graph_data))
+
+    assert found['critical_forbidden']['samples'] == ['#1 (V2-V3)']
+    assert found['uncoverable_edge']['samples'] == ['#2 (V3-V1)']
+    # Une seule extrémité interdite sur une arête normale : couvrable
+    assert found['uncoverable_edge']['count'] == 1
+
+
+def test_all_issues_are_collected(graph_data):
+    graph_data['vertices'][0]['cost'] = -1
+    graph_data['vertices'][1]['cost'] = 'x'
+    graph_data['edges'].append({'from': 'V4', 'to': 'V4'})
+    graph_data['edges'].append({'from': 'V4', 'to': 'V8'})
+    report = validate_graph(graph_data)
+    assert set(issues(report)) == {'negative_cost', 'invalid_cost_type', 'self_loop', 'unknown_endpoint'}
+    assert report['graph'] is None
+
+
+def test_samples_are_limited(graph_data):
+    graph_data['vertices'] = [{'id': f"V{i}", 'cost': -1} for i in range(20)]
+    graph_data['edges'] = []
+    issue = issues(validate_graph(graph_data, max_samples=3))['negative_cost']
+    assert issue['count'] == 20
+    assert len(issue['samples']) == 3
+    assert '...' in format_validation_report(validate_graph(graph_data, max_samples=3))
+
+
+def test_validate_graph_data_returns_bool_and_message(graph_data):
+    assert validate_graph_data(graph_data) == (True, "Données valides.")
+
+    graph_data['edges'].append({'from': 'V1', 'to': 'V9'})
+    valid, message = validate_graph_data(graph_data)
+    assert valid is False
+    assert isinstance(message, str)
+    assert 'V1-V9' in message
+
+    valid, message = validate_graph_data(None)
+    assert valid is False and isinstance(message, str)
@@ -3,9 +3,13 @@ Module utilitaires pour l'application de surveillance
 """
 
 from .file_io import save_graph_to_file, load_graph_from_file, export_solution_to_csv
+from .validation import validate_graph, validate_graph_data, format_validation_report
 
 __all__ = [
     'save_graph_to_file',
     'load_graph_from_file', 
-    'export_solution_to_csv'
+    'export_solution_to_csv',
+    'validate_graph',
+    'validate_graph_data',
+    'format_validation_report'
 ]
\ No newline at end of file
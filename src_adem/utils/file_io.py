@@ -1,7 +1,46 @@
 import json
 import os
+import tempfile
 from datetime import datetime
 
+from models.data_models import SolutionResult
+from models.graph import Graph
+
+# Masque de création de fichiers du processus (lu une fois : os.umask
+# le modifie temporairement, ce qui n'est pas sûr depuis un thread)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _write_atomic(filename, write, newline=None):
+    """
+    Écrit un fichier de façon atomique : le contenu est écrit dans un fichier
+    temporaire du même dossier puis renommé. Un arrêt brutal pendant
+    l'écriture laisse donc l'ancien fichier intact.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(filename) + '.',
+                                    suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline=newline) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _file_mode(filename))
+        os.replace(tmp_path, filename)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _file_mode(filename):
+    """Droits du fichier final : ceux du fichier existant, sinon ceux par défaut"""
+    try:
+        return os.stat(filename).st_mode & 0o777
+    except OSError:
+        return 0o666 & ~_UMASK
+
 def save_graph_to_file(graph_data, parameters, solution=None, filename=None):
     """
     Sauvegarde le graphe, les paramètres et éventuellement la solution dans un fichier JSON.
@@ -15,14 +54,14 @@ def save_graph_to_file(graph_data, parameters, solution=None, filename=None):
             'app_name': 'Surveillance Network Optimizer',
             'save_date': datetime.now().isoformat(),
             'problem_type': 'vertex_cover',
-            'version': '2.0'
+            'version': '2.1'
         },
         'graph_data': graph_data,
         'parameters': parameters
     }
     
     if solution:
-        save_data['solution'] = solution
+        save_data['solution'] = _compact_solution(solution, graph_data)
     
     if filename:
         try:
@@ -30,8 +69,7 @@ def save_graph_to_file(graph_data, parameters, solution=None, filename=None):
             if not filename.endswith('.json'):
                 filename += '.json'
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            _write_atomic(filename, lambda f: json.dump(save_data, f, indent=2, ensure_ascii=False))
             
             return {'success': True, 'filename': filename, 'data': save_data}
         except Exception as e:
@@ -78,7 +116,7 @@ def load_graph_from_file(filename):
             'success': True,
             'graph_data': data.get('graph_data', {}),
             'parameters': data.get('parameters', {}),
-            'solution': data.get('solution', None),
+            'solution': _expand_solution(data.get('solution', None), data.get('graph_data', {})),
             'metadata': data.get('metadata', {}),
             'filename': filename
         }
@@ -94,6 +132,33 @@ def load_graph_from_file(filename):
             'error': f"Erreur de chargement : {str(e)}"
         }
 
+def _compact_solution(solution, graph_data):
+    """
+    Forme de stockage d'une solution : bitset base64 sur l'ordre des sommets
+    du graphe sauvegardé. Reste au format liste si le graphe ne peut pas
+    être converti.
+    """
+    try:
+        graph = Graph.from_graph_data(graph_data)
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return solution
+    return SolutionResult.from_solution(solution, graph).to_dict()
+
+def _expand_solution(solution, graph_data):
+    """
+    Reconstruit le dict complet d'une solution stockée en bitset. Les
+    solutions au format liste (fichiers 2.0 et antérieurs) sont retournées
+    telles quelles.
+    """
+    if not isinstance(solution, dict) or solution.get('format') != 'bitmask':
+        return solution
+    try:
+        graph = Graph.from_graph_data(graph_data)
+        return SolutionResult.from_dict(solution).to_solution(graph)
+    except (KeyError, TypeError, ValueError, AttributeError):
+        # Graphe invalide ou solution incohérente : la solution est ignorée
+        return None
+
 def export_solution_to_json(solution, graph_data=None, parameters=None, filename=None):
     """
     Exporte la solution complète (graphe, paramètres, solution) en JSON.
@@ -123,8 +188,7 @@ def export_solution_to_json(solution, graph_data=None, parameters=None, filename
             if not filename.endswith('.json'):
                 filename += '.json'
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            _write_atomic(filename, lambda f: json.dump(export_data, f, indent=2, ensure_ascii=False))
             
             return {'success': True, 'filename': filename}
         except Exception as e:
@@ -135,95 +199,56 @@ def export_solution_to_json(solution, graph_data=None, parameters=None, filename
 def export_solution_to_csv(solution, filename):
     """Exporte la solution en CSV"""
     try:
-        import csv
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # En-tête
-            writer.writerow(['SURVEILLANCE NETWORK OPTIMIZER - RAPPORT DE SOLUTION'])
-            writer.writerow(['Exporté le', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-            writer.writerow([])
-            
-            # Résumé
-            writer.writerow(['RÉSUMÉ'])
-            writer.writerow(['Statut', solution.get('status', 'N/A')])
-            writer.writerow(['Coût total', f"{solution.get('total_cost', 0):.2f} €"])
-            writer.writerow(['Nombre de sommets sélectionnés', len(solution.get('selected_vertices', []))])
-            writer.writerow(['Temps de résolution', f"{solution.get('solve_time', 0):.3f} s"])
-            writer.writerow(['Gap d\'optimalité', f"{solution.get('gap', 0)*100:.2f} %"])
-            writer.writerow([])
-            
-            # Détails des sommets sélectionnés
-            writer.writerow(['SOMMETS SÉLECTIONNÉS'])
-            writer.writerow(['Sommet', 'Coût (€)', 'Statut'])
-            
-            selected = solution.get('selected_vertices', [])
-            detailed_costs = solution.get('detailed_costs', {})
-            
-            for vertex_id in selected:
-                cost = detailed_costs.get(vertex_id, 'N/A')
-                writer.writerow([vertex_id, cost, 'Sélectionné'])
-            
-            writer.writerow([])
-            
-            # Couverture des arêtes
-            writer.writerow(['COUVERTURE DES ARÊTES'])
-            writer.writerow(['Arête', 'Sommets couvrants', 'Statut'])
-            
-            if 'cover_details' in solution and solution['cover_details']:
-                for edge, covering in solution['cover_details'].items():
-                    if covering:
-                        writer.writerow([edge, ', '.join(covering), 'Couverte'])
-                    else:
-                        writer.writerow([edge, '', 'Non couverte'])
-            else:
-                writer.writerow(['Aucun détail de couverture disponible', '', ''])
-        
+        _write_atomic(filename, lambda f: _write_solution_csv(solution, f), newline='')
         return {'success': True, 'filename': filename}
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
-def validate_graph_data(graph_data):
-    """
-    Valide les données du graphe.
-    
-    Returns:
-    --------
-    tuple : (bool, str) - (valide, message d'erreur)
-    """
-    if not isinstance(graph_data, dict):
-        return False, "Les données du graphe doivent être un dictionnaire."
-    
-    if 'vertices' not in graph_data or 'edges' not in graph_data:
-        return False, "Les données doivent contenir 'vertices' et 'edges'."
-    
-    if not isinstance(graph_data['vertices'], list):
-        return False, "'vertices' doit être une liste."
-    
-    if not isinstance(graph_data['edges'], list):
-        return False, "'edges' doit être une liste."
-    
-    # Valider chaque sommet
-    vertex_ids = set()
-    for i, vertex in enumerate(graph_data['vertices']):
-        if 'id' not in vertex:
-            return False, f"Sommet {i} n'a pas d'identifiant 'id'."
-        
-        vertex_id = vertex['id']
-        if vertex_id in vertex_ids:
-            return False, f"ID de sommet dupliqué : {vertex_id}"
-        vertex_ids.add(vertex_id)
-    
-    # Valider chaque arête
-    for i, edge in enumerate(graph_data['edges']):
-        if 'from' not in edge or 'to' not in edge:
-            return False, f"Arête {i} doit avoir 'from' et 'to'."
-        
-        if edge['from'] not in vertex_ids:
-            return False, f"Arête {i} : sommet 'from' ({edge['from']}) n'existe pas."
-        
-        if edge['to'] not in vertex_ids:
-            return False, f"Arête {i} : sommet 'to' ({edge['to']}) n'existe pas."
-    
-    return True, "Données valides."
\ No newline at end of file
+def _write_solution_csv(solution, f):
+    """Écrit le rapport CSV de la solution dans un fichier ouvert"""
+    import csv
+    
+    writer = csv.writer(f)
+    
+    # En-tête
+    writer.writerow(['SURVEILLANCE NETWORK OPTIMIZER - RAPPORT DE SOLUTION'])
+    writer.writerow(['Exporté le', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+    writer.writerow([])
+    
+    # Résumé
+    writer.writerow(['RÉSUMÉ'])
+    writer.writerow(['Statut', solution.get('status', 'N/A')])
+    writer.writerow(['Coût total', f"{solution.get('total_cost', 0):.2f} €"])
+    writer.writerow(['Nombre de sommets sélectionnés', len(solution.get('selected_vertices', []))])
+    writer.writerow(['Temps de résolution', f"{solution.get('solve_time', 0):.3f} s"])
+    gap = solution.get('gap', 0)
+    # Pas de gap (None) pour une solution heuristique (solveur glouton)
+    writer.writerow(['Gap d\'optimalité', '-' if gap is None else f"{gap*100:.2f} %"])
+    writer.writerow([])
+    
+    # Détails des sommets sélectionnés
+    writer.writerow(['SOMMETS SÉLECTIONNÉS'])
+    writer.writerow(['Sommet', 'Coût (€)', 'Statut'])
+    
+    selected = solution.get('selected_vertices', [])
+    detailed_costs = solution.get('detailed_costs', {})
+    
+    for vertex_id in selected:
+        cost = detailed_costs.get(vertex_id, 'N/A')
+        writer.writerow([vertex_id, cost, 'Sélectionné'])
+    
+    writer.writerow([])
+    
+    # Couverture des arêtes
+    writer.writerow(['COUVERTURE DES ARÊTES'])
+    writer.writerow(['Arête', 'Sommets couvrants', 'Statut'])
+    
+    if 'cover_details' in solution and solution['cover_details']:
+        for edge, covering in solution['cover_details'].items():
+            if covering:
+                writer.writerow([edge, ', '.join(covering), 'Couverte'])
+            else:
+                writer.writerow([edge, '', 'Non couverte'])
+    else:
+        writer.writerow(['Aucun détail de couverture disponible', '', ''])
+
@@ -0,0 +1,612 @@
+"""
+Disposition automatique des graphes importés sans coordonnées.
+
+Algorithme de Fruchterman–Reingold vectorisé avec NumPy :
+- répulsion entre toutes les paires, exacte entre cellules voisines d'une
+  grille et approchée par barycentres de cellules au-delà, sur une
+  hiérarchie de grilles (à la Barnes–Hut) ;
+- attraction le long des arêtes ;
+- multiniveau : le graphe est contracté par couplages successifs jusqu'à
+  quelques dizaines de sommets, disposé, puis raffiné niveau par niveau
+  (chaque sommet part de la position de son représentant), avec un pas
+  adaptatif et un nombre d'itérations borné par la taille du niveau ;
+- disposition partielle (sommets déjà placés fixes) sur un seul niveau,
+  avec une répulsion de courte portée.
+
+Les calculs se font avec une distance idéale k = 1 ; les positions sont
+mises à l'échelle de la scène à la fin.
+"""
+import numpy as np
+
+from models.graph import Graph
+
+# Distance visée entre sommets voisins, en unités de la scène
+DEFAULT_SPACING = 120.0
+
+# Contraction : arrêt sous cette taille, ou quand un niveau ne réduit plus
+# assez le graphe (étoiles, sommets isolés)
+COARSEST_SIZE = 50
+MIN_REDUCTION = 0.8
+MATCHING_ROUNDS = 3
+
+# Itérations au niveau le plus grossier et aux niveaux de raffinement
+COARSEST_ITERATIONS = 300
+REFINE_ITERATIONS = 30
+# Travail maximal d'un niveau (sommets x itérations) : les grands niveaux,
+# déjà bien placés par le niveau plus grossier, ne font que quelques
+# itérations (au moins MIN_ITERATIONS)
+LEVEL_WORK = 150000
+MIN_ITERATIONS = 5
+# Disposition partielle (sommets déjà placés fixes), sur un seul niveau,
+# bornée comme un niveau par LEVEL_WORK (sommets libres x itérations)
+PARTIAL_ITERATIONS = 100
+
+# Pas adaptatif : facteur de réduction (et d'augmentation) du déplacement
+STEP_DECAY = 0.9
+# Disposition partielle : portée de la répulsion, en multiples de k, pour ne
+# pas écarter les sommets libres de leurs voisins fixes
+LOCAL_RADIUS = 2.0
+# Répulsion : taille maximale des grilles pleines, en cellules par sommet ;
+# les niveaux plus fins (sommets très regroupés) ne parcourent que les
+# cellules occupées
+DENSE_CELLS_PER_VERTEX = 4
+# Répulsion : nombre maximal de subdivisions de la grille la plus fine
+# (sommets confondus)
+MAX_REFINEMENTS = 16
+
+
+def layout_graph_data(graph_data, keep_existing=True, seed=0, spacing=DEFAULT_SPACING, progress=None):
+    """
+    Calcule les positions des sommets et les écrit dans graph_data.
+
+    Les données doivent être valides (voir utils.validation.validate_graph).
+
+    Parameters:
+    -----------
+    graph_data : dict
+        Graphe au format dict de l'application, modifié en place
+    keep_existing : bool
+        Si vrai, seuls les sommets sans coordonnées sont placés, les autres
+        restent fixes ; sinon tout le graphe est redisposé
+    seed : int
+        Graine du générateur aléatoire (disposition reproductible)
+    spacing : float
+        Distance visée entre sommets voisins
+    progress : callable, optionnel
+        Appelé avec l'avancement (0 à 1) ; s'il renvoie True, le calcul
+        est interrompu
+
+    Returns:
+    --------
+    int : nombre de sommets placés, ou None si le calcul a été interrompu
+    """
+    graph = Graph.from_graph_data(graph_data)
+    missing = np.isnan(graph.x) | np.isnan(graph.y)
+    if keep_existing and not missing.any():
+        return 0
+
+    fixed = ~missing if keep_existing else None
+    result = force_directed_layout(graph, fixed=fixed, seed=seed, spacing=spacing, progress=progress)
+    if result is None:
+        return None
+
+    x, y = result
+    placed = np.flatnonzero(missing) if keep_existing else np.arange(graph.num_vertices)
+    vertices = graph_data['vertices']
+    for i, px, py in zip(placed.tolist(), x[placed].tolist(), y[placed].tolist()):
+        vertices[i]['x'] = round(px, 2)
+        vertices[i]['y'] = round(py, 2)
+    return len(placed)
+
+
+def force_directed_layout(graph, fixed=None, seed=0, spacing=DEFAULT_SPACING, progress=None):
+    """
+    Disposition de Fruchterman–Reingold d'un graphe (models.graph.Graph).
+
+    Parameters:
+    -----------
+    graph : Graph
+        Graphe à disposer
+    fixed : ndarray de bool, optionnel
+        Sommets dont les coordonnées (graph.x, graph.y) sont conservées ;
+        sans sommet fixe, la disposition est multiniveau
+    seed : int
+        Graine du générateur aléatoire
+    spacing : float
+        Distance visée entre sommets voisins
+    progress : callable, optionnel
+        Voir layout_graph_data
+
+    Returns:
+    --------
+    tuple : (x, y) tableaux de positions, ou None si interrompu
+    """
+    n = graph.num_vertices
+    if n == 0:
+        return np.empty(0), np.empty(0)
+
+    rng = np.random.default_rng(seed)
+    src, dst = _simple_edges(graph.src, graph.dst)
+    report = progress or (lambda fraction: False)
+
+    if fixed is not None and fixed.any():
+        # Sommets placés plus serrés que spacing : la distance idéale suit
+        # leur espacement, sinon chaque sommet libre aurait des milliers de
+        # voisins à portée de répulsion
+        unit = _fixed_spacing(graph, src, dst, fixed, spacing)
+        pos = _partial_layout(graph, src, dst, fixed, unit, rng, report)
+        if pos is None:
+            return None
+        return pos[:, 0] * unit, pos[:, 1] * unit
+
+    pos = _multilevel_layout(n, src, dst, rng, report)
+    if pos is None:
+        return None
+    # Le modèle ne fixe l'échelle qu'à une constante près : longueur de
+    # référence ramenée à spacing
+    pos -= pos.mean(axis=0)
+    pos *= spacing / _typical_length(pos, src, dst)
+    return pos[:, 0], pos[:, 1]
+
+
+def _multilevel_layout(n, src, dst, rng, report):
+    # Contraction
+    levels = [(n, src, dst, np.ones(n))]
+    labels = []
+    while levels[-1][0] > COARSEST_SIZE:
+        size, level_src, level_dst, mass = levels[-1]
+        label, coarse_size = _match(size, level_src, level_dst, rng)
+        if coarse_size > MIN_REDUCTION * size:
+            break
+        coarse_src, coarse_dst = _simple_edges(label[level_src], label[level_dst])
+        coarse_mass = np.bincount(label, weights=mass, minlength=coarse_size)
+        labels.append(label)
+        levels.append((coarse_size, coarse_src, coarse_dst, coarse_mass))
+
+    # Avancement : proportionnel au travail de chaque niveau (sommets x itérations)
+    iterations = [_level_iterations(size, COARSEST_ITERATIONS if i == len(levels) - 1 else REFINE_ITERATIONS)
+                  for i, (size, _, _, _) in enumerate(levels)]
+    work = [size * count for (size, _, _, _), count in zip(levels, iterations)]
+    total = float(sum(work))
+    done = 0.0
+
+    size, level_src, level_dst, mass = levels[-1]
+    side = np.sqrt(size)
+    pos = rng.uniform(0, side, (size, 2))
+    if not _relax(pos, level_src, level_dst, mass, iterations[-1], max(side / 10, 1.0),
+                  report=lambda fraction: report(fraction * work[-1] / total)):
+        return None
+    done += work[-1]
+    if report(done / total):
+        return None
+
+    for i in range(len(levels) - 2, -1, -1):
+        size, level_src, level_dst, mass = levels[i]
+        coarse_size = levels[i + 1][0]
+        # Chaque sommet part de la position de son représentant ; la mise à
+        # l'échelle conserve une densité d'environ un sommet par k²
+        pos = pos[labels[i]] * np.sqrt(size / coarse_size) + rng.normal(0, 0.1, (size, 2))
+        if not _relax(pos, level_src, level_dst, mass, iterations[i], 1.0,
+                      report=lambda fraction: report((done + fraction * work[i]) / total)):
+            return None
+        done += work[i]
+        if report(done / total):
+            return None
+
+    return pos
+
+
+def _level_iterations(size, iterations):
+    """Nombre d'itérations d'un niveau, borné par LEVEL_WORK"""
+    return int(min(iterations, max(MIN_ITERATIONS, LEVEL_WORK // size)))
+
+
+def _partial_layout(graph, src, dst, fixed, spacing, rng, report):
+    """Place les sommets libres autour de leurs voisins fixes (un seul niveau)"""
+    n = graph.num_vertices
+    pos = np.zeros((n, 2))
+    pos[fixed, 0] = graph.x[fixed] / spacing
+    pos[fixed, 1] = graph.y[fixed] / spacing
+
+    # Position initiale : barycentre des voisins déjà placés, propagé de
+    # proche en proche ; les sommets sans voisin placé vont au hasard
+    placed = fixed.copy()
+    for _ in range(10):
+        known = np.concatenate((placed[dst], placed[src]))
+        if not known.any():
+            break
+        targets = np.concatenate((src, dst))[known]
+        sources = np.concatenate((dst, src))[known]
+        count = np.bincount(targets, minlength=n)
+        new = (count > 0) & ~placed
+        if not new.any():
+            break
+        sum_x = np.bincount(targets, weights=pos[sources, 0], minlength=n)
+        sum_y = np.bincount(targets, weights=pos[sources, 1], minlength=n)
+        pos[new, 0] = sum_x[new] / count[new]
+        pos[new, 1] = sum_y[new] / count[new]
+        placed |= new
+
+    low, high = pos[fixed].min(axis=0), pos[fixed].max(axis=0)
+    pos[~placed] = rng.uniform(low - 1, high + 1, (int((~placed).sum()), 2))
+    pos[~fixed] += rng.normal(0, 0.3, (int((~fixed).sum()), 2))
+
+    iterations = _level_iterations(int((~fixed).sum()), PARTIAL_ITERATIONS)
+    if not _relax_local(pos, src, dst, fixed, iterations, report):
+        return None
+    return pos
+
+
+def _fixed_spacing(graph, src, dst, fixed, spacing):
+    """Distance idéale d'une disposition partielle : spacing, ou moins si les sommets fixes sont plus serrés"""
+    if np.count_nonzero(fixed) < 2:
+        return spacing
+    xy = np.column_stack((graph.x[fixed], graph.y[fixed]))
+    index = np.cumsum(fixed) - 1
+    both = fixed[src] & fixed[dst]
+    return min(spacing, _typical_length(xy, index[src[both]], index[dst[both]]))
+
+
+def _typical_length(pos, src, dst):
+    """
+    Longueur de référence de la disposition : longueur médiane des arêtes,
+    bornée par l'espacement moyen des sommets (les graphes très connectés,
+    sans bon plongement plan, ont des arêtes longues et des sommets serrés)
+    """
+    extent = pos.max(axis=0) - pos.min(axis=0)
+    lengths = [np.sqrt(extent[0] * extent[1] / len(pos))]
+    if len(src):
+        lengths.append(np.median(np.hypot(*(pos[src] - pos[dst]).T)))
+    lengths = [length for length in lengths if length > 0]
+    return min(lengths) if lengths else 1.0
+
+
+def _relax(pos, src, dst, mass, iterations, step, fixed=None, report=None):
+    """
+    Itérations du modèle ressorts-électrique (k = 1) : répulsion k²/d entre
+    toutes les paires, attraction d²/k le long des arêtes. Positions
+    modifiées en place.
+
+    Chaque sommet avance de `step` dans la direction de sa force ; le pas
+    est adapté selon l'évolution de l'énergie (Hu, 2005) : il grandit
+    après plusieurs itérations qui la font baisser, diminue sinon.
+
+    Returns:
+    --------
+    bool : False si report a demandé l'interruption
+    """
+    energy = np.inf
+    progress = 0
+    for iteration in range(iterations):
+        disp = _repulsion(pos, mass) + _attraction(pos, src, dst)
+
+        norm = np.hypot(disp[:, 0], disp[:, 1])
+        move = step / np.maximum(norm, 1e-9)
+        if fixed is not None:
+            move[fixed] = 0.0
+        pos += disp * move[:, None]
+
+        previous, energy = energy, float(np.dot(norm, norm))
+        if energy < previous:
+            progress += 1
+            if progress >= 5:
+                progress = 0
+                step /= STEP_DECAY
+        else:
+            progress = 0
+            step *= STEP_DECAY
+
+        if report is not None and iteration % 10 == 9 and report((iteration + 1) / iterations):
+            return False
+    return True
+
+
+def _relax_local(pos, src, dst, fixed, iterations, report=None):
+    """
+    Itérations de Fruchterman–Reingold avec répulsion limitée à
+    LOCAL_RADIUS et température décroissante, pour placer des sommets
+    autour de sommets fixes sans écarter le reste du graphe.
+
+    Returns:
+    --------
+    bool : False si report a demandé l'interruption
+    """
+    mass = np.ones(len(pos))
+    free = ~fixed
+    # Seules les forces sur les sommets libres servent
+    moving = free[src] | free[dst]
+    src, dst = src[moving], dst[moving]
+    for iteration in range(iterations):
+        disp = np.zeros_like(pos)
+        cells = np.floor((pos - pos.min(axis=0)) / LOCAL_RADIUS).astype(np.int64)
+        _near_repulsion(pos, mass, cells, disp, radius=LOCAL_RADIUS, active=free)
+        disp += _attraction(pos, src, dst)
+
+        # Déplacement borné par une température qui décroît jusqu'à zéro
+        t = 1.0 - iteration / iterations
+        norm = np.hypot(disp[:, 0], disp[:, 1])
+        move = np.minimum(norm, t) / np.maximum(norm, 1e-9)
+        move[fixed] = 0.0
+        pos += disp * move[:, None]
+
+        if report is not None and iteration % 10 == 9 and report((iteration + 1) / iterations):
+            return False
+    return True
+
+
+def _attraction(pos, src, dst):
+    """Forces d'attraction d²/k le long des arêtes"""
+    n = len(pos)
+    delta = pos[src] - pos[dst]
+    force = delta * np.hypot(delta[:, 0], delta[:, 1])[:, None]
+    disp = np.empty_like(pos)
+    for axis in (0, 1):
+        disp[:, axis] = (np.bincount(dst, weights=force[:, axis], minlength=n) -
+                         np.bincount(src, weights=force[:, axis], minlength=n))
+    return disp
+
+
+def _repulsion(pos, mass):
+    """
+    Forces de répulsion k²/d entre toutes les paires de sommets, approchées
+    sur une hiérarchie de grilles (à la Barnes–Hut).
+
+    Au niveau le plus fin (environ un sommet par cellule), les paires de
+    sommets de cellules voisines sont calculées exactement. À chaque
+    niveau, une cellule reçoit ensuite la force des cellules non voisines
+    dont le parent est voisin du sien, comme si leurs sommets étaient
+    réunis en leur barycentre : chaque paire de sommets est comptée une
+    fois, à l'échelle la plus fine où leurs cellules sont séparées.
+
+    Les grilles dont la taille dépasse DENSE_CELLS_PER_VERTEX cellules par
+    sommet (sommets très regroupés ou éloignés du reste du graphe) ne sont
+    parcourues que sur leurs cellules occupées.
+    """
+    n = len(pos)
+    disp = np.zeros((n, 2))
+    if n < 2:
+        return disp
+
+    origin = pos.min(axis=0)
+    extent = np.maximum(pos.max(axis=0) - origin, 1e-9)
+    size = max(np.sqrt(extent[0] * extent[1] / n), 1e-9)
+    # Grilles pleines : au plus quelques cellules par sommet
+    while np.prod(np.floor(extent / size) + 1) > DENSE_CELLS_PER_VERTEX * n:
+        size *= 2
+    cells = np.floor((pos - origin) / size).astype(np.int64)
+    # Sommets regroupés : cellules plus fines tant que les paires exactes
+    # dominent
+    for _ in range(MAX_REFINEMENTS):
+        _, counts = np.unique(cells[:, 0] * (cells[:, 1].max() + 1) + cells[:, 1], return_counts=True)
+        if np.dot(counts, counts) <= 4 * n:
+            break
+        size /= 2
+        cells = np.floor((pos - origin) / size).astype(np.int64)
+
+    _near_repulsion(pos, mass, cells, disp)
+
+    level = 0
+    while (cells[:, 0].max() >> (level + 1)) > 1 or (cells[:, 1].max() >> (level + 1)) > 1:
+        level_cells = cells >> level
+        grid_size = (int(level_cells[:, 0].max()) + 1) * (int(level_cells[:, 1].max()) + 1)
+        if grid_size <= DENSE_CELLS_PER_VERTEX * n:
+            _far_repulsion(pos, mass, level_cells, disp)
+        else:
+            _sparse_far_repulsion(pos, mass, level_cells, disp)
+        level += 1
+    return disp
+
+
+def _near_repulsion(pos, mass, cells, disp, radius=None, active=None):
+    """
+    Paires exactes entre sommets de cellules voisines (ou de la même
+    cellule), éventuellement limitées aux sommets à moins de `radius`, et
+    aux paires d'au moins un sommet de `active` (masque booléen).
+    """
+    n = len(pos)
+    width = int(cells[:, 1].max()) + 3
+    keys = cells[:, 0] * width + cells[:, 1]
+
+    order = np.argsort(keys, kind='stable')
+    unique_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    if active is not None:
+        cell_active = np.add.reduceat(active[order], starts) > 0
+
+    # Chaque paire de cellules voisines une seule fois
+    for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        neighbor_keys = unique_keys + dx * width + dy
+        j = np.minimum(np.searchsorted(unique_keys, neighbor_keys), len(unique_keys) - 1)
+        present = unique_keys[j] == neighbor_keys
+        if active is not None:
+            present &= cell_active | cell_active[j]
+        a = np.flatnonzero(present)
+        b = j[present]
+
+        i1, i2 = _cell_pairs(starts[a], counts[a], starts[b], counts[b])
+        i1, i2 = order[i1], order[i2]
+        if dx == 0 and dy == 0:
+            keep = i1 < i2  # Paires internes à une cellule : une seule fois
+            i1, i2 = i1[keep], i2[keep]
+        if active is not None:
+            keep = active[i1] | active[i2]
+            i1, i2 = i1[keep], i2[keep]
+
+        delta = pos[i1] - pos[i2]
+        d2 = np.maximum(delta[:, 0] ** 2 + delta[:, 1] ** 2, 1e-6)
+        if radius is not None:
+            near = d2 < radius * radius
+            i1, i2, delta, d2 = i1[near], i2[near], delta[near], d2[near]
+
+        # Force k²/d dirigée selon delta / d : delta / d²
+        push = delta / d2[:, None]
+        for axis in (0, 1):
+            disp[:, axis] += np.bincount(i1, weights=push[:, axis] * mass[i2], minlength=n)
+            disp[:, axis] -= np.bincount(i2, weights=push[:, axis] * mass[i1], minlength=n)
+
+
+def _far_repulsion(pos, mass, cells, disp):
+    """Interactions barycentre à barycentre d'un niveau de la grille"""
+    width, height = int(cells[:, 0].max()) + 1, int(cells[:, 1].max()) + 1
+    flat = cells[:, 0] * height + cells[:, 1]
+
+    def grid(weights):
+        return np.bincount(flat, weights=weights, minlength=width * height).reshape(width, height)
+
+    cell_mass = grid(mass)
+    occupied = cell_mass > 0
+    center_x = np.divide(grid(mass * pos[:, 0]), cell_mass, out=np.zeros_like(cell_mass), where=occupied)
+    center_y = np.divide(grid(mass * pos[:, 1]), cell_mass, out=np.zeros_like(cell_mass), where=occupied)
+
+    force_x = np.zeros((width, height))
+    force_y = np.zeros((width, height))
+    # Sources : enfants des 3 x 3 parents voisins du parent de la cible, non
+    # voisins de la cible. Décalages de -3 à 3 ; ±3 seulement depuis une
+    # cible de parité donnée (paire pour +3, impaire pour -3)
+    for ox in range(-3, 4):
+        rows = _offset_slices(ox, width)
+        if rows is None:
+            continue
+        for oy in range(-3, 4):
+            if abs(ox) <= 1 and abs(oy) <= 1:
+                continue
+            columns = _offset_slices(oy, height)
+            if columns is None:
+                continue
+            target = (rows[0], columns[0])
+            source = (rows[1], columns[1])
+            dx = center_x[target] - center_x[source]
+            dy = center_y[target] - center_y[source]
+            scale = cell_mass[source] / np.maximum(dx * dx + dy * dy, 1e-6)
+            force_x[target] += dx * scale
+            force_y[target] += dy * scale
+
+    disp[:, 0] += force_x.ravel()[flat]
+    disp[:, 1] += force_y.ravel()[flat]
+
+
+def _sparse_far_repulsion(pos, mass, cells, disp):
+    """
+    Même calcul que _far_repulsion, limité aux cellules occupées : les
+    cellules sources sont retrouvées par recherche dans les clés triées.
+    """
+    # Colonnes décalées de 3 : les décalages de -3 à 3 restent dans la ligne
+    width = int(cells[:, 1].max()) + 7
+    keys, inverse = np.unique(cells[:, 0] * width + cells[:, 1] + 3, return_inverse=True)
+    cell_x, cell_y = keys // width, keys % width - 3
+    cell_mass = np.bincount(inverse, weights=mass)
+    center_x = np.bincount(inverse, weights=mass * pos[:, 0]) / cell_mass
+    center_y = np.bincount(inverse, weights=mass * pos[:, 1]) / cell_mass
+
+    force_x = np.zeros(len(keys))
+    force_y = np.zeros(len(keys))
+    for ox in range(-3, 4):
+        for oy in range(-3, 4):
+            if abs(ox) <= 1 and abs(oy) <= 1:
+                continue
+            # ±3 seulement depuis une cible de parité donnée (voir _far_repulsion)
+            target = np.ones(len(keys), dtype=bool)
+            if abs(ox) == 3:
+                target &= cell_x % 2 == (0 if ox > 0 else 1)
+            if abs(oy) == 3:
+                target &= cell_y % 2 == (0 if oy > 0 else 1)
+            target = np.flatnonzero(target)
+            source_keys = keys[target] + ox * width + oy
+            source = np.minimum(np.searchsorted(keys, source_keys), len(keys) - 1)
+            present = keys[source] == source_keys
+            target, source = target[present], source[present]
+
+            dx = center_x[target] - center_x[source]
+            dy = center_y[target] - center_y[source]
+            scale = cell_mass[source] / np.maximum(dx * dx + dy * dy, 1e-6)
+            force_x[target] += dx * scale
+            force_y[target] += dy * scale
+
+    disp[:, 0] += force_x[inverse]
+    disp[:, 1] += force_y[inverse]
+
+
+def _offset_slices(offset, length):
+    """
+    Tranches (cibles, sources) d'un axe de la grille pour un décalage
+    source - cible ; None si aucune cible ne convient.
+    """
+    start = max(0, -offset)
+    stop = min(length, length - offset)
+    step = 1
+    if abs(offset) == 3:
+        # +3 : cibles paires seulement ; -3 : cibles impaires seulement
+        parity = 0 if offset > 0 else 1
+        if start % 2 != parity:
+            start += 1
+        step = 2
+    if start >= stop:
+        return None
+    return slice(start, stop, step), slice(start + offset, stop + offset, step)
+
+
+def _cell_pairs(starts_a, counts_a, starts_b, counts_b):
+    """Toutes les paires (position dans a, position dans b) de paires de cellules"""
+    sizes = counts_a * counts_b
+    total = int(sizes.sum())
+    pair = np.repeat(np.arange(len(sizes)), sizes)
+    offset = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    width = counts_b[pair]
+    return starts_a[pair] + offset // width, starts_b[pair] + offset % width
+
+
+def _match(n, src, dst, rng):
+    """
+    Couplage aléatoire des sommets le long des arêtes : chaque arête libre
+    reçoit une priorité aléatoire et est retenue si elle est la meilleure
+    pour ses deux extrémités.
+
+    Si le couplage réduit trop peu le graphe (étoiles, graphes peu
+    planaires), les sommets restés seuls rejoignent le groupe d'un voisin
+    couplé (les feuilles d'une étoile sont réunies à son centre) et les
+    sommets isolés sont regroupés deux à deux.
+
+    Returns:
+    --------
+    tuple : (représentant de chaque sommet dans 0..m-1, m)
+    """
+    mate = np.full(n, -1, dtype=np.int64)
+    for _ in range(MATCHING_ROUNDS):
+        free = (mate[src] < 0) & (mate[dst] < 0)
+        if not free.any():
+            break
+        u, v = src[free], dst[free]
+        priority = rng.random(len(u))
+        best = np.full(n, -1.0)
+        np.maximum.at(best, u, priority)
+        np.maximum.at(best, v, priority)
+        chosen = (best[u] == priority) & (best[v] == priority)
+        mate[u[chosen]] = v[chosen]
+        mate[v[chosen]] = u[chosen]
+
+    vertices = np.arange(n)
+    representative = np.where(mate >= 0, np.minimum(vertices, mate), vertices)
+
+    alone = mate < 0
+    if n - np.count_nonzero(~alone) // 2 > MIN_REDUCTION * n:
+        for a, b in ((src, dst), (dst, src)):
+            join = alone[a] & ~alone[b]
+            representative[a[join]] = representative[b[join]]
+        degree = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+        isolated = np.flatnonzero(degree == 0)
+        representative[isolated[1::2]] = isolated[0:len(isolated) - 1:2]
+
+    _, label = np.unique(representative, return_inverse=True)
+    return label, int(label.max()) + 1
+
+
+def _simple_edges(src, dst):
+    """Arêtes sans boucle ni doublon, chaque paire une seule fois (u < v)"""
+    u = np.minimum(src, dst)
+    v = np.maximum(src, dst)
+    keep = u != v
+    u, v = u[keep], v[keep]
+    if len(u) == 0:
+        return u, v
+    width = int(v.max()) + 1
+    pairs = np.unique(u * width + v)
+    return pairs // width, pairs % width
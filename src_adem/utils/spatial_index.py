@@ -0,0 +1,118 @@
+import math
+
+
+class SpatialGrid:
+    """
+    Index spatial à grille uniforme : chaque point est rangé dans la cellule
+    de côté `cell_size` qui le contient.
+
+    Insertion, déplacement et suppression sont en O(1) ; la recherche du
+    point le plus proche dans un rayon de l'ordre de `cell_size` ne visite
+    que les cellules voisines, et une requête rectangulaire ne visite que
+    les cellules qu'elle recouvre.
+    """
+
+    def __init__(self, cell_size=40.0):
+        self.cell_size = float(cell_size)
+        self._cells = {}      # (cx, cy) -> set d'identifiants
+        self._positions = {}  # identifiant -> (x, y, (cx, cy))
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, key, x, y):
+        """Ajoute un point (ou le déplace s'il existe déjà)"""
+        if key in self._positions:
+            self.move(key, x, y)
+            return
+        cell = self._cell(x, y)
+        self._positions[key] = (x, y, cell)
+        self._cells.setdefault(cell, set()).add(key)
+
+    def move(self, key, x, y):
+        """Met à jour la position d'un point"""
+        old = self._positions.get(key)
+        if old is None:
+            self.insert(key, x, y)
+            return
+        cell = self._cell(x, y)
+        if cell != old[2]:
+            self._discard_from_cell(key, old[2])
+            self._cells.setdefault(cell, set()).add(key)
+        self._positions[key] = (x, y, cell)
+
+    def remove(self, key):
+        """Retire un point (sans effet s'il est absent)"""
+        old = self._positions.pop(key, None)
+        if old is not None:
+            self._discard_from_cell(key, old[2])
+
+    def clear(self):
+        self._cells.clear()
+        self._positions.clear()
+
+    def position(self, key):
+        """Position (x, y) d'un point"""
+        x, y, _ = self._positions[key]
+        return x, y
+
+    def nearest(self, x, y, radius):
+        """
+        Point le plus proche de (x, y) à une distance au plus `radius`.
+
+        Returns:
+        --------
+        identifiant ou None
+        """
+        best_key = None
+        best_d2 = radius * radius
+        for key, (px, py) in self._candidates(x - radius, y - radius, x + radius, y + radius):
+            d2 = (px - x) ** 2 + (py - y) ** 2
+            if d2 <= best_d2:
+                best_key, best_d2 = key, d2
+        return best_key
+
+    def query_rect(self, x1, y1, x2, y2):
+        """Identifiants des points contenus dans le rectangle [x1, x2] x [y1, y2]"""
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        return [
+            key for key, (px, py) in self._candidates(x1, y1, x2, y2)
+            if x1 <= px <= x2 and y1 <= py <= y2
+        ]
+
+    def _candidates(self, x1, y1, x2, y2):
+        """Points des cellules recouvrant le rectangle"""
+        cx1, cy1 = self._cell(x1, y1)
+        cx2, cy2 = self._cell(x2, y2)
+        positions = self._positions
+
+        if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > len(self._cells):
+            # Rectangle plus grand que la zone occupée : parcourir les cellules non vides
+            cells = (keys for (cx, cy), keys in self._cells.items()
+                     if cx1 <= cx <= cx2 and cy1 <= cy <= cy2)
+        else:
+            cells = (self._cells[(cx, cy)]
+                     for cx in range(cx1, cx2 + 1)
+                     for cy in range(cy1, cy2 + 1)
+                     if (cx, cy) in self._cells)
+
+        for keys in cells:
+            for key in keys:
+                px, py, _ = positions[key]
+                yield key, (px, py)
+
+    def _discard_from_cell(self, key, cell):
+        keys = self._cells.get(cell)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
@@ -0,0 +1,323 @@
+from itertools import repeat
+from operator import itemgetter, methodcaller
+
+import numpy as np
+
+from models.graph import Graph, TYPE_CODES, TYPE_FORBIDDEN
+
+_MISSING = object()
+
+
+def validate_graph(graph_data, max_samples=5):
+    """
+    Valide les données du graphe en une seule passe sur leur forme tabulaire.
+
+    Les champs des sommets et des arêtes sont extraits une fois en tableaux,
+    puis tous les contrôles sont vectorisés. Tous les problèmes sont collectés
+    (avec leur nombre d'occurrences et quelques exemples) au lieu de
+    s'arrêter au premier.
+
+    Parameters:
+    -----------
+    graph_data : dict
+        Données du graphe au format {'vertices': [...], 'edges': [...]}
+    max_samples : int
+        Nombre maximum d'exemples conservés par problème
+
+    Returns:
+    --------
+    dict : Rapport {'valid', 'errors', 'warnings', 'num_vertices',
+           'num_edges', 'graph'} où 'graph' est la forme tabulaire
+           (models.graph.Graph) si les données sont valides
+    """
+    report = {
+        'valid': False,
+        'errors': [],
+        'warnings': [],
+        'num_vertices': 0,
+        'num_edges': 0,
+        'graph': None
+    }
+    errors = report['errors']
+    warnings = report['warnings']
+
+    # Structure générale (erreurs bloquantes)
+    if not isinstance(graph_data, dict):
+        _add_issue(errors, 'invalid_structure', "Les données du graphe doivent être un dictionnaire",
+                   [0], lambda i: type(graph_data).__name__, max_samples)
+        return report
+
+    for key in ('vertices', 'edges'):
+        if key not in graph_data:
+            _add_issue(errors, 'missing_key', f"Clé '{key}' manquante",
+                       [0], lambda i: key, max_samples)
+        elif not isinstance(graph_data[key], list):
+            _add_issue(errors, 'invalid_structure', f"'{key}' doit être une liste",
+                       [0], lambda i: key, max_samples)
+    if errors:
+        return report
+
+    vertices = graph_data['vertices']
+    edges = graph_data['edges']
+    n = len(vertices)
+    m = len(edges)
+    report['num_vertices'] = n
+    report['num_edges'] = m
+
+    # ---------------------------------------------------------------
+    # Sommets
+    # ---------------------------------------------------------------
+    not_dict, ids, costs, types, xs, ys = _extract_vertices(vertices)
+    _add_issue(errors, 'vertex_not_dict', "Sommets qui ne sont pas des objets",
+               not_dict, lambda i: f"#{i}", max_samples)
+
+    id_kinds = _kinds(ids)
+    missing_id = ~not_dict & (id_kinds == type(_MISSING))
+    _add_issue(errors, 'missing_vertex_id', "Sommets sans identifiant 'id'",
+               missing_id, lambda i: f"#{i}", max_samples)
+
+    bad_id = ~not_dict & ~missing_id & (id_kinds != str)
+    _add_issue(errors, 'invalid_vertex_id', "Identifiants de sommet non textuels",
+               bad_id, lambda i: f"#{i} ({ids[i]!r})", max_samples)
+
+    # Index id -> position, construit à rebours pour que la première
+    # occurrence d'un identifiant dupliqué l'emporte
+    valid_id = ~(not_dict | missing_id | bad_id)
+    if valid_id.all():
+        index = dict(zip(reversed(ids), range(n - 1, -1, -1)))
+    else:
+        index = {ids[i]: i for i in np.flatnonzero(valid_id)[::-1].tolist()}
+
+    if len(index) < int(valid_id.sum()):
+        duplicated = valid_id & (_lookup(index, ids) != np.arange(n))
+        _add_issue(errors, 'duplicate_vertex_id', "Identifiants de sommet dupliqués",
+                   duplicated, lambda i: str(ids[i]), max_samples)
+
+    # Coûts : numériques, finis et positifs
+    cost_arr, numeric = _numeric_array(costs)
+    _add_issue(errors, 'invalid_cost_type', "Coûts non numériques",
+               ~numeric, lambda i: f"{_label(ids, i)} ({costs[i]!r})", max_samples)
+
+    with np.errstate(invalid='ignore'):
+        non_finite = numeric & ~np.isfinite(cost_arr)
+        negative = numeric & ~non_finite & (cost_arr < 0)
+    _add_issue(errors, 'non_finite_cost', "Coûts infinis ou NaN",
+               non_finite, lambda i: _label(ids, i), max_samples)
+    _add_issue(errors, 'negative_cost', "Coûts négatifs",
+               negative, lambda i: f"{_label(ids, i)} ({cost_arr[i]:g})", max_samples)
+
+    # Types de sommets
+    type_codes = _lookup(TYPE_CODES, types).astype(np.int8)
+    _add_issue(errors, 'invalid_vertex_type',
+               f"Types de sommet inconnus (attendus : {', '.join(sorted(TYPE_CODES))})",
+               type_codes < 0, lambda i: f"{_label(ids, i)} ({types[i]!r})", max_samples)
+
+    # Coordonnées : leur absence n'empêche pas la résolution
+    x_arr, x_ok = _numeric_array(xs)
+    y_arr, y_ok = _numeric_array(ys)
+    _add_issue(warnings, 'missing_coordinates', "Sommets sans coordonnées 'x'/'y'",
+               ~not_dict & ~(x_ok & y_ok), lambda i: _label(ids, i), max_samples)
+
+    # ---------------------------------------------------------------
+    # Arêtes
+    # ---------------------------------------------------------------
+    edge_not_dict, froms, tos, crits = _extract_edges(edges)
+    _add_issue(errors, 'edge_not_dict', "Arêtes qui ne sont pas des objets",
+               edge_not_dict, lambda i: f"#{i}", max_samples)
+
+    missing_end = ~edge_not_dict & ((_kinds(froms) == type(_MISSING)) |
+                                    (_kinds(tos) == type(_MISSING)))
+    _add_issue(errors, 'missing_endpoint', "Arêtes sans 'from' ou 'to'",
+               missing_end, lambda i: f"#{i}", max_samples)
+
+    def describe_edge(i):
+        return f"#{i} ({froms[i]}-{tos[i]})"
+
+    src = _lookup(index, froms)
+    dst = _lookup(index, tos)
+    unknown = ~edge_not_dict & ~missing_end & ((src < 0) | (dst < 0))
+    _add_issue(errors, 'unknown_endpoint', "Arêtes reliant des sommets inexistants",
+               unknown, describe_edge, max_samples)
+
+    bad_critical = _kinds(crits) != bool
+    if bad_critical.any():
+        crit_arr = np.fromiter((c is True for c in crits), dtype=bool, count=m)
+    else:
+        crit_arr = np.fromiter(crits, dtype=bool, count=m)
+    _add_issue(errors, 'invalid_critical', "Attributs 'critical' non booléens",
+               bad_critical, lambda i: f"#{i} ({crits[i]!r})", max_samples)
+
+    linked = (src >= 0) & (dst >= 0)
+    self_loop = linked & (src == dst)
+    _add_issue(errors, 'self_loop', "Boucles (arête d'un sommet vers lui-même)",
+               self_loop, describe_edge, max_samples)
+
+    linked_idx = np.flatnonzero(linked & ~self_loop)
+    if len(linked_idx):
+        lo = np.minimum(src[linked_idx], dst[linked_idx])
+        hi = np.maximum(src[linked_idx], dst[linked_idx])
+
+        # Doublons (non orientés) : tri des clés (min, max)
+        keys = lo * max(n, 1) + hi
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        repeated = np.sort(order[1:][sorted_keys[1:] == sorted_keys[:-1]])
+        _add_issue(warnings, 'duplicate_edge', "Arêtes dupliquées (ignorées par l'éditeur)",
+                   linked_idx[repeated], describe_edge, max_samples)
+
+        # Contradictions avec les sommets interdits
+        forbidden_src = type_codes[src[linked_idx]] == TYPE_FORBIDDEN
+        forbidden_dst = type_codes[dst[linked_idx]] == TYPE_FORBIDDEN
+        critical_linked = crit_arr[linked_idx]
+        _add_issue(errors, 'critical_forbidden',
+                   "Arêtes critiques incidentes à un sommet interdit",
+                   linked_idx[critical_linked & (forbidden_src | forbidden_dst)],
+                   describe_edge, max_samples)
+        _add_issue(errors, 'uncoverable_edge',
+                   "Arêtes dont les deux extrémités sont interdites",
+                   linked_idx[~critical_linked & forbidden_src & forbidden_dst],
+                   describe_edge, max_samples)
+
+    report['valid'] = not errors
+    if report['valid']:
+        graph = Graph(ids, cost_arr, type_codes, src, dst, crit_arr, x_arr, y_arr)
+        graph._index = index
+        report['graph'] = graph
+
+    return report
+
+
+def format_validation_report(report, max_issues=10):
+    """Formate un rapport de validation en texte lisible"""
+    errors = report.get('errors', [])
+    warnings = report.get('warnings', [])
+
+    if not errors and not warnings:
+        return "Données valides."
+
+    lines = []
+    if errors:
+        lines.append(f"{len(errors)} problème(s) bloquant(s) détecté(s) :")
+        lines.extend(_format_issue(issue) for issue in errors[:max_issues])
+        if len(errors) > max_issues:
+            lines.append(f"• ... et {len(errors) - max_issues} autre(s) problème(s)")
+    if warnings:
+        if lines:
+            lines.append("")
+        lines.append(f"{len(warnings)} avertissement(s) :")
+        lines.extend(_format_issue(issue) for issue in warnings[:max_issues])
+
+    return "\n".join(lines)
+
+
+def validate_graph_data(graph_data):
+    """
+    Valide les données du graphe.
+
+    Returns:
+    --------
+    tuple : (bool, str) - (valide, message d'erreur)
+    """
+    report = validate_graph(graph_data)
+    if report['valid']:
+        return True, "Données valides."
+    return False, format_validation_report(report)
+
+
+def _extract_vertices(vertices):
+    """
+    Extrait les champs des sommets en listes parallèles.
+
+    Le cas courant (uniquement des dicts) passe par des itérateurs C ;
+    sinon, les éléments invalides reçoivent des valeurs neutres.
+    """
+    not_dict = _kinds(vertices) != dict
+    if not not_dict.any():
+        dicts = vertices
+    else:
+        dicts = [v if type(v) is dict else {} for v in vertices]
+
+    return (
+        not_dict,
+        list(map(methodcaller('get', 'id', _MISSING), dicts)),
+        list(map(methodcaller('get', 'cost', 1.0), dicts)),
+        list(map(methodcaller('get', 'type', 'normal'), dicts)),
+        list(map(methodcaller('get', 'x'), dicts)),
+        list(map(methodcaller('get', 'y'), dicts))
+    )
+
+
+def _extract_edges(edges):
+    """Extrait les champs des arêtes en listes parallèles"""
+    m = len(edges)
+    try:
+        # Cas courant : toutes les arêtes sont des dicts complets
+        froms = list(map(itemgetter('from'), edges))
+        tos = list(map(itemgetter('to'), edges))
+        crits = list(map(methodcaller('get', 'critical', False), edges))
+        return np.zeros(m, dtype=bool), froms, tos, crits
+    except (KeyError, TypeError, AttributeError):
+        pass
+
+    not_dict = _kinds(edges) != dict
+    dicts = [e if type(e) is dict else {'critical': False} for e in edges]
+    return (
+        not_dict,
+        list(map(methodcaller('get', 'from', _MISSING), dicts)),
+        list(map(methodcaller('get', 'to', _MISSING), dicts)),
+        list(map(methodcaller('get', 'critical', False), dicts))
+    )
+
+
+def _kinds(values):
+    """Tableau des types Python des valeurs (comparaisons vectorisées)"""
+    return np.fromiter(map(type, values), dtype=object, count=len(values))
+
+
+def _numeric_array(values):
+    """Convertit des valeurs en float64 (NaN si non numériques) et retourne le masque"""
+    kinds = _kinds(values)
+    numeric = (kinds == float) | (kinds == int)
+    if numeric.all():
+        return np.array(values, dtype=np.float64), numeric
+
+    arr = np.full(len(values), np.nan)
+    idx = np.flatnonzero(numeric)
+    arr[idx] = [values[i] for i in idx.tolist()]
+    return arr, numeric
+
+
+def _lookup(table, keys):
+    """Convertit des clés en indices via une table (-1 si inconnues)"""
+    count = len(keys)
+    try:
+        return np.array(list(map(table.get, keys, repeat(-1, count))), dtype=np.int64).reshape(count)
+    except TypeError:
+        # Clés non hachables : conversion prudente
+        return np.fromiter((table.get(k, -1) if isinstance(k, str) else -1 for k in keys),
+                           dtype=np.int64, count=count)
+
+
+def _format_issue(issue):
+    samples = ', '.join(issue['samples'])
+    suffix = " ..." if issue['count'] > len(issue['samples']) else ""
+    return f"• {issue['message']} : {issue['count']} (ex. : {samples}{suffix})"
+
+
+def _add_issue(bucket, code, message, where, describe, max_samples):
+    """Ajoute un problème au rapport à partir d'un masque booléen ou d'indices"""
+    where = np.asarray(where)
+    indices = np.flatnonzero(where) if where.dtype == bool else where
+    if len(indices) == 0:
+        return
+    bucket.append({
+        'code': code,
+        'message': message,
+        'count': int(len(indices)),
+        'samples': [describe(int(i)) for i in indices[:max_samples]]
+    })
+
+
+def _label(ids, i):
+    v_id = ids[i]
+    return str(v_id) if isinstance(v_id, str) else f"#{i}"
@@ -0,0 +1,75 @@
+"""
+Preprocessing benchmark: times compute_intermediates on the shipped test
+cases, then on synthetic deployments of growing size (up to 50k users by
+default).
+
+Usage:
+    python benchmark.py [max_users]
+"""
+import glob
+import json
+import os
+import random
+import sys
+import time
+
+from calculations import BASE_POWER, compute_intermediates
+
+TEST_CASES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_cases")
+DEFAULT_SETTINGS = {"WifiBand": "2.4 GHz", "EnvironmentType": "Indoor", "IncludePowerConsumption": True}
+SIZES = (100, 500, 1000, 5000, 10000, 20000, 50000)
+USERS_PER_AP = 250
+AP_SPACING = 6  # Coordinate units between neighbouring APs
+CHANNELS = (1, 6, 11)
+
+
+def synthetic_case(num_users, seed=0):
+    """Uniform deployment: APs on a jittered grid, users spread over the same area."""
+    rng = random.Random(seed)
+    num_aps = max(2, num_users // USERS_PER_AP)
+    side = int(num_aps ** 0.5) + 1
+    extent = side * AP_SPACING
+
+    aps = [{
+        "Name": f"AP{i}",
+        "X": (i % side + rng.random()) * AP_SPACING,
+        "Y": (i // side + rng.random()) * AP_SPACING,
+        "Channel": rng.choice(CHANNELS),
+        "Capacity": rng.randint(10, 40)
+    } for i in range(num_aps)]
+    users = [{
+        "Name": f"U{i}",
+        "Priority": rng.choice(("High", "Medium", "Low")),
+        "X": rng.uniform(0, extent),
+        "Y": rng.uniform(0, extent),
+        "Device": rng.choice(list(BASE_POWER))
+    } for i in range(num_users)]
+    return users, aps
+
+
+def run_case(label, users, aps, settings):
+    start = time.perf_counter()
+    intermediates = compute_intermediates(users, aps, settings)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {len(users):>7} {len(aps):>6} {len(intermediates['E']):>8} "
+          f"{len(intermediates['I']):>6} {elapsed:>9.3f}")
+
+
+def main():
+    max_users = int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1]
+
+    print(f"{'Case':<28} {'Users':>7} {'APs':>6} {'|E|':>8} {'|I|':>6} {'Time (s)':>9}")
+    for path in sorted(glob.glob(os.path.join(TEST_CASES_DIR, "*.json"))):
+        with open(path) as f:
+            case = json.load(f)
+        run_case(os.path.splitext(os.path.basename(path))[0], case["users"], case["aps"], case["settings"])
+
+    for num_users in SIZES:
+        if num_users > max_users:
+            break
+        users, aps = synthetic_case(num_users)
+        run_case(f"Synthetic ({num_users} users)", users, aps, DEFAULT_SETTINGS)
+
+
+if __name__ == "__main__":
+    main()
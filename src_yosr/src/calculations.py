@@ -1,6 +1,173 @@
-import math
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import ItemsView, Mapping
+from itertools import compress
 
-def compute_intermediates(users, aps, settings):
+import numpy as np
+
+from spatial import pairs_within, close_pairs
+
+# Normalized energy costs with 0.7 scaling factor
+BASE_POWER = {
+    "IoT Sensor": 1,
+    "Wearable": 1,
+    "Smartphone": 3,
+    "Tablet": 4,
+    "Laptop": 6
+}
+
+# Largest D_max over all bands and environments, and D_intf / D_max: the
+# geometry cache keeps every pair that some setting can use
+LARGEST_D_MAX = 12
+INTERFERENCE_FACTOR = 1.5
+
+# Number of user/AP layouts kept by the geometry cache, shared by the
+# solver thread and the GUI thread (guarded by _geometry_lock)
+GEOMETRY_CACHE_SIZE = 4
+_geometry_cache = OrderedDict()
+_geometry_lock = threading.Lock()
+
+
+def _coordinates(records):
+    """Indices and (n, 2) coordinate array of the records that have both X and Y."""
+    indices = [i for i, r in enumerate(records) if r["X"] is not None and r["Y"] is not None]
+    xy = np.array([(records[i]["X"], records[i]["Y"]) for i in indices], dtype=float).reshape(-1, 2)
+    return np.array(indices, dtype=np.intp), xy
+
+
+def _index_by_name(records):
+    """Name -> index of the first record with that name."""
+    index = {}
+    for i, r in enumerate(records):
+        index.setdefault(r["Name"], i)
+    return index
+
+
+class SparseDistances(Mapping):
+    """
+    User-AP distances restricted to the pairs within `radius`, in CSR form:
+    the APs of user i are ap[indptr[i]:indptr[i + 1]] (sorted), with their
+    distances in the same slice of `distance`. User and AP indices refer to
+    the input lists.
+
+    Read-only dict-like access by (user name, AP name) is kept for the
+    code that used the former all-pairs dict; pairs beyond the radius are
+    simply absent.
+    """
+
+    def __init__(self, user_names, ap_names, user_index, ap_index, user, ap, distance, radius):
+        self.user_names = user_names
+        self.ap_names = ap_names
+        self.user_index = user_index
+        self.ap_index = ap_index
+        self.user = user          # COO rows, sorted by user then AP
+        self.ap = ap
+        self.distance = distance
+        self.radius = radius
+        self.indptr = np.searchsorted(user, np.arange(len(user_names) + 1))
+
+    def _position(self, key):
+        try:
+            u_name, a_name = key
+            i, j = self.user_index[u_name], self.ap_index[a_name]
+        except (TypeError, ValueError, KeyError):
+            return None
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        k = lo + int(np.searchsorted(self.ap[lo:hi], j))
+        return k if k < hi and self.ap[k] == j else None
+
+    def __getitem__(self, key):
+        k = self._position(key)
+        if k is None:
+            raise KeyError(key)
+        return float(self.distance[k])
+
+    def __contains__(self, key):
+        return self._position(key) is not None
+
+    def __iter__(self):
+        return ((self.user_names[i], self.ap_names[j]) for i, j in zip(self.user.tolist(), self.ap.tolist()))
+
+    def __len__(self):
+        return len(self.distance)
+
+    def items(self):
+        return _SparseItems(self)
+
+
+class _SparseItems(ItemsView):
+    def __iter__(self):
+        return zip(iter(self._mapping), self._mapping.distance.tolist())
+
+
+class _Geometry:
+    """
+    Settings-independent preprocessing of one user/AP layout: name tables,
+    coordinates, and the neighbour lists (sorted by user then AP, i < j for
+    AP pairs on the same channel) up to the largest D_max and D_intf.
+    """
+
+    def __init__(self, users, aps, user_idx, user_xy, ap_idx, ap_xy, channel):
+        self.user_names = [u["Name"] for u in users]
+        self.ap_names = [a["Name"] for a in aps]
+        self.user_index = _index_by_name(users)
+        self.ap_index = _index_by_name(aps)
+        self.user_idx, self.user_xy = user_idx, user_xy
+        self.ap_idx, self.ap_xy = ap_idx, ap_xy
+        self.located_aps = [self.ap_names[j] for j in ap_idx.tolist()]
+        channel = channel[[self.ap_index[name] for name in self.located_aps]]  # First AP with each name
+
+        r, k, self.user_d = pairs_within(user_xy, ap_xy, LARGEST_D_MAX)
+        self.user_u, self.user_a = user_idx[r], ap_idx[k]
+        self.user_keys = [(self.user_names[i], self.ap_names[j])
+                          for i, j in zip(self.user_u.tolist(), self.user_a.tolist())]
+
+        self.ap_i, self.ap_j, self.ap_d = close_pairs(ap_xy, INTERFERENCE_FACTOR * LARGEST_D_MAX, groups=channel)
+        self.ap_keys = [(self.located_aps[i], self.located_aps[j])
+                        for i, j in zip(self.ap_i.tolist(), self.ap_j.tolist())]
+
+    def user_pairs(self, radius):
+        """COO arrays (user, AP, distance) of the pairs within radius."""
+        if radius <= LARGEST_D_MAX:
+            keep = self.user_d <= radius
+            return self.user_u[keep], self.user_a[keep], self.user_d[keep]
+        r, k, d = pairs_within(self.user_xy, self.ap_xy, radius)
+        return self.user_idx[r], self.ap_idx[k], d
+
+
+def _geometry(users, aps):
+    """Geometry of a layout, from the cache when positions, names and AP channels are unchanged."""
+    user_idx, user_xy = _coordinates(users)
+    ap_idx, ap_xy = _coordinates(aps)
+    channel_codes = {}
+    channel = np.array([channel_codes.setdefault(a["Channel"], len(channel_codes)) for a in aps],
+                       dtype=np.intp)
+
+    digest = hashlib.sha1()
+    for array in (user_idx, user_xy, ap_idx, ap_xy, channel):
+        digest.update(array.tobytes())
+        digest.update(b"|")
+    names = (tuple(u["Name"] for u in users), tuple(a["Name"] for a in aps), tuple(channel_codes))
+    key = (digest.hexdigest(), names)
+
+    with _geometry_lock:
+        geometry = _geometry_cache.get(key)
+        if geometry is not None:
+            _geometry_cache.move_to_end(key)
+            return geometry
+
+    # Built outside the lock: a concurrent call on another layout is not blocked
+    geometry = _Geometry(users, aps, user_idx, user_xy, ap_idx, ap_xy, channel)
+    with _geometry_lock:
+        geometry = _geometry_cache.setdefault(key, geometry)
+        _geometry_cache.move_to_end(key)
+        while len(_geometry_cache) > GEOMETRY_CACHE_SIZE:
+            _geometry_cache.popitem(last=False)
+    return geometry
+
+
+def compute_intermediates(users, aps, settings, display_radius=None):
     env = settings["EnvironmentType"]
     wifi_band = settings["WifiBand"]
     include_power = settings["IncludePowerConsumption"]
@@ -14,59 +181,47 @@ def compute_intermediates(users, aps, settings):
     else:  # 5 GHz
         D_max = 3 if env == "Indoor" else 5 if env == "Urban" else 10
 
-    D_intf = 1.5 * D_max
+    D_intf = INTERFERENCE_FACTOR * D_max
 
-    # Distances and feasible edges
-    distances, E = {}, []
-    for u in users:
-        for a in aps:
-            if None in (u["X"], u["Y"], a["X"], a["Y"]):
-                continue
-            d = math.sqrt((u["X"] - a["X"])**2 + (u["Y"] - a["Y"])**2)
-            distances[(u["Name"], a["Name"])] = d
-            if d <= D_max:
-                E.append((u["Name"], a["Name"]))
-
-    # Normalized energy costs with 0.7 scaling factor
-    base_power = {
-        "IoT Sensor": 1,
-        "Wearable": 1,
-        "Smartphone": 3,
-        "Tablet": 4,
-        "Laptop": 6
-    }
+    # Name tables and neighbour lists, shared with the previous calls on the
+    # same layout: the settings only re-threshold and re-cost them
+    geometry = _geometry(users, aps)
+    user_names, ap_names = geometry.user_names, geometry.ap_names
+    user_index, ap_index = geometry.user_index, geometry.ap_index
+
+    # User-AP distances kept sparse for display
+    radius = D_max if display_radius is None else display_radius
+    distances = SparseDistances(user_names, ap_names, user_index, ap_index,
+                                *geometry.user_pairs(radius), radius)
+
+    # Feasible edges
+    feasible = geometry.user_d <= D_max
+    edge_u, edge_d = geometry.user_u[feasible], geometry.user_d[feasible]
+    E = list(compress(geometry.user_keys, feasible))
+
+    # Energy costs (device of the first user with each name)
+    if include_power:
+        factor = np.array([BASE_POWER.get(users[user_index[name]]["Device"], 1) for name in user_names],
+                          dtype=float)
+    else:
+        factor = np.zeros(len(users))
+    cost = 0.1 * factor[edge_u] * (edge_d ** alpha) / (D_max ** alpha)
+    c = dict(zip(E, cost.tolist()))
+
+    # Interference pairs: APs on the same channel within D_intf; AP-AP
+    # distances are only kept for these pairs
+    interfering = geometry.ap_d <= D_intf
+    i1, i2, d_ab = geometry.ap_i[interfering], geometry.ap_j[interfering], geometry.ap_d[interfering]
+    I = list(compress(geometry.ap_keys, interfering))
+    ap_distances = dict(zip(I, d_ab.tolist()))
 
-    c = {}
-    for (u_name, a_name) in E:
-        device_type = next(u for u in users if u["Name"] == u_name)["Device"]
-        factor = base_power.get(device_type, 1) if include_power else 0
-        c[(u_name, a_name)] = 0.1 * factor * (distances[(u_name, a_name)] ** alpha) / (D_max ** alpha)
-
-    # AP-AP distances
-    ap_distances = {}
-    for i, a1 in enumerate(aps):
-        for j, a2 in enumerate(aps):
-            if i < j and None not in (a1["X"], a1["Y"], a2["X"], a2["Y"]):
-                d_ab = math.sqrt((a1["X"] - a2["X"])**2 + (a1["Y"] - a2["Y"])**2)
-                ap_distances[(a1["Name"], a2["Name"])] = d_ab
-
-    # Interference pairs
-    I = []
-    for (a1_name, a2_name), d_ab in ap_distances.items():
-        a1 = next(a for a in aps if a["Name"] == a1_name)
-        a2 = next(a for a in aps if a["Name"] == a2_name)
-        if d_ab <= D_intf and a1["Channel"] == a2["Channel"]:
-            I.append((a1_name, a2_name))
+    # Capacity of the first AP with each name
+    capacity = np.array([aps[ap_index[name]]["Capacity"] for name in geometry.located_aps], dtype=float)
 
     # M values
-    M = {}
-    for (a1_name, a2_name) in I:
-        a1 = next(a for a in aps if a["Name"] == a1_name)
-        a2 = next(a for a in aps if a["Name"] == a2_name)
-        k_a, k_b = a1["Capacity"], a2["Capacity"]
-        d_ab = ap_distances[(a1_name, a2_name)]
-        M_ab = math.floor(k_a + k_b - min(k_a,k_b) * max(0, 1 - d_ab/D_intf))
-        M[(a1_name, a2_name)] = M_ab
+    k_a, k_b = capacity[i1], capacity[i2]
+    M_ab = np.floor(k_a + k_b - np.minimum(k_a, k_b) * np.maximum(0, 1 - d_ab / D_intf))
+    M = dict(zip(I, M_ab.astype(int).tolist()))
 
     # User weights (priority)
     w = {}
@@ -85,6 +240,7 @@ def compute_intermediates(users, aps, settings):
         "E": E,
         "c": c,
         "I": I,
+        "ap_distances": ap_distances,
         "M": M,
         "w": w
     }
@@ -3,6 +3,7 @@ from PyQt5.QtWidgets import (
     QLabel, QGroupBox, QHeaderView
 )
 from PyQt5.QtCore import Qt
+from collections.abc import Mapping
 
 class CalculationsWindow(QWidget):
     def __init__(self, intermediates):
@@ -49,7 +50,9 @@ class CalculationsWindow(QWidget):
         # === Subtables in pairs ===
         row1 = QHBoxLayout()
         row1.addWidget(self.make_table("Feasible Edges ", intermediates["E"], ["User", "AP"]))
-        row1.addWidget(self.make_table("Distances", intermediates["distances"], ["(User, AP)", "Distance"]))
+        distances = intermediates["distances"]
+        row1.addWidget(self.make_table(f"Distances (within {getattr(distances, 'radius', '-')})", distances,
+                                       ["(User, AP)", "Distance"]))
         layout.addLayout(row1)
 
         row2 = QHBoxLayout()
@@ -95,7 +98,7 @@ class CalculationsWindow(QWidget):
         table.verticalHeader().setVisible(False)
         table.setStyleSheet(self.table_style())
 
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             table.setRowCount(len(data))
             for row, (key, value) in enumerate(data.items()):
                 table.setItem(row, 0, QTableWidgetItem(str(key)))
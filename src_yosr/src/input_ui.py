@@ -1,15 +1,18 @@
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QTableWidget, QTableWidgetItem, QPushButton,
-    QComboBox, QCheckBox, QLineEdit, QSpinBox,
+    QComboBox, QCheckBox, QLineEdit, QSpinBox, QDoubleSpinBox,
     QSizePolicy, QSpacerItem, QHeaderView, QMessageBox
 )
 from PyQt5.QtGui import QFont, QPixmap, QIntValidator
 from PyQt5.QtCore import Qt
 from calculations import compute_intermediates
 from output_ui import OutputWindow
+from solver import SolverOptions, format_stats
 from solver_thread import SolverThread  # QThread wrapper for the solver
 
+PRESOLVE_LEVELS = ["Auto", "Off", "Conservative", "Aggressive"]  # Gurobi Presolve -1..2
+
 
 class NetworkGUI(QMainWindow):
     def __init__(self):
@@ -165,6 +168,48 @@ class NetworkGUI(QMainWindow):
 
         layout.addLayout(settings_layout)
 
+        # --- SOLVER OPTIONS SECTION ---
+        solver_layout = QHBoxLayout()
+        solver_layout.setSpacing(16)
+
+        self.threads_spin = QSpinBox()
+        self.threads_spin.setRange(0, 256)
+        self.threads_spin.setValue(SolverOptions.threads)
+        self.threads_spin.setSpecialValueText("All cores")
+
+        self.time_limit_spin = QSpinBox()
+        self.time_limit_spin.setRange(0, 7 * 24 * 3600)
+        self.time_limit_spin.setSuffix(" s")
+        self.time_limit_spin.setSpecialValueText("No limit")
+
+        self.gap_spin = QDoubleSpinBox()
+        self.gap_spin.setRange(0, 100)
+        self.gap_spin.setDecimals(2)
+        self.gap_spin.setSuffix(" %")
+        self.gap_spin.setSpecialValueText("Default")
+
+        self.presolve_combo = QComboBox()
+        self.presolve_combo.addItems(PRESOLVE_LEVELS)
+        self.presolve_combo.setStyleSheet(self.dropdown_style())
+
+        self.seed_spin = QSpinBox()
+        self.seed_spin.setRange(0, 2_000_000_000)
+
+        self.concurrent_checkbox = QCheckBox("Concurrent MIP")
+
+        solver_layout.addSpacerItem(QSpacerItem(20, 10, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        for text, widget in (("Threads:", self.threads_spin), ("Time limit:", self.time_limit_spin),
+                             ("MIP gap:", self.gap_spin), ("Presolve:", self.presolve_combo),
+                             ("Seed:", self.seed_spin)):
+            label = QLabel(text)
+            label.setStyleSheet("QLabel { color: #283593; font-weight: 600; }")
+            solver_layout.addWidget(label)
+            solver_layout.addWidget(widget)
+        solver_layout.addWidget(self.concurrent_checkbox)
+        solver_layout.addSpacerItem(QSpacerItem(20, 10, QSizePolicy.Expanding, QSizePolicy.Minimum))
+
+        layout.addLayout(solver_layout)
+
         # --- Connections ---
         self.add_user_btn.clicked.connect(self.add_user_row)
         self.remove_user_btn.clicked.connect(self.remove_user_row)
@@ -274,6 +319,16 @@ class NetworkGUI(QMainWindow):
             "IncludePowerConsumption": self.power_checkbox.isChecked()
         }
 
+    def get_solver_options(self):
+        return SolverOptions(
+            threads=self.threads_spin.value(),
+            time_limit=self.time_limit_spin.value() or None,
+            mip_gap=self.gap_spin.value() / 100 or None,
+            presolve=self.presolve_combo.currentIndex() - 1,
+            seed=self.seed_spin.value(),
+            concurrent_mip=self.concurrent_checkbox.isChecked()
+        )
+
     # --- Solver integration ---
     def run_solver(self):
         users = self.save_user_table()
@@ -281,14 +336,14 @@ class NetworkGUI(QMainWindow):
         settings = self.get_global_settings()
         self.calculate_btn.setEnabled(False)
 
-        self.solver_thread = SolverThread(users, aps, settings)
+        self.solver_thread = SolverThread(users, aps, settings, self.get_solver_options())
         self.solver_thread.result_ready.connect(
-            lambda assignments, status, intermediates: self.on_solver_finished(assignments, status, intermediates, users, aps, settings)
+            lambda assignments, status, intermediates, stats: self.on_solver_finished(assignments, status, intermediates, users, aps, settings, stats)
         )
         self.solver_thread.error.connect(self.on_solver_error)
         self.solver_thread.start()
 
-    def on_solver_finished(self, assignments, status, intermediates, users, aps, settings):
+    def on_solver_finished(self, assignments, status, intermediates, users, aps, settings, stats=None):
         self.calculate_btn.setEnabled(True)
         total_connected = sum(len(u_list) for u_list in assignments.values())
         total_users = len(users)
@@ -305,7 +360,10 @@ class NetworkGUI(QMainWindow):
                 f"Total users connected: {total_connected}/{total_users}",
                 "Average priority cannot be computed (no users connected)."
             ]
-        self.output_window = OutputWindow(users, aps, settings, assignments, messages=messages)
+        if stats and format_stats(stats):
+            messages.append(format_stats(stats))
+        self.output_window = OutputWindow(users, aps, settings, assignments, messages=messages,
+                                          intermediates=intermediates)
         self.output_window.show()
 
     def on_solver_error(self, error_msg):
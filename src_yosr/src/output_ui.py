@@ -6,7 +6,7 @@ from topology import TopologyWindow
 
 
 class OutputWindow(QWidget):
-    def __init__(self, users, aps, settings, assignments=None, messages=None):
+    def __init__(self, users, aps, settings, assignments=None, messages=None, intermediates=None):
         super().__init__()
         self.setWindowTitle("Optimization Result")
         self.setFixedSize(700, 500)
@@ -14,6 +14,7 @@ class OutputWindow(QWidget):
         self.users = users
         self.aps = aps
         self.settings = settings
+        self.intermediates = intermediates  # From the solve, computed on demand otherwise
 
         # === Ensure assignments is a dict with all APs as keys ===
         if assignments is None:
@@ -119,10 +120,14 @@ class OutputWindow(QWidget):
             QPushButton:hover { background-color: #6a1b9a; }
         """
 
+    def get_intermediates(self):
+        if self.intermediates is None:
+            self.intermediates = compute_intermediates(self.users, self.aps, self.settings)
+        return self.intermediates
+
     def show_intermediates(self):
         try:
-            intermediates = compute_intermediates(self.users, self.aps, self.settings)
-            self.calculations_window = CalculationsWindow(intermediates)
+            self.calculations_window = CalculationsWindow(self.get_intermediates())
             self.calculations_window.show()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Intermediate calculation failed:\n{e}")
@@ -132,8 +137,7 @@ class OutputWindow(QWidget):
             if not isinstance(self.assignments, dict):
                 raise ValueError("Assignments not available or invalid.")
 
-            intermediates = compute_intermediates(self.users, self.aps, self.settings)
-            self.topology_window = TopologyWindow(self.users, self.aps, self.assignments, intermediates)
+            self.topology_window = TopologyWindow(self.users, self.aps, self.assignments, self.get_intermediates())
             self.topology_window.show()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Topology failed:\n{e}")
@@ -1,14 +1,263 @@
 # solver.py
-from gurobipy import Model, GRB, quicksum
+import heapq
+import time
+from dataclasses import dataclass, fields
+from typing import Optional
 
-def solve_network(intermediates, aps_data, lambda_energy=1):
+import numpy as np
+import scipy.sparse as sp
+
+
+@dataclass
+class SolverOptions:
+    """
+    Gurobi parameters of a solve.
+
+    threads: 0 lets Gurobi use all cores; time_limit (seconds) and mip_gap
+    (relative) are unset by default; presolve: -1 automatic, 0 off,
+    1 conservative, 2 aggressive; concurrent_mip runs independent MIP
+    solves in parallel and keeps the first to finish. network_flow solves
+    instances without binding interference constraints without Gurobi
+    (see _solve_as_flow).
+    """
+    threads: int = 1
+    time_limit: Optional[float] = None
+    mip_gap: Optional[float] = None
+    presolve: int = -1
+    seed: int = 0
+    concurrent_mip: bool = False
+    network_flow: bool = True
+
+    @classmethod
+    def from_dict(cls, data):
+        """Options from a dict (e.g. a scenario's "SolverOptions"), ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+    def apply(self, model):
+        model.setParam('Threads', self.threads)
+        model.setParam('Presolve', self.presolve)
+        model.setParam('Seed', self.seed)
+        if self.time_limit is not None:
+            model.setParam('TimeLimit', self.time_limit)
+        if self.mip_gap is not None:
+            model.setParam('MIPGap', self.mip_gap)
+        if self.concurrent_mip:
+            model.setParam('ConcurrentMIP', 2)
+
+
+def _attribute(model, name):
+    """Model attribute, or None when Gurobi has no value for it (e.g. no solution)."""
+    from gurobipy import GurobiError
+
+    try:
+        return getattr(model, name)
+    except (GurobiError, AttributeError):
+        return None
+
+
+def format_stats(stats):
+    """One line summary of the solve statistics returned by solve_network."""
+    parts = []
+    if stats.get("runtime") is not None:
+        parts.append(f"Solve time: {stats['runtime']:.2f} s")
+    if stats.get("nodes") is not None:
+        parts.append(f"Nodes: {int(stats['nodes'])}")
+    if stats.get("bound") is not None:
+        parts.append(f"Best bound: {stats['bound']:.2f}")
+    if stats.get("gap") is not None:
+        parts.append(f"Gap: {100 * stats['gap']:.2f}%")
+    return " • ".join(parts)
+
+
+def _edge_arrays(E, aps):
+    """
+    Index arrays of the edges: user codes (order of first appearance in E)
+    and AP codes (order of `aps`); edges to unknown APs get code -1.
+    """
+    user_codes, ap_codes = {}, {a: k for k, a in enumerate(aps)}
+    users = [user_codes.setdefault(u, len(user_codes)) for u, _ in E]
+    edge_aps = [ap_codes.get(a, -1) for _, a in E]
+    return np.array(users, dtype=np.intp), np.array(edge_aps, dtype=np.intp), len(user_codes), ap_codes
+
+
+def _incidence(rows, num_rows, num_cols):
+    """Sparse 0/1 matrix with a one at (rows[e], e) for each edge e with rows[e] >= 0."""
+    cols = np.flatnonzero(rows >= 0)
+    return sp.csr_matrix((np.ones(len(cols)), (rows[cols], cols)), shape=(num_rows, num_cols))
+
+
+def _interference_redundant(I, M, aps):
+    """True when no interference row can bind: M_ab >= capacity of a + capacity of b."""
+    return all(M[(a1, a2)] >= aps.get(a1, 0) + aps.get(a2, 0) for a1, a2 in I)
+
+
+def _solve_as_flow(edge_user, edge_ap, num_users, objective, capacity):
+    """
+    Without interference, the model is a bipartite b-matching (users of
+    capacity 1, APs of their Capacity), i.e. a min-cost flow, solved here
+    exactly by successive shortest paths with potentials.
+
+    Users are added one at a time, by decreasing best objective. A user
+    whose best AP (objective plus AP potential) has room takes it; otherwise
+    a Dijkstra search on reduced costs finds the cheapest way to make room:
+    a chain of members moving to other APs, ending at an AP with room or at
+    a member left unassigned (or the user itself stays unassigned). The
+    members of an AP are collapsed into one transfer arc per other AP (the
+    smallest objective loss of moving one of them), kept in heaps pruned
+    lazily, so the search only visits APs. Edges with a non-positive
+    objective are never needed and are left out.
+
+    With 100k users and 2k APs this takes about 1 s at 250k edges and 5-8 s
+    at 550k edges. With 10 APs in range of every user (1M edges) it takes
+    3 s when capacity is ample, but 40-55 s when nearly every AP is full:
+    each added user then searches far for room.
+
+    Returns:
+        selected: boolean array over the edges, or None when a capacity is
+        negative (the caller falls back to Gurobi, which reports it)
+    """
+    selected = np.zeros(len(objective), dtype=bool)
+    if np.any(capacity < 0):
+        return None
+    useful = np.flatnonzero((objective > 0) & (edge_ap >= 0))
+    if len(useful) == 0:
+        return selected
+
+    # CSR incidence of the users over the useful edges, as lists for the loops below
+    order = useful[np.argsort(edge_user[useful], kind="stable")]
+    start = np.searchsorted(edge_user[order], np.arange(num_users + 1)).tolist()
+    edges = order.tolist()
+    user_of, ap_of, profit = edge_user.tolist(), edge_ap.tolist(), objective.tolist()
+    room = np.floor(capacity + 1e-9).astype(int).tolist()
+
+    push, pop = heapq.heappush, heapq.heappop
+    y = [0.0] * len(room)                 # AP potentials: minus the AP price
+    match = [-1] * num_users              # edge of each assigned user
+    # Per AP: members as (objective, edge, user) and, by other AP, moves as
+    # (objective loss, edge to the other AP, edge, user); entries of members
+    # that have moved since are dropped when they reach the top. tops caches
+    # exits(a) until a user joins a (an AP losing a member on a path also
+    # gains one).
+    leave = [[] for _ in room]
+    moves = [{} for _ in room]
+    tops = [None] * len(room)
+
+    def join(v, e):
+        a, gain = ap_of[e], profit[e]
+        match[v] = e
+        tops[a] = None
+        push(leave[a], (gain, e, v))
+        row = moves[a]
+        for k in range(start[v], start[v + 1]):
+            f = edges[k]
+            b = ap_of[f]
+            if b != a:
+                heap = row.get(b)
+                if heap is None:
+                    row[b] = [(gain - profit[f], f, e, v)]
+                else:
+                    push(heap, (gain - profit[f], f, e, v))
+
+    def exits(a):
+        """Cheapest way out of AP a: (leave cost, leaving user, [(other AP, move cost, edge)])."""
+        members = leave[a]
+        while members and match[members[0][2]] != members[0][1]:
+            pop(members)
+        arcs = []
+        for b, heap_b in moves[a].items():
+            while heap_b and match[heap_b[0][3]] != heap_b[0][2]:
+                pop(heap_b)
+            if heap_b:
+                arcs.append((b, heap_b[0][0], heap_b[0][1]))
+        if members:
+            return members[0][0], members[0][2], arcs
+        return float("inf"), -1, arcs
+
+    best_profit = np.full(num_users, -np.inf)
+    np.maximum.at(best_profit, edge_user[useful], objective[useful])
+    for u in np.argsort(-best_profit, kind="stable").tolist():
+        value, best = 0.0, -1
+        for k in range(start[u], start[u + 1]):
+            e = edges[k]
+            if profit[e] + y[ap_of[e]] > value:
+                value, best = profit[e] + y[ap_of[e]], e
+        if best < 0:
+            continue
+        if room[ap_of[best]] > 0:
+            room[ap_of[best]] -= 1
+            join(u, best)
+            continue
+
+        # Dijkstra over the APs; staying unassigned costs `value`
+        dist, pred, heap, settled = {}, {}, [], []
+        for k in range(start[u], start[u + 1]):
+            e = edges[k]
+            a = ap_of[e]
+            d = value - profit[e] - y[a]
+            if d < dist.get(a, value):
+                dist[a], pred[a] = d, e
+                push(heap, (d, a))
+        bound, end, leaver = value, -1, -1
+        while heap:
+            d, a = pop(heap)
+            if d >= bound:
+                break
+            if d > dist[a]:
+                continue
+            settled.append(a)
+            if room[a] > 0:
+                bound, end, leaver = d, a, -1
+                break
+            if tops[a] is None:
+                tops[a] = exits(a)
+            out, leaving, arcs = tops[a]
+            base = d + y[a]
+            if base + out < bound:
+                bound, end, leaver = base + out, a, leaving
+            for b, cost, f in arcs:
+                d_b = base - y[b] + cost
+                if d_b < dist.get(b, bound):
+                    dist[b], pred[b] = d_b, f
+                    push(heap, (d_b, b))
+
+        # Keep the reduced costs non-negative, then move the users along the path
+        for a in settled:
+            y[a] -= bound - dist[a]
+        if end < 0:
+            continue
+        if leaver >= 0:
+            match[leaver] = -1
+        else:
+            room[end] -= 1
+        while True:
+            e = pred[end]
+            v, previous = user_of[e], match[user_of[e]]
+            join(v, e)
+            if v == u:
+                break
+            end = ap_of[previous]
+
+    selected[[e for e in match if e >= 0]] = True
+    return selected
+
+
+def solve_network(intermediates, aps_data, lambda_energy=1, names=False, options=None):
     """
     Solve the AP-user assignment using Gurobi with a combined weighted objective:
     user priorities and optional energy minimization (lambda_energy = 0 or 1).
 
+    The model is built with the matrix API: one binary vector x over the
+    edges E and sparse exclusivity, capacity and interference matrices.
+    Variable and constraint names (x_<user>_<AP>) are only set with
+    names=True, e.g. to write the model to a file. `options` is a
+    SolverOptions (defaults: one thread, no limits).
+
     Returns:
         assignments: dict with AP names as keys and lists of assigned user names
         status: string describing solver result ("Optimal", "Infeasible", etc.)
+        stats: dict with the solve "runtime" (s), explored "nodes", best
+            "bound" and relative "gap" (None when not available)
     """
 
     # Unpack intermediates
@@ -18,38 +267,59 @@ def solve_network(intermediates, aps_data, lambda_energy=1):
     I = intermediates["I"]
     M = intermediates["M"]
 
-    # Create model
+    options = options or SolverOptions()
+    aps = {a["Name"]: a["Capacity"] for a in aps_data}
+    edge_user, edge_ap, num_users, ap_codes = _edge_arrays(E, aps)
+    n = len(E)
+
+    # Objective: combined weight + energy
+    objective = np.array([w[u] - lambda_energy * c[(u, a)] for (u, a) in E], dtype=float).reshape(n)
+    capacity = np.array(list(aps.values()), dtype=float).reshape(len(aps))
+
+    # Fast path: no binding interference row, solved as a flow without Gurobi
+    if options.network_flow and _interference_redundant(I, M, aps):
+        start = time.perf_counter()
+        selected = _solve_as_flow(edge_user, edge_ap, num_users, objective, capacity)
+        if selected is not None:
+            assignments = {a: [] for a in aps}
+            for e in np.flatnonzero(selected).tolist():
+                u, a = E[e]
+                assignments[a].append(u)
+            value = float(objective[selected].sum())
+            stats = {"runtime": time.perf_counter() - start, "nodes": 0, "bound": value, "gap": 0.0}
+            return assignments, "Optimal", stats
+
+    # Create model (gurobipy is only needed from here: the fast path runs without it)
+    from gurobipy import Model, GRB
+
     m = Model("AP_Assignment")
     m.setParam('OutputFlag', 0)
-    m.setParam('Threads', 1)
+    options.apply(m)
 
-    # Variables
-    x = {(u, a): m.addVar(vtype=GRB.BINARY, name=f"x_{u}_{a}") for (u, a) in E}
-    m.update()
+    # Variables, with the objective
+    x = m.addMVar(n, vtype=GRB.BINARY, obj=objective,
+                  name=np.array([f"x_{u}_{a}" for (u, a) in E], dtype=object) if names else "")
+    m.ModelSense = GRB.MAXIMIZE
 
-    # Constraints
-    # 1. Exclusivity: each user ≤ 1 AP
-    for u in set(u for u,_ in E):
-        m.addConstr(quicksum(x[(u,a)] for (uu,a) in E if uu == u) <= 1)
+    # Constraints (only with at least one edge: an empty model is optimal)
+    if n:
+        # 1. Exclusivity: each user ≤ 1 AP
+        A_users = _incidence(edge_user, num_users, n)
+        m.addMConstr(A_users, x, GRB.LESS_EQUAL, np.ones(num_users), name="exclusivity" if names else "")
 
-    # 2. AP capacity
-    aps = {a["Name"]: a["Capacity"] for a in aps_data}
-    for a in aps:
-        m.addConstr(quicksum(x[(u,a)] for (u,aa) in E if aa == a) <= aps[a])
+        # 2. AP capacity
+        A_aps = _incidence(edge_ap, len(aps), n)
+        m.addMConstr(A_aps, x, GRB.LESS_EQUAL, capacity, name="capacity" if names else "")
 
-    # 3. Interference
-    for a1, a2 in I:
-        m.addConstr(
-            quicksum(x[(u,a1)] for (u,aa) in E if aa==a1) +
-            quicksum(x[(u,a2)] for (u,aa) in E if aa==a2)
-            <= M[(a1,a2)]
-        )
-
-    # Objective: combined weight + energy
-    m.setObjective(
-        quicksum((w[u] - lambda_energy * c[(u,a)]) * x[(u,a)] for (u,a) in E),
-        GRB.MAXIMIZE
-    )
+        # 3. Interference: row of a pair = capacity rows of its two APs
+        if I:
+            pair_aps = np.array([(ap_codes.get(a1, -1), ap_codes.get(a2, -1)) for a1, a2 in I], dtype=np.intp)
+            pair_rows = np.repeat(np.arange(len(I)), 2)
+            known = pair_aps.ravel() >= 0
+            P = sp.csr_matrix((np.ones(known.sum()), (pair_rows[known], pair_aps.ravel()[known])),
+                              shape=(len(I), len(aps)))
+            bounds = np.array([M[pair] for pair in I], dtype=float)
+            m.addMConstr(P @ A_aps, x, GRB.LESS_EQUAL, bounds, name="interference" if names else "")
 
     # === Solve
     m.optimize()
@@ -57,19 +327,32 @@ def solve_network(intermediates, aps_data, lambda_energy=1):
     # Initialize assignments dictionary (same format for all cases)
     assignments = {a: [] for a in aps}
 
-    # Extract solution if feasible
+    # Extract solution if feasible (also the incumbent of a stopped solve)
+    if m.status == GRB.OPTIMAL or (m.status != GRB.INFEASIBLE and m.SolCount > 0):
+        selected = np.flatnonzero(x.X > 0.5).tolist() if n else []
+        for e in selected:
+            u, a = E[e]
+            assignments[a].append(u)
+
     if m.status == GRB.OPTIMAL:
-        for (u,a) in E:
-            if x[(u,a)].X > 0.5:
-                assignments[a].append(u)
         status = "Optimal"
 
     elif m.status == GRB.INFEASIBLE:
         # Keep empty lists for all APs
         status = "Infeasible"
 
+    elif m.status == GRB.TIME_LIMIT:
+        status = "Time limit reached" + (" (best solution found)" if m.SolCount > 0 else "")
+
     else:
-        # Keep empty lists but report solver status
+        # Report solver status
         status = f"Solver status: {m.status}"
 
-    return assignments, status
+    stats = {
+        "runtime": _attribute(m, "Runtime"),
+        "nodes": _attribute(m, "NodeCount"),
+        "bound": _attribute(m, "ObjBound"),
+        "gap": _attribute(m, "MIPGap")
+    }
+
+    return assignments, status, stats
@@ -3,19 +3,20 @@ from solver import solve_network
 from calculations import compute_intermediates
 
 class SolverThread(QThread):
-    result_ready = pyqtSignal(object, object, object)  # assignments, status, intermediates
+    result_ready = pyqtSignal(object, object, object, object)  # assignments, status, intermediates, stats
     error = pyqtSignal(str)
 
-    def __init__(self, users, aps, settings):
+    def __init__(self, users, aps, settings, options=None):
         super().__init__()
         self.users = users
         self.aps = aps
         self.settings = settings
+        self.options = options  # SolverOptions, defaults when None
 
     def run(self):
         try:
             intermediates = compute_intermediates(self.users, self.aps, self.settings)
-            assignments, status = solve_network(intermediates, self.aps)
+            assignments, status, stats = solve_network(intermediates, self.aps, options=self.options)
 
             # Ensure assignments is always a dict
             if assignments is None or not isinstance(assignments, dict):
@@ -25,6 +26,6 @@ class SolverThread(QThread):
                     if a["Name"] not in assignments or not isinstance(assignments[a["Name"]], list):
                         assignments[a["Name"]] = []
 
-            self.result_ready.emit(assignments, status, intermediates)
+            self.result_ready.emit(assignments, status, intermediates, stats)
         except Exception as e:
             self.error.emit(str(e))
@@ -0,0 +1,93 @@
+import numpy as np
+
+# Cells are slightly larger than the radius so that rounding in the cell
+# computation can never push a pair within the radius two cells apart
+CELL_MARGIN = 1 + 1e-9
+
+
+def pairs_within(xy1, xy2, radius):
+    """
+    All pairs (i, j) with distance(xy1[i], xy2[j]) <= radius, found with a
+    uniform grid hash of cell size `radius`: each point of xy1 is only
+    compared with the points of xy2 in the 3x3 neighbouring cells.
+
+    Returns:
+        i, j, d: index arrays and distances, sorted by i then j
+    """
+    xy1 = np.asarray(xy1, dtype=float).reshape(-1, 2)
+    xy2 = np.asarray(xy2, dtype=float).reshape(-1, 2)
+    if len(xy1) == 0 or len(xy2) == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0)
+
+    cell = radius * CELL_MARGIN
+    origin = np.minimum(xy1.min(axis=0), xy2.min(axis=0))
+    c1 = np.floor((xy1 - origin) / cell).astype(np.int64)
+    c2 = np.floor((xy2 - origin) / cell).astype(np.int64)
+
+    # Cell keys; the margin of the row width keeps the neighbours of
+    # boundary cells (row -1 or max + 1) distinct from real cells
+    width = int(max(c1[:, 1].max(), c2[:, 1].max())) + 3
+    keys2 = c2[:, 0] * width + c2[:, 1]
+    order = np.argsort(keys2, kind="stable")
+    sorted_keys = keys2[order]
+
+    found_i, found_j, found_d = [], [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            query = (c1[:, 0] + dx) * width + (c1[:, 1] + dy)
+            lo = np.searchsorted(sorted_keys, query, side="left")
+            counts = np.searchsorted(sorted_keys, query, side="right") - lo
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            i = np.repeat(np.arange(len(xy1)), counts)
+            first = np.repeat(lo - np.cumsum(counts) + counts, counts)
+            j = order[first + np.arange(total)]
+            diff = xy1[i] - xy2[j]
+            d = np.sqrt(diff[:, 0] * diff[:, 0] + diff[:, 1] * diff[:, 1])
+            keep = d <= radius
+            found_i.append(i[keep])
+            found_j.append(j[keep])
+            found_d.append(d[keep])
+
+    if not found_i:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0)
+    i, j, d = np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_d)
+    order = np.lexsort((j, i))
+    return i[order], j[order], d[order]
+
+
+def close_pairs(xy, radius, groups=None):
+    """
+    Pairs (i, j) with i < j of a single point set within `radius`.
+
+    With `groups` (one integer label per point), only pairs of points with
+    the same label are searched, one bucket at a time: pairs across
+    buckets are never considered.
+
+    Returns:
+        i, j, d: index arrays and distances, sorted by i then j
+    """
+    xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+    if groups is None:
+        i, j, d = pairs_within(xy, xy, radius)
+        upper = i < j
+        return i[upper], j[upper], d[upper]
+
+    groups = np.asarray(groups)
+    order = np.argsort(groups, kind="stable")
+    bounds = np.flatnonzero(np.diff(groups[order])) + 1
+    found_i, found_j, found_d = [], [], []
+    for members in np.split(order, bounds):
+        if len(members) < 2:
+            continue
+        i, j, d = close_pairs(xy[members], radius)
+        found_i.append(members[i])
+        found_j.append(members[j])
+        found_d.append(d)
+
+    if not found_i:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0)
+    i, j, d = np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_d)
+    order = np.lexsort((j, i))
+    return i[order], j[order], d[order]
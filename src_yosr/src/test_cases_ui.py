@@ -7,6 +7,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from calculations import compute_intermediates
 from output_ui import OutputWindow
+from solver import SolverOptions, format_stats
 from solver_thread import SolverThread  # threaded solver wrapper
 
 
@@ -103,15 +104,17 @@ class TestCasesWindow(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to load scenario:\n{e}")
             return
 
-        self.solver_thread = SolverThread(users, aps, settings)
+        # Optional "SolverOptions" object in the scenario settings
+        options = SolverOptions.from_dict(settings.get("SolverOptions"))
+        self.solver_thread = SolverThread(users, aps, settings, options)
         self.solver_thread.result_ready.connect(
-            lambda assignments, status, intermediates:
-            self.on_solver_finished(users, aps, settings, assignments, status, intermediates)
+            lambda assignments, status, intermediates, stats:
+            self.on_solver_finished(users, aps, settings, assignments, status, intermediates, stats)
         )
         self.solver_thread.error.connect(lambda msg: QMessageBox.critical(self, "Solver Error", msg))
         self.solver_thread.start()
 
-    def on_solver_finished(self, users, aps, settings, assignments, status, intermediates):
+    def on_solver_finished(self, users, aps, settings, assignments, status, intermediates, stats=None):
         total_connected = sum(len(u_list) for u_list in assignments.values())
         total_users = len(users)
 
@@ -130,8 +133,11 @@ class TestCasesWindow(QWidget):
                 f"Total users connected: {total_connected}/{total_users}",
                 "Average priority cannot be computed (no users connected)."
             ]
+        if stats and format_stats(stats):
+            messages.append(format_stats(stats))
 
-        self.output_window = OutputWindow(users, aps, settings, assignments, messages=messages)
+        self.output_window = OutputWindow(users, aps, settings, assignments, messages=messages,
+                                          intermediates=intermediates)
         self.output_window.show()
 
     def load_scenario(self, file_path):
@@ -0,0 +1,51 @@
+import json
+import os
+
+import pytest
+
+from calculations import compute_intermediates
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TEST_CASES = os.path.join(os.path.dirname(HERE), "test_cases")
+
+# Output of the original compute_intermediates (pure Python, all pairs) on
+# each test case, and on a layout with duplicate names and missing
+# coordinates under every band, environment and power setting
+with open(os.path.join(HERE, "expected_intermediates.json")) as f:
+    EXPECTED = json.load(f)
+
+
+def check(result, expected):
+    assert result["D_max"] == expected["D_max"]
+    assert result["D_intf"] == pytest.approx(expected["D_intf"])
+    assert result["E"] == [tuple(e) for e in expected["E"]]
+    assert result["c"] == pytest.approx({(u, a): v for u, a, v in expected["c"]}, abs=1e-12)
+    assert result["I"] == [tuple(p) for p in expected["I"]]
+    assert result["M"] == {(a, b): v for a, b, v in expected["M"]}
+    assert result["w"] == expected["w"]
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED["test_cases"]))
+def test_test_cases_match_original(name):
+    with open(os.path.join(TEST_CASES, name)) as f:
+        case = json.load(f)
+    check(compute_intermediates(case["users"], case["aps"], case["settings"]),
+          EXPECTED["test_cases"][name])
+
+
+def test_duplicate_names_and_missing_coordinates_match_original():
+    # Same layout under each setting: also covers reuse of the cached geometry
+    case = EXPECTED["edge_case"]
+    for expected in case["expected"]:
+        check(compute_intermediates(case["users"], case["aps"], expected["settings"]), expected)
+
+
+def test_distances_cover_display_radius():
+    case = EXPECTED["edge_case"]
+    settings = case["expected"][0]["settings"]
+    result = compute_intermediates(case["users"], case["aps"], settings, display_radius=100)
+    # Every pair of located users and APs is within 100
+    assert len(result["distances"]) == 5 * 4
+    assert result["distances"][("U3", "AP2")] == pytest.approx(29 ** 0.5)
+    assert ("U2", "AP1") not in result["distances"]
+    assert ("U3", "AP3") not in result["distances"]
@@ -0,0 +1,112 @@
+import glob
+import importlib.util
+import json
+import os
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.optimize import linprog
+
+from calculations import compute_intermediates
+from solver import SolverOptions, _edge_arrays, solve_network
+
+requires_gurobi = pytest.mark.skipif(importlib.util.find_spec("gurobipy") is None,
+                                     reason="gurobipy is not installed")
+
+TEST_CASES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_cases")
+CASE_FILES = sorted(glob.glob(os.path.join(TEST_CASES, "*.json")))
+DEVICES = ["IoT Sensor", "Wearable", "Smartphone", "Tablet", "Laptop"]
+PRIORITIES = ["High", "Medium", "Low"]
+OUTDOOR = {"WifiBand": "2.4 GHz", "EnvironmentType": "Outdoor", "IncludePowerConsumption": True}
+
+
+def objective(assignments, intermediates, lambda_energy):
+    w, c = intermediates["w"], intermediates["c"]
+    return sum(w[u] - lambda_energy * c[(u, a)] for a, us in assignments.items() for u in us)
+
+
+def check_feasible(assignments, intermediates, aps):
+    E = set(intermediates["E"])
+    capacity = {a["Name"]: a["Capacity"] for a in aps}
+    users = [u for us in assignments.values() for u in us]
+    assert len(users) == len(set(users))
+    for a, us in assignments.items():
+        assert len(us) <= capacity[a]
+        assert all((u, a) in E for u in us)
+
+
+def random_instance(seed, num_users, num_aps, side, capacity):
+    """Users and APs spread over a side x side square, one channel per AP (no interference pair)."""
+    rng = np.random.default_rng(seed)
+    users = [{"Name": f"U{i}", "Priority": PRIORITIES[rng.integers(3)],
+              "Device": DEVICES[rng.integers(len(DEVICES))],
+              "X": float(rng.uniform(0, side)), "Y": float(rng.uniform(0, side))}
+             for i in range(num_users)]
+    aps = [{"Name": f"AP{j}", "Capacity": int(rng.integers(*capacity)), "Channel": j,
+            "X": float(rng.uniform(0, side)), "Y": float(rng.uniform(0, side))}
+           for j in range(num_aps)]
+    return users, aps
+
+
+def lp_optimum(intermediates, aps, lambda_energy):
+    """Optimum of the LP relaxation (integral without interference) from HiGHS."""
+    E, w, c = intermediates["E"], intermediates["w"], intermediates["c"]
+    edge_user, edge_ap, num_users, _ = _edge_arrays(E, {a["Name"]: a["Capacity"] for a in aps})
+    columns = np.arange(len(E))
+    A = sp.vstack([sp.csr_matrix((np.ones(len(E)), (edge_user, columns)), shape=(num_users, len(E))),
+                   sp.csr_matrix((np.ones(len(E)), (edge_ap, columns)), shape=(len(aps), len(E)))])
+    b = np.concatenate([np.ones(num_users), [a["Capacity"] for a in aps]])
+    gains = np.array([w[u] - lambda_energy * c[(u, a)] for u, a in E])
+    result = linprog(-gains, A_ub=A, b_ub=b, bounds=(0, 1), method="highs")
+    assert result.status == 0
+    return -result.fun
+
+
+def compare(users, aps, settings, lambda_energy=1):
+    """Solve with and without the flow fast path and check both give the same optimum."""
+    intermediates = compute_intermediates(users, aps, settings)
+    flow, flow_status, _ = solve_network(intermediates, aps, lambda_energy,
+                                         options=SolverOptions(network_flow=True))
+    mip, mip_status, _ = solve_network(intermediates, aps, lambda_energy,
+                                       options=SolverOptions(network_flow=False))
+    assert flow_status == mip_status
+    check_feasible(flow, intermediates, aps)
+    assert objective(flow, intermediates, lambda_energy) == pytest.approx(
+        objective(mip, intermediates, lambda_energy), abs=1e-6)
+
+
+@requires_gurobi
+@pytest.mark.parametrize("filename", CASE_FILES, ids=os.path.basename)
+def test_flow_matches_gurobi_on_test_cases(filename):
+    with open(filename) as f:
+        case = json.load(f)
+    compare(case["users"], case["aps"], case["settings"])
+
+
+@requires_gurobi
+@pytest.mark.parametrize("seed", range(20))
+def test_flow_matches_gurobi_on_random_instances(seed):
+    users, aps = random_instance(seed, 40, 6, 30, (1, 8))
+    settings = {"WifiBand": "2.4 GHz", "EnvironmentType": ["Indoor", "Urban", "Outdoor"][seed % 3],
+                "IncludePowerConsumption": bool(seed % 2)}
+    compare(users, aps, settings, lambda_energy=seed % 2)
+
+
+@requires_gurobi
+def test_flow_matches_gurobi_on_a_larger_instance():
+    # About 1200 edges (within a size-limited Gurobi license) and fewer AP slots than users
+    users, aps = random_instance(0, 300, 25, 50, (4, 12))
+    compare(users, aps, OUTDOOR)
+
+
+@pytest.mark.parametrize("lambda_energy", [0, 1])
+def test_flow_matches_lp_on_a_large_instance(lambda_energy):
+    # About 20k edges, 3.3k AP slots for 4.9k users in range: many users are moved or left out
+    users, aps = random_instance(1, 5000, 100, 100, (20, 50))
+    intermediates = compute_intermediates(users, aps, OUTDOOR)
+    assignments, status, stats = solve_network(intermediates, aps, lambda_energy)
+    assert status == "Optimal" and stats["nodes"] == 0
+    check_feasible(assignments, intermediates, aps)
+    assert objective(assignments, intermediates, lambda_energy) == pytest.approx(
+        lp_optimum(intermediates, aps, lambda_energy), abs=1e-6)